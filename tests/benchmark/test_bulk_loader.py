@@ -0,0 +1,73 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from unittest import TestCase
+
+from typedb.bulk import Loader, LoadMetrics
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+PEOPLE = 10_000
+WORKERS = [1, 2, 4, 8]
+BATCH_SIZES = [10, 100, 1000]
+
+
+class TestBulkLoader(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name; name sub attribute, value string;")
+                tx.commit()
+
+    def _load(self, workers: int, batch_size: int) -> LoadMetrics:
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(WRITE) as tx:
+                tx.query.delete("match $p isa person; delete $p isa person;")
+                tx.commit()
+            loader = Loader(session, workers, batch_size, template="insert $p isa person, has name {name};")
+            metrics = loader.load({"name": f"person {workers} {batch_size} {i}"} for i in range(PEOPLE))
+            with session.transaction(READ) as tx:
+                assert tx.query.match_aggregate("match $p isa person; get $p; count;").as_int() == \
+                       metrics.operations
+            return metrics
+
+    def test_throughput_by_workers_and_batch_size(self):
+        print("workers " + "".join(f"{batch_size:>10} batch" for batch_size in BATCH_SIZES))
+        for workers in WORKERS:
+            results = [self._load(workers, batch_size) for batch_size in BATCH_SIZES]
+            print(f"{workers:>7} " + "".join(f"{metrics.throughput:>12.1f} op/s" for metrics in results))
+            for metrics in results:
+                print(f"        {metrics}")
+                self.assertEqual(PEOPLE, metrics.operations + metrics.failed_operations)
+                self.assertEqual(0, metrics.failed_batches, metrics.errors)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
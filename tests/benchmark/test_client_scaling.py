@@ -0,0 +1,80 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+PEOPLE = 100
+QUERIES_PER_THREAD = 200
+CONNECTIONS = [1, 2, 4]
+THREADS = [1, 4, 16]
+
+
+class TestClientScaling(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                for _ in range(PEOPLE):
+                    tx.query.insert("insert $p isa person;")
+                tx.commit()
+
+    @staticmethod
+    def _run_queries(client: TypeDBClient) -> None:
+        with client.session(TYPEDB, DATA) as session:
+            for _ in range(QUERIES_PER_THREAD):
+                with session.transaction(READ) as tx:
+                    assert len(list(tx.query.match("match $p isa person;"))) == PEOPLE
+
+    def _throughput(self, connections: int, threads: int) -> float:
+        with TypeDB.pooled_core_client(TypeDB.DEFAULT_ADDRESS, connections) as client:
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                start = time.perf_counter()
+                for future in [executor.submit(self._run_queries, client) for _ in range(threads)]:
+                    future.result()
+                return threads * QUERIES_PER_THREAD / (time.perf_counter() - start)
+
+    def test_throughput_by_connections_and_threads(self):
+        print("connections " + "".join(f"{threads:>12} threads" for threads in THREADS))
+        for connections in CONNECTIONS:
+            results = [self._throughput(connections, threads) for threads in THREADS]
+            print(f"{connections:>11} " + "".join(f"{result:>14.1f} q/s" for result in results))
+            self.assertTrue(all(result > 0 for result in results))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,77 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import time
+import unittest
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+DISTINCT_CONCEPTS = 10_000
+CONCEPTS = 1_000_000
+
+
+class TestConceptIdentity(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                for _ in range(DISTINCT_CONCEPTS):
+                    tx.query.insert("insert $p isa person;")
+                tx.commit()
+
+    @staticmethod
+    def _timed(function) -> float:
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+    def test_set_and_dict_dedupe(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                people = [answer.get("p") for answer in tx.query.match("match $p isa person;")]
+                concepts = people * (CONCEPTS // len(people))
+                person_type = tx.concepts.get_entity_type("person")
+                types = [person_type] * CONCEPTS
+                # The first pass fetches the identity fields from the native layer, later passes hit the cache
+                cold_set = self._timed(lambda: set(concepts))
+                warm_set = self._timed(lambda: set(concepts))
+                warm_dict = self._timed(lambda: {concept: concept.get_iid() for concept in concepts})
+                warm_types = self._timed(lambda: set(types))
+        print(f"set of {len(concepts)} things: {cold_set:.2f}s cold, {warm_set:.2f}s warm; "
+              f"dict: {warm_dict:.2f}s; set of {len(types)} types: {warm_types:.2f}s")
+        self.assertLess(warm_set, cold_set)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,92 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from collections import Counter
+from unittest import TestCase
+
+import typedb.native_client_wrapper as native
+
+# The concept factory binds its native predicates at import time, so they are counted before the driver is imported
+FFI_CALLS = Counter()
+
+
+def _counted(name, function):
+    def counted_function(*args):
+        FFI_CALLS[name] += 1
+        return function(*args)
+    return counted_function
+
+
+for _name in dir(native):
+    if _name.startswith("concept_is_"):
+        setattr(native, _name, _counted(_name, getattr(native, _name)))
+
+from typedb.client import *  # noqa: E402
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+ANSWERS = 1000
+
+
+class TestConceptWrapping(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name; name sub attribute, value string;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                for i in range(ANSWERS):
+                    tx.query.insert(f"insert $p isa person, has name \"name-{i}\";")
+                tx.commit()
+
+    def _ffi_calls_per_concept(self, query: str, variable: str) -> float:
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                answers = list(tx.query.match(query))
+                FFI_CALLS.clear()
+                for answer in answers:
+                    answer.get(variable)
+                calls = sum(FFI_CALLS.values())
+        print(f"{query}: {calls / len(answers):.2f} native kind probes per wrapped concept ({dict(FFI_CALLS)})")
+        return calls / len(answers)
+
+    def test_wrapping_attributes(self):
+        self.assertLessEqual(self._ffi_calls_per_concept("match $n isa name;", "n"), 1.01)
+
+    def test_wrapping_entities(self):
+        self.assertLessEqual(self._ffi_calls_per_concept("match $p isa person;", "p"), 1.01)
+
+    def test_wrapping_types(self):
+        self.assertLessEqual(self._ffi_calls_per_concept("match $p isa person, has name $n; $t type person;", "t"),
+                             1.01)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,102 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import time
+import unittest
+from unittest import TestCase
+
+from typedb.client import *
+from typedb.concept.answer.concept_map import _ConceptMap
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+ANSWERS = 1_000
+ACCESSES = 1_000_000
+
+
+class _ThisownConceptMap(_ConceptMap):
+    # The check native_object performed before it called the pointer's own() method directly
+
+    __slots__ = ()
+
+    @property
+    def native_object(self):
+        if not self._native_object.thisown:
+            raise self._native_object_not_owned_exception
+        return self._native_object
+
+
+class TestNativeObjectAccess(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                for _ in range(ANSWERS):
+                    tx.query.insert("insert $p isa person;")
+                tx.commit()
+
+    @staticmethod
+    def _timed(function) -> float:
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+    def test_native_object_access(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                answers = list(tx.query.match("match $p isa person;"))
+                answers = answers * (ACCESSES // len(answers))
+                baselines = [_ThisownConceptMap(answer._native_object) for answer in answers]
+
+                def access(wrappers):
+                    return lambda: [wrapper.native_object for wrapper in wrappers]
+
+                wrapper = self._timed(access(answers))
+                thisown = self._timed(access(baselines))
+        print(f"{len(answers)} native_object accesses: {wrapper:.2f}s through own(), {thisown:.2f}s through thisown")
+
+    def test_answer_reads(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                native_answers = [answer._native_object for answer in tx.query.match("match $p isa person;")]
+                native_answers = native_answers * (ACCESSES // len(native_answers))
+
+                def read(wrapper_class):
+                    return lambda: [wrapper_class(answer).get("p") for answer in native_answers]
+
+                wrapper = self._timed(read(_ConceptMap))
+                thisown = self._timed(read(_ThisownConceptMap))
+        print(f"{len(native_answers)} answers wrapped and read: {wrapper:.2f}s through own(), "
+              f"{thisown:.2f}s through thisown")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
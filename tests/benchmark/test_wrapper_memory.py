@@ -0,0 +1,104 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import tracemalloc
+import unittest
+from unittest import TestCase
+
+from typedb.client import *
+from typedb.concept.answer.concept_map import _ConceptMap
+from typedb.concept.thing.attribute import _Attribute
+from typedb.concept.thing.entity import _Entity
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+ANSWERS = 10_000
+
+
+def _with_dict_fields(cls: type) -> type:
+    """
+    Reproduces the wrappers' previous layout: a subclass whose fields live in a per-instance __dict__, as properties
+    on the subclass shadow the slots of its bases. The unused slots still take a pointer each, so the baseline is
+    slightly larger than the original classes were.
+    """
+    fields = {name for klass in cls.__mro__ for name in getattr(klass, "__slots__", ()) if not name.startswith("__")}
+
+    def field(name: str) -> property:
+        return property(lambda self: self.__dict__[name], lambda self, value: self.__dict__.__setitem__(name, value))
+
+    return type("_Dict" + cls.__name__.lstrip("_"), (cls,), {name: field(name) for name in fields})
+
+
+_DictConceptMap = _with_dict_fields(_ConceptMap)
+_DictEntity = _with_dict_fields(_Entity)
+_DictAttribute = _with_dict_fields(_Attribute)
+
+
+class TestWrapperMemory(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name; name sub attribute, value string;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                for i in range(ANSWERS):
+                    tx.query.insert(f"insert $p isa person, has name \"name-{i}\";")
+                tx.commit()
+
+    @staticmethod
+    def _bytes_per_answer(tx, concept_map_class, entity_class, attribute_class) -> float:
+        native_answers = [answer.native_object for answer in tx.query.match("match $p isa person, has name $n;")]
+        native_people = [answer.get("p").native_object for answer in map(_ConceptMap, native_answers)]
+        native_names = [answer.get("n").native_object for answer in map(_ConceptMap, native_answers)]
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        wrappers = [(concept_map_class(answer), entity_class(person), attribute_class(name))
+                    for answer, person, name in zip(native_answers, native_people, native_names)]
+        for _, person, name in wrappers:
+            person.get_iid()
+            name.get_value()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        if concept_map_class is _DictConceptMap:
+            assert all(vars(wrapper) for wrapper in wrappers[0])
+        allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        return allocated / len(wrappers)
+
+    def test_bytes_per_wrapped_answer(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                with_dict = self._bytes_per_answer(tx, _DictConceptMap, _DictEntity, _DictAttribute)
+                with_slots = self._bytes_per_answer(tx, _ConceptMap, _Entity, _Attribute)
+        print(f"bytes per wrapped answer (concept map, entity, attribute): "
+              f"{with_dict:.0f} with __dict__, {with_slots:.0f} with __slots__")
+        self.assertLess(with_slots, with_dict)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
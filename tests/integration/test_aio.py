@@ -0,0 +1,109 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from unittest import IsolatedAsyncioTestCase
+
+from typedb.aio import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+class TestAio(IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        async with await TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if await client.databases.contains(TYPEDB):
+                await (await client.databases.get(TYPEDB)).delete()
+            await client.databases.create(TYPEDB)
+
+    async def test_stream_answers(self):
+        async with await TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            async with await client.session(TYPEDB, SCHEMA) as session, await session.transaction(WRITE) as tx:
+                await tx.query.define("define streamed sub entity;")
+                await tx.commit()
+            async with await client.session(TYPEDB, DATA) as session:
+                async with await session.transaction(WRITE) as tx:
+                    for _ in range(120):
+                        assert len([answer async for answer in await tx.query.insert("insert $x isa streamed;")]) == 1
+                    await tx.commit()
+                async with await session.transaction(READ) as tx:
+                    answers = [answer async for answer in tx.query.match("match $x isa streamed;", batch_size=50)]
+                    assert len(answers) == 120
+                    assert all(answer.get("x").is_entity() for answer in answers)
+                    groups = await tx.query.match_group("match $x isa streamed; group $x;").collect()
+                    assert len(groups) == 120
+                    count = await tx.query.match_aggregate("match $x isa streamed; count;")
+                    assert count.as_int() == 120
+
+    async def test_writes_are_sent_without_reading_their_answers(self):
+        async with await TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            async with await client.session(TYPEDB, SCHEMA) as session, await session.transaction(WRITE) as tx:
+                await tx.query.define("define unread sub entity, owns rank; rank sub attribute, value long;")
+                await tx.commit()
+            async with await client.session(TYPEDB, DATA) as session:
+                async with await session.transaction(WRITE) as tx:
+                    await tx.query.insert("insert $x isa unread, has rank 1;")
+                    await tx.query.insert("insert $x isa unread, has rank 2;")
+                    await tx.commit()
+                async with await session.transaction(WRITE) as tx:
+                    await tx.query.update("match $x isa unread, has rank 2, has rank $r; delete $x has $r; "
+                                          "insert $x has rank 3;")
+                    await tx.commit()
+                async with await session.transaction(READ) as tx:
+                    answers = await tx.query.match("match $x isa unread, has rank $r;").collect()
+                    assert sorted(answer.get("r").as_attribute().get_value() for answer in answers) == [1, 3]
+
+    async def test_detached_answers(self):
+        async with await TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            async with await client.session(TYPEDB, SCHEMA) as session, await session.transaction(WRITE) as tx:
+                await tx.query.define("define detached sub entity;")
+                await tx.commit()
+            async with await client.session(TYPEDB, DATA) as session:
+                async with await session.transaction(WRITE) as tx:
+                    for _ in range(3):
+                        await tx.query.insert("insert $x isa detached;")
+                    await tx.commit()
+                async with await session.transaction(READ) as tx:
+                    answers = await tx.query.match("match $x isa detached;", batch_size=2, detached=True).collect()
+                    groups = await tx.query.match_group("match $x isa detached; group $x;", detached=True).collect()
+                    counts = await tx.query.match_group_aggregate("match $x isa detached; group $x; count;",
+                                                                  detached=True).collect()
+                    count = await tx.query.match_aggregate("match $x isa detached; count;", detached=True)
+            assert len(answers) == 3 and all(isinstance(answer, ConceptMapSnapshot) for answer in answers)
+            assert len(groups) == 3 and all(isinstance(group, ConceptMapGroupSnapshot) for group in groups)
+            assert [group.numeric().as_int() for group in counts] == [1, 1, 1]
+            assert count.as_int() == 3
+
+    async def test_abandoned_stream(self):
+        async with await TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            async with await client.session(TYPEDB, SCHEMA) as session, await session.transaction(READ) as tx:
+                async with tx.query.match("match $x sub thing;", batch_size=1) as answers:
+                    assert (await answers.__anext__()).get("x").is_type()
+                assert tx.is_open()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
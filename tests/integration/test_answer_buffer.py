@@ -0,0 +1,93 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from datetime import datetime
+from unittest import TestCase
+
+from typedb.buffer import AnswerBuffer
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+PEOPLE = 300
+QUERY = "match $p isa person, has name $n, has height $h, has age $a, has alive $l, has born $b; $t type person;"
+
+
+class TestAnswerBuffer(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name, owns height, owns age, owns alive, owns born; "
+                                "name sub attribute, value string; height sub attribute, value double; "
+                                "age sub attribute, value long; alive sub attribute, value boolean; "
+                                "born sub attribute, value datetime;")
+                tx.commit()
+            rows = ({"name": "persön %d" % i, "height": 1.5 + i / 7, "age": i - 100, "alive": i % 2 == 0,
+                     "born": datetime(1900 + i % 100, 1, 1, 12, 30, 15, 250000)} for i in range(PEOPLE))
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                tx.query.insert_many("insert $p isa person, has name {name}, has height {height}, has age {age}, "
+                                     "has alive {alive}, has born {born};", rows)
+                tx.commit()
+
+    def test_buffered_answers_match_the_query(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx:
+                expected = list(tx.query.match(QUERY, detached=True))
+            with session.transaction(READ) as tx, AnswerBuffer(tx.query.match(QUERY)) as answers:
+                ordered = list(answers)
+                assert len(answers) == PEOPLE
+                assert set(ordered) == set(expected)
+                assert list(answers) == ordered
+                assert answers[-1] == ordered[-1] and answers[17] == ordered[17]
+                assert answers[10:40:3] == ordered[10:40:3]
+                assert [answers[i] for i in reversed(range(PEOPLE))] == ordered[::-1]
+                assert 0 < answers.nbytes
+
+    def test_answers_can_be_appended_while_reading(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx, AnswerBuffer() as answers:
+                assert answers.extend(tx.query.match("match $p isa person, has name $n;")) == PEOPLE
+                iterator = iter(answers)
+                next(iterator)
+                answers.append(answers[0])
+                assert len(list(iterator)) == PEOPLE - 1
+                assert len(answers) == PEOPLE + 1 and answers[-1] == answers[0]
+                with self.assertRaises(IndexError):
+                    answers[PEOPLE + 1]
+
+    def test_closed_buffer_cannot_be_read(self):
+        answers = AnswerBuffer()
+        answers.close()
+        with self.assertRaises(TypeDBClientExceptionExt):
+            list(answers)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
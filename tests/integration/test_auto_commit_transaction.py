@@ -0,0 +1,95 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+class TestAutoCommitTransaction(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name; name sub attribute, value string;")
+                tx.commit()
+
+    @staticmethod
+    def _count(session: TypeDBSession) -> int:
+        with session.transaction(READ) as tx:
+            return tx.query.match_aggregate("match $p isa person; get $p; count;").as_int()
+
+    def test_commits_every_batch(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with AutoCommitTransaction(session, batch_size=10, min_batch_size=10, max_batch_size=10) as tx:
+                for _ in range(25):
+                    tx.query.insert("insert $p isa person;")
+                assert tx.commits == 2
+                assert tx.pending_mutations == 5
+                assert self._count(session) == 20
+            assert self._count(session) == 25
+
+    def test_concept_methods_are_counted(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with AutoCommitTransaction(session, batch_size=4, min_batch_size=4, max_batch_size=4) as tx:
+                person_type = tx.concepts.get_entity_type("person")
+                name_type = tx.concepts.get_attribute_type("name")
+                for i in range(3):
+                    person = person_type.create(tx)
+                    person.set_has(tx, name_type.put(tx, f"person {i}"))
+                assert tx.commits == 2
+                tx.track(2)
+                assert tx.commits == 2
+                assert tx.pending_mutations == 3
+            with session.transaction(READ) as tx:
+                names = {answer.get("n").get_value() for answer in tx.query.match("match $p has name $n;")}
+                assert names == {"person 0", "person 1", "person 2"}
+
+    def test_batch_size_adapts_to_commit_latency(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with AutoCommitTransaction(session, batch_size=10, target_commit_seconds=60.0) as tx:
+                for _ in range(100):
+                    tx.query.insert("insert $p isa person;")
+                assert tx.batch_size > 10
+
+    def test_exception_discards_pending_mutations(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with self.assertRaises(ValueError):
+                with AutoCommitTransaction(session, batch_size=10, min_batch_size=10) as tx:
+                    for _ in range(15):
+                        tx.query.insert("insert $p isa person;")
+                    raise ValueError()
+            assert self._count(session) == 10
+            assert not tx.is_open()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
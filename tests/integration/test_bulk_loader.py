@@ -0,0 +1,109 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from unittest import TestCase
+
+from typedb.bulk import Loader
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+class _ConflictingLoader(Loader):
+    """
+    Fails its first batches with a real commit conflict: each deletes a "contended" person that another transaction
+    deletes and commits first.
+    """
+
+    def __init__(self, session, conflicts: int, **kwargs):
+        super().__init__(session, **kwargs)
+        self.conflicts = conflicts
+
+    def _write(self, queries: list[str]) -> float:
+        if self.conflicts:
+            self.conflicts -= 1
+            query = f'match $p isa person, has name "contended {self.conflicts}"; delete $p isa person;'
+            with self._session.transaction(WRITE) as tx, self._session.transaction(WRITE) as other:
+                tx.query.delete(query)
+                other.query.delete(query)
+                other.commit()
+                tx.commit()
+        return super()._write(queries)
+
+
+class TestBulkLoader(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name; name sub attribute, value string;")
+                tx.commit()
+
+    def test_queries_without_template(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            metrics = Loader(session, workers=2, batch_size=7).load("insert $p isa person;" for _ in range(50))
+            self.assertEqual(50, metrics.operations)
+            self.assertEqual(8, metrics.batches)
+            self.assertEqual(8, metrics.commit_latency.count)
+
+    def test_conflicting_batch_is_retried(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(WRITE) as tx:
+                tx.query.insert('insert $p isa person, has name "contended 0";')
+                tx.commit()
+            loader = _ConflictingLoader(session, 1, workers=1, batch_size=10, backoff_seconds=0.01)
+            metrics = loader.load("insert $p isa person;" for _ in range(10))
+            self.assertEqual(0, loader.conflicts)
+            self.assertEqual(1, metrics.retries)
+            self.assertEqual((10, 1, 0), (metrics.operations, metrics.batches, metrics.failed_batches), metrics.errors)
+            with session.transaction(READ) as tx:
+                assert tx.query.match_aggregate("match $p isa person; get $p; count;").as_int() == 10
+
+    def test_batch_fails_after_its_retries(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(WRITE) as tx:
+                for i in range(3):
+                    tx.query.insert(f'insert $p isa person, has name "contended {i}";')
+                tx.commit()
+            loader = _ConflictingLoader(session, 3, workers=1, batch_size=10, max_retries=1, backoff_seconds=0.01)
+            metrics = loader.load("insert $p isa person;" for _ in range(10))
+            self.assertEqual((1, 0, 1, 10), (metrics.retries, metrics.operations, metrics.failed_batches,
+                                             metrics.failed_operations))
+            self.assertIsInstance(metrics.errors[0], TypeDBClientException)
+
+    def test_query_errors_are_not_retried(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            loader = Loader(session, workers=1, batch_size=1, max_retries=3, backoff_seconds=60)
+            metrics = loader.load(["insert $p isa;", "insert $p isa animal;"])
+            self.assertEqual((0, 2, 2), (metrics.retries, metrics.failed_batches, metrics.failed_operations))
+            self.assertTrue(all(isinstance(error, TypeDBClientException) for error in metrics.errors))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,186 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import os
+import sys
+import traceback
+import unittest
+from types import ModuleType
+from unittest import TestCase
+
+
+class _Native:
+
+    def __init__(self, **fields):
+        self.thisown = True
+        self.pid = os.getpid()
+        self.__dict__.update(fields)
+
+
+def _local(native: _Native) -> _Native:
+    # Using a native object in a process other than the one that created it is what the client has to avoid
+    if native.pid != os.getpid():
+        raise AssertionError("Native object inherited from the parent process was used in the child")
+    return native
+
+
+def _session_force_close(session: _Native) -> None:
+    _local(session).open = False
+    for callback in session.callbacks:
+        callback.callback()
+
+
+class _CallbackDirector:
+
+    def __init__(self):
+        pass
+
+    def __disown__(self):
+        return self
+
+
+def _stand_in_native_module() -> ModuleType:
+    module = ModuleType("typedb.native_client_wrapper")
+    module.__dict__.update(
+        connection_open_plaintext=lambda address: _Native(open=True),
+        connection_open_encrypted=lambda addresses, credential: _Native(open=True),
+        connection_is_open=lambda connection: _local(connection).open,
+        connection_force_close=lambda connection: setattr(_local(connection), "open", False),
+        database_manager_new=lambda connection: _Native(connection=_local(connection)),
+        user_manager_new=lambda connection: _Native(connection=_local(connection)),
+        databases_contains=lambda manager, name: bool(_local(manager)),
+        databases_get=lambda manager, name: _Native(manager=_local(manager), name=name),
+        database_get_name=lambda database: _local(database).name,
+        session_new=lambda database, session_type, options: _Native(database=_local(database), open=True,
+                                                                    callbacks=[]),
+        session_is_open=lambda session: _local(session).open,
+        session_force_close=_session_force_close,
+        session_on_close=lambda session, callback: _local(session).callbacks.append(callback),
+        options_new=lambda: _Native(),
+        SessionCallbackDirector=_CallbackDirector,
+        TransactionCallbackDirector=_CallbackDirector,
+    )
+    stand_ins = {}
+
+    def stand_in(name: str):
+        # Everything else the driver imports is only needed to exist
+        if name not in stand_ins:
+            if name[0].isupper():
+                stand_ins[name] = type(name, (), {})
+            elif name.startswith("options_has_"):
+                stand_ins[name] = lambda options: False
+            else:
+                def unsupported(*args):
+                    raise NotImplementedError(name)
+                stand_ins[name] = unsupported
+        return stand_ins[name]
+
+    module.__getattr__ = stand_in
+    return module
+
+
+sys.modules["typedb.native_client_wrapper"] = _stand_in_native_module()
+
+from typedb.client import *  # noqa: E402
+
+TYPEDB = "typedb"
+DATA = SessionType.DATA
+
+
+class TestForkSafety(TestCase):
+
+    def _assert_in_child(self, check) -> None:
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                check()
+                status = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(status)
+        _, status = os.waitpid(pid, 0)
+        self.assertTrue(os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0)
+
+    def test_client_reopens_connection_in_child(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            inherited = client._native_object
+
+            def check():
+                assert client.is_open()
+                assert client._native_object is not inherited
+                assert not inherited.thisown
+                assert client.databases.contains(TYPEDB)
+
+            self._assert_in_child(check)
+            assert client._native_object is inherited and inherited.thisown
+            assert client.is_open()
+
+    def test_session_reopens_in_child(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            session = client.session(TYPEDB, DATA)
+            closed = []
+            session.on_close(lambda: closed.append(os.getpid()))
+            inherited = session._native_object
+
+            def check():
+                assert session.is_open()
+                assert session._native_object is not inherited
+                session.close()
+                assert not session.is_open()
+                assert closed == [os.getpid()]
+
+            self._assert_in_child(check)
+            assert session.is_open() and not closed
+            session.close()
+            assert closed == [os.getpid()]
+
+    def test_session_pool_replaces_inherited_sessions_in_child(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session_pool.session(TYPEDB, DATA) as inherited:
+                pass
+
+            def check():
+                with client.session_pool.session(TYPEDB, DATA) as session:
+                    assert session is not inherited
+                    assert session.is_open()
+                assert not inherited._native_object.thisown
+
+            self._assert_in_child(check)
+            with client.session_pool.session(TYPEDB, DATA) as session:
+                assert session is inherited
+
+    def test_closing_in_child_leaves_parent_connection_open(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            inherited = client._native_object
+
+            def check():
+                client.close()
+                assert not client.is_open()
+                assert inherited.open and not inherited.thisown
+
+            self._assert_in_child(check)
+            assert client.is_open()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
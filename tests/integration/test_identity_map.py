@@ -0,0 +1,114 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import gc
+import unittest
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+class TestIdentityMap(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name, plays friendship:friend; "
+                                "friendship sub relation, relates friend; name sub attribute, value string;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                tx.query.insert('insert $p isa person, has name "Alice";')
+                tx.commit()
+
+    def test_concepts_with_the_same_iid_are_the_same_object(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ, identity_map=True) as tx:
+                first = next(tx.query.match("match $p isa person, has name $n;"))
+                second = next(tx.query.match("match $p isa person;"))
+                assert first.get("p") is second.get("p")
+                assert first.get("n") is next(first.get("p").as_entity().get_has(tx))
+                assert tx.concepts.get_entity_type("person") is tx.concepts.get_entity_type("person")
+                person = tx.concepts.get_entity_type("person")
+                assert next(person.get_owns(tx)) is tx.concepts.get_attribute_type("name")
+                assert next(person.get_plays(tx)) is next(tx.concepts.get_relation_type("friendship").get_relates(tx))
+                assert next(person.get_plays(tx)).get_relation_type(tx) is tx.concepts.get_relation_type("friendship")
+                assert first.get("p").get_type() == person
+            with session.transaction(READ) as tx:
+                first = next(tx.query.match("match $p isa person;"))
+                second = next(tx.query.match("match $p isa person;"))
+                assert first.get("p") == second.get("p") and first.get("p") is not second.get("p")
+
+    def test_map_is_cleared_when_the_transaction_ends(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(WRITE, identity_map=True) as tx:
+                person = next(tx.query.match("match $p isa person;")).get("p")
+                assert len(tx.identity_map) > 0
+                tx.rollback()
+                assert len(tx.identity_map) == 0
+                assert next(tx.query.match("match $p isa person;")).get("p") is not person
+                tx.commit()
+                assert len(tx.identity_map) == 0
+            tx = session.transaction(READ, identity_map=True)
+            person = next(tx.query.match("match $p isa person;")).get("p")
+            assert len(tx.identity_map) > 0
+            tx.close()
+            assert len(tx.identity_map) == 0 and person.is_entity()
+
+    def test_unreferenced_concepts_expire(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ, identity_map=True) as tx:
+                answer = next(tx.query.match("match $p isa person, has name $n;"))
+                name = answer.get("n")
+                assert len(tx.identity_map) == 2
+                del answer
+                gc.collect()
+                assert len(tx.identity_map) == 1
+                del name
+                gc.collect()
+                assert len(tx.identity_map) == 0
+
+    def test_renamed_types_are_rekeyed(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, SCHEMA) as session:
+            with session.transaction(WRITE, identity_map=True) as tx:
+                person = tx.concepts.get_entity_type("person")
+                person.set_label(tx, "human")
+                assert tx.concepts.get_entity_type("human") is person
+                tx.query.define("define person sub entity;")
+                assert tx.concepts.get_entity_type("person") is not person
+                assert tx.concepts.get_entity_type("person").get_label() == Label.of("person")
+                friend = next(tx.query.match("match $r type friendship:friend;")).get("r")
+                friend.set_label(tx, "buddy")
+                assert next(tx.query.match("match $r type friendship:buddy;")).get("r") is friend
+                tx.query.define("define friendship relates friend;")
+                assert next(tx.query.match("match $r type friendship:friend;")).get("r") is not friend
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,80 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from datetime import datetime
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+class TestInsertMany(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name, owns height, owns alive, owns born; "
+                                "name sub attribute, value string; height sub attribute, value double; "
+                                "alive sub attribute, value boolean; born sub attribute, value datetime;")
+                tx.commit()
+
+    def test_rows_are_bound_and_inserted(self):
+        rows = [{"name": f'person "{i}" \\ {i}', "height": 1.5 + i, "alive": i % 2 == 0,
+                 "born": datetime(2000, 1, 1, 12, 30, 15, 250000)} for i in range(250)]
+        template = "insert $p isa person, has name {name}, has height {height}, has alive {alive}, has born {born};"
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session:
+                with session.transaction(WRITE) as tx:
+                    assert tx.query.insert_many(template, rows, batch_size=64) == 250
+                    tx.commit()
+                with session.transaction(READ) as tx:
+                    names = {answer.get("n").get_value() for answer in tx.query.match("match $p has name $n;")}
+                    assert names == {row["name"] for row in rows}
+                    born = next(tx.query.match("match $p has born $b;")).get("b").get_value()
+                    assert born == datetime(2000, 1, 1, 12, 30, 15, 250000)
+
+    def test_wrapped_answers(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                answers = tx.query.insert_many("insert $p isa person, has height {height};",
+                                               [{"height": 2}, {"height": 3.25}], wrap_answers=True)
+                assert [answer.get("p").is_entity() for answer in answers] == [True, True]
+
+    def test_invalid_parameters(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                with self.assertRaises(TypeDBClientExceptionExt):
+                    tx.query.insert_many("insert $p isa person, has height {height};", [{"height": float("nan")}])
+                with self.assertRaises(TypeDBClientExceptionExt):
+                    tx.query.insert_many("insert $p isa person, has name {name};", [{"height": 1.0}])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,119 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+from unittest import TestCase
+
+from typedb.client import *
+from typedb.parallel import map_answers
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+PEOPLE = 250
+QUERY = "match $p has name $n; sort $n;"
+
+
+def _score(answer: ConceptMapSnapshot) -> int:
+    return sum(ord(character) for character in answer.get_value("n"))
+
+
+def _fail(answer: ConceptMapSnapshot) -> int:
+    raise ValueError(answer.get_value("n"))
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+
+    def __init__(self):
+        super().__init__(max_workers=4)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class TestParallel(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name; name sub attribute, value string;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                tx.query.insert_many('insert $p isa person, has name {name};',
+                                     ({"name": "person %d" % i} for i in range(PEOPLE)))
+                tx.commit()
+
+    def test_results_follow_answer_order(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx:
+                expected = [_score(answer.snapshot()) for answer in tx.query.match(QUERY)]
+            with session.transaction(READ) as tx:
+                results = list(map_answers(tx, QUERY, _score, processes=2, chunk_size=16,
+                                           max_chunks_in_flight=3))
+        assert len(expected) == PEOPLE
+        assert results == expected
+
+    def test_unordered_results_cover_every_answer(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx:
+                expected = [_score(answer.snapshot()) for answer in tx.query.match(QUERY)]
+            with session.transaction(READ) as tx:
+                results = list(map_answers(tx, QUERY, _score, processes=2, chunk_size=7,
+                                           ordered=False))
+        assert sorted(results) == sorted(expected)
+
+    def test_chunks_in_flight_are_bounded_for_a_slow_consumer(self):
+        chunk_size, max_chunks_in_flight = 10, 2
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx, _CountingExecutor() as executor:
+                results = map_answers(tx, QUERY, _score, chunk_size=chunk_size,
+                                      max_chunks_in_flight=max_chunks_in_flight, executor=executor)
+                for consumed, _ in enumerate(results):
+                    sleep(0.005)
+                    assert executor.submitted - consumed // chunk_size <= max_chunks_in_flight
+        assert consumed + 1 == PEOPLE
+        assert executor.submitted == PEOPLE // chunk_size
+
+    def test_worker_errors_are_raised(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx:
+                with self.assertRaises(ValueError):
+                    list(map_answers(tx, QUERY, _fail, processes=2))
+
+    def test_chunk_size_must_be_positive(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx:
+                with self.assertRaises(TypeDBClientExceptionExt):
+                    map_answers(tx, QUERY, _score, chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,108 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import os
+import pickle
+import tempfile
+import time
+import unittest
+from unittest import TestCase
+
+from typedb.cache import PersistentAnswerCache
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+NAMES = "match $p isa person, has name $n;"
+
+
+class TestPersistentAnswerCache(TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "answers.sqlite")
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name; name sub attribute, value string;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                tx.query.insert('insert $p isa person, has name "Alice";')
+                tx.commit()
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _insert_bob(self, client: TypeDBClient) -> None:
+        with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+            tx.query.insert('insert $p isa person, has name "Bob";')
+            tx.commit()
+
+    def _names(self, client: TypeDBClient, cache: PersistentAnswerCache) -> set[str]:
+        answers = cache.database(client.databases.get(TYPEDB))
+        with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+            return {answer.get_value("n") for answer in answers.match(tx, NAMES)}
+
+    def test_answers_survive_reopening(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with PersistentAnswerCache(self._path) as cache:
+                assert self._names(client, cache) == {"Alice"}
+            self._insert_bob(client)
+            with PersistentAnswerCache(self._path) as cache:
+                assert self._names(client, cache) == {"Alice"}
+                cache.invalidate(TYPEDB)
+                assert self._names(client, cache) == {"Alice", "Bob"}
+
+    def test_schema_change_misses(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, PersistentAnswerCache(self._path) as cache:
+            assert self._names(client, cache) == {"Alice"}
+            self._insert_bob(client)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define company sub entity;")
+                tx.commit()
+            assert self._names(client, cache) == {"Alice", "Bob"}
+
+    def test_answers_expire(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with PersistentAnswerCache(self._path, ttl_seconds=0.5) as cache:
+                assert self._names(client, cache) == {"Alice"}
+                self._insert_bob(client)
+                time.sleep(1)
+                assert self._names(client, cache) == {"Alice", "Bob"}
+
+    def test_snapshots_are_picklable(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, PersistentAnswerCache(self._path) as cache:
+            answers = cache.database(client.databases.get(TYPEDB))
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                snapshot = answers.match(tx, NAMES)[0]
+                count = answers.match_aggregate(tx, "match $p isa person; get $p; count;")
+            assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+            assert snapshot.get("p").is_entity() and snapshot.get("p").get_label().name == "person"
+            assert count.as_int() == 1
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,76 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from datetime import datetime
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+class TestQueryTemplate(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name, owns born; "
+                                "name sub attribute, value string; born sub attribute, value datetime;")
+                tx.commit()
+
+    def test_render(self):
+        template = compile_template('match $p has name {name}, has name "{name}"; # {born}\n get;')
+        assert template.parameters == ("name",)
+        assert compile_template(template.template) is template
+        assert template.render(name='a "b" \\') == \
+               'match $p has name "a \\"b\\" \\\\", has name "{name}"; # {born}\n get;'
+        with self.assertRaises(TypeDBClientExceptionExt):
+            template.render(born=datetime(2000, 1, 1))
+        with self.assertRaises(TypeDBClientExceptionExt):
+            template.render(name=object())
+
+    def test_templates_round_trip(self):
+        insert = compile_template("insert $p isa person, has name {name}, has born {born};")
+        match = compile_template("match $p isa person, has name {name}, has born $b;")
+        names = ['Robert"); undefine person;', "O'Neill", "back\\slash"]
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session:
+                with session.transaction(WRITE) as tx:
+                    for name in names:
+                        tx.query.insert(insert.render(name=name, born=datetime(1990, 6, 1)))
+                    tx.commit()
+                with session.transaction(READ) as tx:
+                    for name in names:
+                        answers = list(tx.query.match(match.render(name=name)))
+                        assert len(answers) == 1
+                        assert answers[0].get("b").get_value() == datetime(1990, 6, 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import time
+import unittest
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+DATA = SessionType.DATA
+READ = TransactionType.READ
+
+
+class TestReadTransactionPool(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if not client.databases.contains(TYPEDB):
+                client.databases.create(TYPEDB)
+
+    def test_transactions_are_reused(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.read_transaction_pool(2) as pool:
+                for _ in range(10):
+                    with pool.transaction(timeout=10) as tx:
+                        assert tx.transaction_type.is_read()
+                        next(tx.query.match("match $x sub thing; limit 1;"))
+                metrics = pool.metrics()
+                assert metrics.hits + metrics.misses == 10
+                assert metrics.misses <= 2
+
+    def test_closed_transactions_are_replaced(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.read_transaction_pool(1) as pool:
+                with pool.transaction(timeout=10) as tx:
+                    tx.close()
+                with pool.transaction(timeout=10) as replacement:
+                    assert replacement is not tx
+                    assert replacement.is_open()
+                assert pool.metrics().recycled == 1
+
+    def test_transactions_are_recycled_before_timeout(self):
+        options = TypeDBOptions(transaction_timeout_millis=1000)
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.read_transaction_pool(1, options) as pool:
+                with pool.transaction(timeout=10) as tx:
+                    pass
+                time.sleep(1.5)
+                with pool.transaction(timeout=10) as refreshed:
+                    assert refreshed is not tx
+                    next(refreshed.query.match("match $x sub thing; limit 1;"))
+
+    def test_pool_closes_with_session(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session:
+                pool = session.read_transaction_pool(1)
+                with pool.transaction(timeout=10) as tx:
+                    pass
+            assert not tx.is_open()
+            with self.assertRaises(TypeDBClientExceptionExt):
+                with pool.transaction():
+                    pass
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
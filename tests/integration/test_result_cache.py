@@ -0,0 +1,125 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+COUNT_PEOPLE = "match $p isa person; get $p; count;"
+
+
+class TestResultCache(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity;")
+                tx.commit()
+
+    def test_answers_are_cached_until_commit(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, result_cache_size=16) as client:
+            with client.session(TYPEDB, DATA) as session:
+                with session.transaction(WRITE) as tx:
+                    tx.query.insert("insert $p isa person;")
+                    tx.commit()
+                for _ in range(3):
+                    with session.transaction(READ) as tx:
+                        assert tx.query.match_aggregate(COUNT_PEOPLE, cached=True).as_int() == 1
+                        assert len(list(tx.query.match("match $p isa person;", cached=True))) == 1
+                assert (client.result_cache.hits, client.result_cache.misses) == (4, 2)
+                with session.transaction(WRITE) as tx:
+                    tx.query.insert("insert $p isa person;")
+                    tx.commit()
+                assert len(client.result_cache) == 0
+                with session.transaction(READ) as tx:
+                    assert tx.query.match_aggregate(COUNT_PEOPLE, cached=True).as_int() == 2
+
+    def test_options_are_part_of_the_key(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, result_cache_size=16) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                tx.query.match_aggregate(COUNT_PEOPLE, cached=True)
+                tx.query.match_aggregate(COUNT_PEOPLE, TypeDBOptions(infer=True), cached=True)
+                tx.query.match_aggregate(COUNT_PEOPLE, TypeDBOptions(infer=True), cached=True)
+                assert (client.result_cache.hits, client.result_cache.misses) == (1, 2)
+
+    def test_cached_streams_keep_the_iterator_api(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, result_cache_size=16) as client:
+            with client.session(TYPEDB, DATA) as session:
+                with session.transaction(WRITE) as tx:
+                    for _ in range(25):
+                        tx.query.insert("insert $p isa person;")
+                    tx.commit()
+                with session.transaction(READ) as tx:
+                    assert len(tx.query.match("match $p isa person;", cached=True).next_batch(10)) == 10
+                    assert len(client.result_cache) == 0
+                    batches = list(tx.query.match("match $p isa person;", cached=True).batches(10))
+                    assert [len(batch) for batch in batches] == [10, 10, 5]
+                    assert all(isinstance(answer, ConceptMapSnapshot) for batch in batches for answer in batch)
+                    assert len(client.result_cache) == 1
+                with session.transaction(READ) as tx:
+                    answers = tx.query.match("match $p isa person;", cached=True)
+                    with answers.prefetch_in_background(queue_size=5) as prefetched:
+                        assert len(list(prefetched)) == 25
+                assert client.result_cache.hits == 1
+
+    def test_explained_queries_are_not_cached(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, result_cache_size=16) as client:
+            with client.session(TYPEDB, DATA) as session:
+                with session.transaction(WRITE) as tx:
+                    tx.query.insert("insert $p isa person;")
+                    tx.commit()
+                with session.transaction(READ, TypeDBOptions(infer=True)) as tx:
+                    answers = list(tx.query.match("match $p isa person;", TypeDBOptions(infer=True, explain=True),
+                                                  cached=True))
+                    assert len(answers) == 1
+                    assert len(client.result_cache) == 0
+
+    def test_only_cached_reads_use_the_cache(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, result_cache_size=16) as client:
+            with client.session(TYPEDB, DATA) as session:
+                with session.transaction(WRITE) as tx:
+                    tx.query.insert("insert $p isa person;")
+                    tx.commit()
+                with session.transaction(READ) as tx:
+                    answer = next(tx.query.match("match $p isa person;"))
+                    assert not isinstance(answer, ConceptMapSnapshot) and answer.get("p").is_entity()
+                    assert len(client.result_cache) == 0
+                    for _ in range(2):
+                        groups = list(tx.query.match_group("match $p isa person; group $p;", cached=True))
+                        assert len(groups) == 1 and isinstance(groups[0], ConceptMapGroupSnapshot)
+                    assert (client.result_cache.hits, client.result_cache.misses) == (1, 1)
+
+    def test_disabled_by_default(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            assert client.result_cache is None
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,74 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+
+
+class TestSessionPool(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if not client.databases.contains(TYPEDB):
+                client.databases.create(TYPEDB)
+
+    def test_sessions_are_reused(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session_pool.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                next(tx.query.match("match $x sub thing; limit 1;"))
+            with client.session_pool.session(TYPEDB, DATA) as reused:
+                assert reused is session
+            with client.session_pool.session(TYPEDB, SCHEMA) as schema_session:
+                assert schema_session is not session
+            with client.session_pool.session(TYPEDB, DATA, TypeDBOptions(infer=True)) as inferring:
+                assert inferring is not session
+
+    def test_closed_sessions_are_replaced(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session_pool.session(TYPEDB, DATA) as session:
+                session.close()
+            with client.session_pool.session(TYPEDB, DATA) as replacement:
+                assert replacement is not session
+                assert replacement.is_open()
+
+    def test_maximum_size(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, session_pool_max_size=1) as client:
+            with client.session_pool.session(TYPEDB, DATA):
+                with self.assertRaises(TypeDBClientExceptionExt):
+                    with client.session_pool.session(TYPEDB, DATA, timeout=0.1):
+                        pass
+
+    def test_sessions_close_with_client(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, session_pool_min_size=2) as client:
+            with client.session_pool.session(TYPEDB, DATA) as session:
+                pass
+        assert not session.is_open()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
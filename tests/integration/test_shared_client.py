@@ -0,0 +1,60 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+DATA = SessionType.DATA
+READ = TransactionType.READ
+
+
+class TestSharedClient(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if not client.databases.contains(TYPEDB):
+                client.databases.create(TYPEDB)
+
+    def test_connection_is_shared_until_last_release(self):
+        first = TypeDB.shared_core_client(TypeDB.DEFAULT_ADDRESS)
+        with TypeDB.shared_core_client(TypeDB.DEFAULT_ADDRESS) as second:
+            assert second.databases is first.databases
+        assert first.is_open()
+        with first.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+            next(tx.query.match("match $x sub thing; limit 1;"))
+        first.close()
+        assert not first.is_open()
+        with self.assertRaises(TypeDBClientExceptionExt):
+            first.session(TYPEDB, DATA)
+
+    def test_connection_reopens_after_last_release(self):
+        with TypeDB.shared_core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            databases = client.databases
+        with TypeDB.shared_core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            assert client.databases is not databases
+            assert client.databases.contains(TYPEDB)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,91 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from unittest import TestCase
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+def _describe(answer: ConceptMapSnapshot) -> str:
+    return "%s born %s" % (answer.get_value("n"), answer.get_value("b").year)
+
+
+class TestSnapshot(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns name, owns born; "
+                                "name sub attribute, value string; born sub attribute, value datetime;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                tx.query.insert('insert $p isa person, has name "Alice", has born 1990-01-01T00:00:00;')
+                tx.query.insert('insert $p isa person, has name "Bob", has born 1985-06-15T12:00:00;')
+                tx.commit()
+
+    def test_detached_answers_outlive_the_transaction(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx:
+                answers = list(tx.query.match("match $p isa person, has name $n, has born $b;", detached=True))
+                count = tx.query.match_aggregate("match $p isa person; get $p; count;", detached=True)
+                groups = list(tx.query.match_group_aggregate("match $p isa person, has name $n; get $p, $n; "
+                                                             "group $p; count;", detached=True))
+        assert sorted(answer.get_value("n") for answer in answers) == ["Alice", "Bob"]
+        alice = next(answer for answer in answers if answer.get_value("n") == "Alice")
+        assert alice.get("p").is_entity() and alice.get("p").get_label() == Label.of("person")
+        assert alice.get("p").get_iid() and not alice.get("p").is_inferred()
+        assert alice.get("b").value_type == ValueType.DATETIME and alice.get_value("b") == datetime(1990, 1, 1)
+        assert count.as_int() == 2
+        assert sorted(group.numeric().as_int() for group in groups) == [1, 1]
+
+    def test_snapshots_are_hashable_and_picklable(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx:
+                answers = [answer.snapshot() for answer in tx.query.match("match $p isa person, has name $n;")]
+                again = list(tx.query.match("match $p isa person, has name $n;", detached=True))
+        assert set(answers) == set(again)
+        assert pickle.loads(pickle.dumps(answers)) == answers
+        with self.assertRaises(AttributeError):
+            answers[0].get("n")._value = "Eve"
+
+    def test_snapshots_fan_out_to_processes(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx:
+                answers = list(tx.query.match("match $p isa person, has name $n, has born $b;", detached=True))
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            assert sorted(executor.map(_describe, answers)) == ["Alice born 1990", "Bob born 1985"]
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
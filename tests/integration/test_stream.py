@@ -19,6 +19,8 @@
 # under the License.
 #
 
+import threading
+import time
 import unittest
 from unittest import TestCase
 
@@ -55,5 +57,69 @@ class TestStream(TestCase):
                     _attrs = list(person_type.get_owns(tx, annotations={Annotation.key()}))
                     next(tx.query.match("match $x sub thing; limit 1;"))
 
+    def test_batched_iteration(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define batched sub entity;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                for _ in range(25):
+                    tx.query.insert("insert $x isa batched;")
+                batches = list(tx.query.match("match $x isa batched;").batches(10))
+                assert [len(batch) for batch in batches] == [10, 10, 5]
+                assert all(answer.get("x").is_entity() for batch in batches for answer in batch)
+                answers = tx.query.match("match $x isa batched;")
+                assert len(answers.next_batch(20)) == 20
+                assert len(list(answers)) == 5
+
+    def test_background_prefetch(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define prefetched sub entity;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                for _ in range(120):
+                    tx.query.insert("insert $x isa prefetched;")
+                with tx.query.match("match $x isa prefetched;").prefetch_in_background(queue_size=20) as answers:
+                    assert len(list(answers)) == 120
+                with tx.query.match("match $x isa prefetched;").prefetch_in_background(queue_size=20) as answers:
+                    next(answers)
+                assert not any(thread.name == "typedb-prefetch" for thread in threading.enumerate())
+                answers = tx.query.match("match $x isa prefetched;").prefetch_in_background(queue_size=5, batch_size=50)
+                time.sleep(0.5)
+                assert sum(len(batch) for batch in list(answers._queue.queue)) <= 5
+                assert len(list(answers)) == 120
+
+    def test_match_columns(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define columnar sub entity, owns rank; rank sub attribute, value long;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                for i in range(10):
+                    tx.query.insert(f"insert $x isa columnar, has rank {i};")
+                columns = tx.query.match_columns("match $x isa columnar, has rank $r;", ["x", "r"])
+                assert len(columns["x"]) == len(columns["r"]) == 10
+                assert sorted(columns["r"].values()) == list(range(10))
+                assert columns["r"].values().typecode == "q"
+                assert columns["x"].labels() == [Label.of("columnar")]
+                assert set(columns["x"].label_codes()) == {0}
+                assert len(set(columns["x"].iids())) == 10
+
+    def test_match_values(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define valued sub entity, owns score; score sub attribute, value double;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                tx.query.insert("insert $x isa valued, has score 2.5;")
+                rows = list(tx.query.match_values("match $x isa valued, has score $s;"))
+                assert rows == [{"s": 2.5}]
+                rows = list(tx.query.match_values("match $x isa $t, has score $s; $t type valued;"))
+                assert rows == [{"s": 2.5}]
+                answer = next(tx.query.match("match $x isa valued, has score $s;"))
+                assert answer.get_value("s") == 2.5
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
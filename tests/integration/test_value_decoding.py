@@ -0,0 +1,82 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import patch
+
+import typedb.concept.value.value
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+class TestValueDecoding(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases.contains(TYPEDB):
+                client.databases.get(TYPEDB).delete()
+            client.databases.create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query.define("define person sub entity, owns age, owns born; "
+                                "age sub attribute, value long; born sub attribute, value datetime;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                tx.query.insert("insert $p isa person, has age 42, has born 1980-02-03T04:05:06;")
+                tx.commit()
+
+    def test_values_are_decoded_once(self):
+        decode = typedb.concept.value.value._decode_native_value
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx:
+                answer = next(tx.query.match("match $p has age $a, has born $b; ?d = $a;"))
+                with patch.object(typedb.concept.value.value, "_decode_native_value", side_effect=decode) as counted:
+                    age, born, value = answer.get("a").as_attribute(), answer.get("b").as_attribute(), \
+                        answer.get("d").as_value()
+                    for _ in range(3):
+                        assert age.get_value() == 42 and age.is_long() and age.as_long() == 42
+                        assert age.get_value_type() == ValueType.LONG
+                        assert born.as_datetime() == datetime(1980, 2, 3, 4, 5, 6) and born.is_datetime()
+                        assert value.get() == 42 and value.as_long() == 42
+                    assert counted.call_count == 3
+
+    def test_casting_to_another_type_raises(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with session.transaction(READ) as tx:
+                answer = next(tx.query.match("match $p has age $a; ?d = $a;"))
+                age, value = answer.get("a").as_attribute(), answer.get("d").as_value()
+                assert age.as_long() == value.as_long() == 42
+                for concept in (age, value):
+                    with self.assertRaises(TypeDBClientException):
+                        concept.as_string()
+                    with self.assertRaises(TypeDBClientException):
+                        concept.as_boolean()
+                    assert concept.as_long() == 42
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,52 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from typing import Iterable, Optional, Union
+
+from typedb.client import *  # noqa # pylint: disable=unused-import,wildcard-import
+from typedb.common.async_iterator_wrapper import *  # noqa # pylint: disable=unused-import
+from typedb.connection.async_client import AsyncClient
+from typedb.connection.async_database_manager import *  # noqa # pylint: disable=unused-import
+from typedb.connection.async_session import *  # noqa # pylint: disable=unused-import
+from typedb.connection.async_transaction import *  # noqa # pylint: disable=unused-import
+from typedb.connection.client import _Client
+from typedb.query.async_query_manager import *  # noqa # pylint: disable=unused-import
+from typedb.user.async_user_manager import *  # noqa # pylint: disable=unused-import
+
+
+# Mirrors "typedb.client", with a TypeDB whose clients run every blocking call on an executor they manage
+
+
+class TypeDB:
+    DEFAULT_ADDRESS = "localhost:1729"
+
+    @staticmethod
+    async def core_client(address: str, max_workers: Optional[int] = None) -> AsyncClient:
+        return await AsyncClient._open(lambda: _Client([address]), max_workers)
+
+    @staticmethod
+    async def cluster_client(addresses: Union[Iterable[str], str], credential: TypeDBCredential,
+                             max_workers: Optional[int] = None) -> AsyncClient:
+        if isinstance(addresses, str):
+            addresses = [addresses]
+        else:
+            addresses = list(addresses)
+        return await AsyncClient._open(lambda: _Client(addresses, credential), max_workers)
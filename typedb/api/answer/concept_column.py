@@ -0,0 +1,78 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, Sequence, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from typedb.common.label import Label
+
+
+class ConceptColumn(ABC):
+    """
+    All the concepts bound to one variable across the answers of a query, stored column-wise: the IIDs of things,
+    the type labels as codes into a dictionary of labels (-1 for values), and the values of attributes and values.
+    The values are a typed ``array`` when every row holds a long, double or boolean (stored as 0 or 1).
+    """
+
+    @property
+    @abstractmethod
+    def variable(self) -> str:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def iids(self) -> Sequence[Optional[bytes]]:
+        pass
+
+    @abstractmethod
+    def labels(self) -> Sequence[Label]:
+        pass
+
+    @abstractmethod
+    def label_codes(self) -> Sequence[int]:
+        pass
+
+    @abstractmethod
+    def values(self) -> Sequence[Optional[Union[bool, int, float, str, datetime]]]:
+        pass
+
+    def type_labels(self) -> list[Optional[Label]]:
+        labels = self.labels()
+        return [labels[code] if code >= 0 else None for code in self.label_codes()]
+
+    def to_numpy(self) -> dict:
+        import numpy
+        return {
+            "iid": numpy.array(self.iids(), dtype=object),
+            "label_code": numpy.asarray(self.label_codes(), dtype=numpy.int32),
+            "value": numpy.asarray(self.values(), dtype=None if _is_typed_array(self.values()) else object),
+        }
+
+
+def _is_typed_array(values: Sequence) -> bool:
+    return hasattr(values, "typecode")
@@ -22,14 +22,19 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Mapping, Union, Iterator, TYPE_CHECKING
 
+from typedb.api.answer.snapshot import ConceptMapSnapshot
+
 if TYPE_CHECKING:
     from typedb.api.concept.concept import Concept
 
 
 class ConceptMap(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def variables(self) -> Iterator[str]:
         pass
@@ -42,6 +47,10 @@ class ConceptMap(ABC):
     def get(self, variable: str) -> Concept:
         pass
 
+    @abstractmethod
+    def get_value(self, variable: str) -> Union[bool, int, float, str, datetime]:
+        pass
+
     @abstractmethod
     def explainables(self) -> Explainables:
         pass
@@ -49,8 +58,17 @@ class ConceptMap(ABC):
     def to_json(self) -> Mapping[str, Mapping[str, Union[str, int, float, bool]]]:
         return {var: self.get(var).to_json() for var in self.variables()}
 
+    def snapshot(self) -> ConceptMapSnapshot:
+        """
+        Copies this answer into plain Python values, which are immutable, hashable and picklable, and stay readable
+        once the transaction closes.
+        """
+        return ConceptMapSnapshot.of(self)
+
     class Explainables(ABC):
 
+        __slots__ = ()
+
         @abstractmethod
         def relation(self, variable: str) -> ConceptMap.Explainable:
             pass
@@ -77,6 +95,8 @@ class ConceptMap(ABC):
 
     class Explainable(ABC):
 
+        __slots__ = ()
+
         @abstractmethod
         def conjunction(self) -> str:
             pass
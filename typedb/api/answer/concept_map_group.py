@@ -24,6 +24,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Iterator, TYPE_CHECKING
 
+from typedb.api.answer.snapshot import ConceptMapGroupSnapshot
+
 if TYPE_CHECKING:
     from typedb.api.answer.concept_map import ConceptMap
     from typedb.api.concept.concept import Concept
@@ -31,6 +33,8 @@ if TYPE_CHECKING:
 
 class ConceptMapGroup(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def owner(self) -> Concept:
         pass
@@ -38,3 +42,6 @@ class ConceptMapGroup(ABC):
     @abstractmethod
     def concept_maps(self) -> Iterator[ConceptMap]:
         pass
+
+    def snapshot(self) -> ConceptMapGroupSnapshot:
+        return ConceptMapGroupSnapshot.of(self)
@@ -19,11 +19,19 @@
 # under the License.
 #
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typedb.api.answer.snapshot import NumericSnapshot
 
 
 class Numeric(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def is_int(self) -> bool:
         pass
@@ -43,3 +51,8 @@ class Numeric(ABC):
     @abstractmethod
     def as_float(self) -> float:
         pass
+
+    def snapshot(self) -> NumericSnapshot:
+        # Imported here, as snapshots are themselves numerics
+        from typedb.api.answer.snapshot import NumericSnapshot
+        return NumericSnapshot.of(self)
@@ -24,6 +24,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from typedb.api.answer.snapshot import NumericGroupSnapshot
+
 if TYPE_CHECKING:
     from typedb.api.answer.numeric import Numeric
     from typedb.api.concept.concept import Concept
@@ -31,6 +33,8 @@ if TYPE_CHECKING:
 
 class NumericGroup(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def owner(self) -> Concept:
         pass
@@ -38,3 +42,6 @@ class NumericGroup(ABC):
     @abstractmethod
     def numeric(self) -> Numeric:
         pass
+
+    def snapshot(self) -> NumericGroupSnapshot:
+        return NumericGroupSnapshot.of(self)
@@ -0,0 +1,312 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterator, Mapping, Optional, Union, TYPE_CHECKING
+
+from typedb.api.answer.numeric import Numeric
+from typedb.common.exception import TypeDBClientExceptionExt, ILLEGAL_CAST, INVALID_CONCEPT_CASTING, \
+    VARIABLE_DOES_NOT_EXIST
+
+if TYPE_CHECKING:
+    from typedb.api.answer.concept_map import ConceptMap
+    from typedb.api.answer.concept_map_group import ConceptMapGroup
+    from typedb.api.answer.numeric_group import NumericGroup
+    from typedb.api.concept.concept import Concept
+    from typedb.api.concept.value.value import ValueType
+    from typedb.common.label import Label
+
+
+def _type_kind(concept: Concept) -> str:
+    if concept.is_entity_type():
+        return "entity_type"
+    elif concept.is_relation_type():
+        return "relation_type"
+    elif concept.is_attribute_type():
+        return "attribute_type"
+    elif concept.is_role_type():
+        return "role_type"
+    else:
+        return "thing_type"
+
+
+class _Snapshot:
+    """
+    An immutable record of plain Python values, compared and hashed by its fields and pickled by its constructor.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *fields):
+        for name, value in zip(self.__slots__, fields):
+            object.__setattr__(self, name, value)
+
+    def _fields(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def snapshot(self) -> _Snapshot:
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'%s' is immutable" % type(self).__name__)
+
+    def __delattr__(self, name):
+        raise AttributeError("'%s' is immutable" % type(self).__name__)
+
+    def __reduce__(self):
+        return type(self), self._fields()
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+        return type(other) is type(self) and other._fields() == self._fields()
+
+    def __hash__(self):
+        return hash((type(self).__name__,) + self._fields())
+
+    def __repr__(self):
+        return "%s(%s)" % (type(self).__name__,
+                           ", ".join("%s=%r" % (name.lstrip("_"), value)
+                                     for name, value in zip(self.__slots__, self._fields())))
+
+
+class ConceptSnapshot(_Snapshot):
+    """
+    A concept copied out of an answer. ``kind`` is one of ``thing_type``, ``entity_type``, ``relation_type``,
+    ``attribute_type``, ``role_type``, ``entity``, ``relation``, ``attribute`` or ``value``. The label is the type's
+    own label for types and the label of their type for things.
+    """
+
+    __slots__ = ("_kind", "_iid", "_label", "_value_type", "_value", "_inferred")
+
+    def __init__(self, kind: str, iid: Optional[str] = None, label: Optional[Label] = None,
+                 value_type: Optional[ValueType] = None, value: Union[bool, int, float, str, datetime, None] = None,
+                 inferred: Optional[bool] = None):
+        super().__init__(kind, iid, label, value_type, value, inferred)
+
+    @staticmethod
+    def of(concept: Concept) -> ConceptSnapshot:
+        if concept.is_type():
+            value_type = concept.as_attribute_type().get_value_type() if concept.is_attribute_type() else None
+            return ConceptSnapshot(_type_kind(concept), label=concept.as_type().get_label(), value_type=value_type)
+        elif concept.is_attribute():
+            attribute = concept.as_attribute()
+            return ConceptSnapshot("attribute", attribute.get_iid(), attribute.get_type().get_label(),
+                                   attribute.get_value_type(), attribute.get_value(), attribute.is_inferred())
+        elif concept.is_thing():
+            thing = concept.as_thing()
+            return ConceptSnapshot("entity" if concept.is_entity() else "relation", thing.get_iid(),
+                                   thing.get_type().get_label(), inferred=thing.is_inferred())
+        else:
+            value = concept.as_value()
+            return ConceptSnapshot("value", value_type=value.get_value_type(), value=value.get())
+
+    @property
+    def kind(self) -> str:
+        return self._kind
+
+    @property
+    def iid(self) -> Optional[str]:
+        return self._iid
+
+    @property
+    def label(self) -> Optional[Label]:
+        return self._label
+
+    @property
+    def value_type(self) -> Optional[ValueType]:
+        return self._value_type
+
+    @property
+    def value(self) -> Union[bool, int, float, str, datetime, None]:
+        return self._value
+
+    @property
+    def inferred(self) -> Optional[bool]:
+        return self._inferred
+
+    def is_type(self) -> bool:
+        return self._kind.endswith("_type")
+
+    def is_thing(self) -> bool:
+        return self._kind in ("entity", "relation", "attribute")
+
+    def is_entity(self) -> bool:
+        return self._kind == "entity"
+
+    def is_relation(self) -> bool:
+        return self._kind == "relation"
+
+    def is_attribute(self) -> bool:
+        return self._kind == "attribute"
+
+    def is_value(self) -> bool:
+        return self._kind == "value"
+
+    def get_iid(self) -> Optional[str]:
+        return self._iid
+
+    def get_label(self) -> Optional[Label]:
+        return self._label
+
+    def get_value(self) -> Union[bool, int, float, str, datetime]:
+        if not (self.is_attribute() or self.is_value()):
+            raise TypeDBClientExceptionExt.of(INVALID_CONCEPT_CASTING, (type(self).__name__, "Value"))
+        return self._value
+
+    def is_inferred(self) -> bool:
+        return bool(self._inferred)
+
+    def to_json(self) -> Mapping[str, Union[str, int, float, bool]]:
+        if self.is_type():
+            return {"label": self._label.scoped_name()}
+        if self.is_entity() or self.is_relation():
+            return {"type": self._label.name}
+        value = {"value_type": str(self._value_type),
+                 "value": self._value.isoformat(timespec="milliseconds") if isinstance(self._value, datetime)
+                 else self._value}
+        return {"type": self._label.scoped_name()} | value if self.is_attribute() else value
+
+
+class ConceptMapSnapshot(_Snapshot):
+    """
+    The concepts of a concept map, bound to its variables in the order the answer listed them.
+    """
+
+    __slots__ = ("_bindings",)
+
+    def __init__(self, bindings: tuple[tuple[str, ConceptSnapshot], ...]):
+        super().__init__(tuple(bindings))
+
+    @staticmethod
+    def of(concept_map: ConceptMap) -> ConceptMapSnapshot:
+        return ConceptMapSnapshot(tuple((variable, ConceptSnapshot.of(concept_map.get(variable)))
+                                        for variable in concept_map.variables()))
+
+    def variables(self) -> Iterator[str]:
+        return (variable for variable, _ in self._bindings)
+
+    def concepts(self) -> Iterator[ConceptSnapshot]:
+        return (concept for _, concept in self._bindings)
+
+    def get(self, variable: str) -> ConceptSnapshot:
+        for bound, concept in self._bindings:
+            if bound == variable:
+                return concept
+        raise TypeDBClientExceptionExt.of(VARIABLE_DOES_NOT_EXIST, variable)
+
+    def get_value(self, variable: str) -> Union[bool, int, float, str, datetime]:
+        return self.get(variable).get_value()
+
+    def to_json(self) -> Mapping[str, Mapping[str, Union[str, int, float, bool]]]:
+        return {variable: concept.to_json() for variable, concept in self._bindings}
+
+
+class NumericSnapshot(_Snapshot, Numeric):
+    """
+    An aggregate's value, which is None when it is not a number; it compares equal to the numeric it was copied from.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Union[int, float, None]):
+        super().__init__(value)
+
+    @staticmethod
+    def of(numeric: Numeric) -> NumericSnapshot:
+        if numeric.is_int():
+            return NumericSnapshot(numeric.as_int())
+        elif numeric.is_float():
+            return NumericSnapshot(numeric.as_float())
+        else:
+            return NumericSnapshot(None)
+
+    def is_int(self) -> bool:
+        return isinstance(self._value, int)
+
+    def is_float(self) -> bool:
+        return isinstance(self._value, float)
+
+    def is_nan(self) -> bool:
+        return self._value is None
+
+    def as_int(self) -> int:
+        if not self.is_int():
+            raise TypeDBClientExceptionExt.of(ILLEGAL_CAST, "int")
+        return self._value
+
+    def as_float(self) -> float:
+        if not self.is_float():
+            raise TypeDBClientExceptionExt.of(ILLEGAL_CAST, "float")
+        return self._value
+
+    def __eq__(self, other):
+        if not (other and isinstance(other, Numeric)):
+            return False
+        if self.is_nan() and other.is_nan():
+            return True
+        if self.is_int() and other.is_int() and self.as_int() == other.as_int():
+            return True
+        if self.is_float() and other.is_float() and self.as_float() == other.as_float():
+            return True
+        return False
+
+    def __hash__(self):
+        return 0 if self._value is None else hash(self._value)
+
+
+class ConceptMapGroupSnapshot(_Snapshot):
+
+    __slots__ = ("_owner", "_concept_maps")
+
+    def __init__(self, owner: ConceptSnapshot, concept_maps: tuple[ConceptMapSnapshot, ...]):
+        super().__init__(owner, tuple(concept_maps))
+
+    @staticmethod
+    def of(group: ConceptMapGroup) -> ConceptMapGroupSnapshot:
+        return ConceptMapGroupSnapshot(ConceptSnapshot.of(group.owner()),
+                                       tuple(map(ConceptMapSnapshot.of, group.concept_maps())))
+
+    def owner(self) -> ConceptSnapshot:
+        return self._owner
+
+    def concept_maps(self) -> Iterator[ConceptMapSnapshot]:
+        return iter(self._concept_maps)
+
+
+class NumericGroupSnapshot(_Snapshot):
+
+    __slots__ = ("_owner", "_numeric")
+
+    def __init__(self, owner: ConceptSnapshot, numeric: NumericSnapshot):
+        super().__init__(owner, numeric)
+
+    @staticmethod
+    def of(group: NumericGroup) -> NumericGroupSnapshot:
+        return NumericGroupSnapshot(ConceptSnapshot.of(group.owner()), NumericSnapshot.of(group.numeric()))
+
+    def owner(self) -> ConceptSnapshot:
+        return self._owner
+
+    def numeric(self) -> NumericSnapshot:
+        return self._numeric
@@ -25,6 +25,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Mapping, Union, TYPE_CHECKING
 
+from typedb.api.answer.snapshot import ConceptSnapshot
 from typedb.common.exception import TypeDBClientExceptionExt, INVALID_CONCEPT_CASTING
 
 if TYPE_CHECKING:
@@ -43,6 +44,8 @@ if TYPE_CHECKING:
 
 class Concept(ABC):
 
+    __slots__ = ()
+
     def is_type(self) -> bool:
         return False
 
@@ -112,3 +115,6 @@ class Concept(ABC):
     @abstractmethod
     def to_json(self) -> Mapping[str, Union[str, int, float, bool, datetime]]:
         pass
+
+    def snapshot(self) -> ConceptSnapshot:
+        return ConceptSnapshot.of(self)
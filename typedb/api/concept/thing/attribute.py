@@ -36,6 +36,8 @@ if TYPE_CHECKING:
 
 class Attribute(Thing, ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def get_type(self) -> AttributeType:
         pass
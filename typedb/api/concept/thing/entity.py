@@ -32,6 +32,8 @@ if TYPE_CHECKING:
 
 class Entity(Thing, ABC):
 
+    __slots__ = ()
+
     def is_entity(self) -> bool:
         return True
 
@@ -34,6 +34,8 @@ if TYPE_CHECKING:
 
 class Relation(Thing, ABC):
 
+    __slots__ = ()
+
     def is_relation(self) -> bool:
         return True
 
@@ -27,6 +27,8 @@ from typedb.native_client_wrapper import Annotation as NativeAnnotation, annotat
 
 class Annotation:
 
+    __slots__ = ("_native_object",)
+
     def __init__(self, annotation: NativeAnnotation):
         self._native_object = annotation
 
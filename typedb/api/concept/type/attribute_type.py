@@ -38,6 +38,8 @@ if TYPE_CHECKING:
 
 class AttributeType(ThingType, ABC):
 
+    __slots__ = ()
+
     def get_value_type(self) -> ValueType:
         return ValueType.OBJECT
 
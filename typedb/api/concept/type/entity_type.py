@@ -34,6 +34,8 @@ if TYPE_CHECKING:
 
 class EntityType(ThingType, ABC):
 
+    __slots__ = ()
+
     def is_entity_type(self):
         return True
 
@@ -37,6 +37,8 @@ if TYPE_CHECKING:
 
 class RoleType(Type, ABC):
 
+    __slots__ = ()
+
     def is_role_type(self) -> bool:
         return True
 
@@ -34,6 +34,8 @@ from typedb.common.exception import TypeDBClientExceptionExt, UNEXPECTED_NATIVE_
 
 class Value(Concept, ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def get_value_type(self) -> ValueType:
         pass
@@ -131,6 +133,10 @@ class ValueType(Enum):
     def __repr__(self):
         return str(self)
 
+    def __reduce_ex__(self, protocol):
+        # Members hold native objects, so they are pickled by name
+        return getattr, (ValueType, self.name)
+
     @staticmethod
     def of(value_type: Union[Object, Boolean, Long, Double, String, DateTime]) -> ValueType:
         for type_ in ValueType:
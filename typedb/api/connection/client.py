@@ -22,15 +22,29 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from enum import Enum
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typedb.api.connection.database import DatabaseManager
     from typedb.api.connection.options import TypeDBOptions
+    from typedb.api.connection.result_cache import ResultCache
     from typedb.api.connection.session import TypeDBSession, SessionType
+    from typedb.api.connection.session_pool import SessionPool
     from typedb.api.user.user import UserManager, User
 
 
+class LoadBalancing(Enum):
+    ROUND_ROBIN = 0
+    LEAST_LOADED = 1
+
+    def is_round_robin(self):
+        return self is LoadBalancing.ROUND_ROBIN
+
+    def is_least_loaded(self):
+        return self is LoadBalancing.LEAST_LOADED
+
+
 class TypeDBClient(ABC):
 
     @abstractmethod
@@ -47,6 +61,19 @@ class TypeDBClient(ABC):
                 ) -> TypeDBSession:
         pass
 
+    @property
+    @abstractmethod
+    def session_pool(self) -> SessionPool:
+        pass
+
+    @property
+    @abstractmethod
+    def result_cache(self) -> Optional[ResultCache]:
+        """
+        The cache of read query answers, if the client was opened with a result cache size.
+        """
+        pass
+
     @abstractmethod
     def close(self) -> None:
         pass
@@ -19,6 +19,7 @@
 # under the License.
 #
 
+from hashlib import sha256
 from typing import Optional
 
 from typedb.native_client_wrapper import credential_new, Credential as NativeCredential
@@ -34,7 +35,13 @@ class TypeDBCredential(NativeWrapper[NativeCredential]):
         if tls_root_ca_path is not None and not tls_enabled:
             raise TypeDBClientExceptionExt.of(CLUSTER_CREDENTIAL_INCONSISTENT)
         super().__init__(credential_new(username, password, tls_root_ca_path, tls_enabled))
+        self._identity = (username, sha256(password.encode()).hexdigest(), tls_root_ca_path, tls_enabled)
 
     @property
     def _native_object_not_owned_exception(self) -> TypeDBClientExceptionExt:
         return TypeDBClientExceptionExt.of(ILLEGAL_STATE)
+
+    @property
+    def _identity_key(self) -> tuple:
+        # Equal for credentials built from the same arguments; the password is only kept as a digest
+        return self._identity
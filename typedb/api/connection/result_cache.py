@@ -0,0 +1,55 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class ResultCache(ABC):
+    """
+    Answers to ``match``, ``match_aggregate``, ``match_group`` and ``match_group_aggregate`` queries run with
+    ``cached=True`` in read transactions, kept by a client and keyed by database, query and options. A commit through
+    the client drops the answers for its database; commits through other clients are only seen once an answer expires.
+    Answers are kept as snapshots, so cached queries return snapshots, as if ``detached`` was set.
+    """
+
+    @property
+    @abstractmethod
+    def hits(self) -> int:
+        pass
+
+    @property
+    @abstractmethod
+    def misses(self) -> int:
+        pass
+
+    @abstractmethod
+    def invalidate(self, database: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
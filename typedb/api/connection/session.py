@@ -30,6 +30,7 @@ from typedb.native_client_wrapper import Data, Schema
 if TYPE_CHECKING:
     from typedb.api.connection.options import TypeDBOptions
     from typedb.api.connection.transaction import TypeDBTransaction, TransactionType
+    from typedb.api.connection.transaction_pool import ReadTransactionPool
 
 
 class SessionType(Enum):
@@ -64,7 +65,21 @@ class TypeDBSession(ABC):
         pass
 
     @abstractmethod
-    def transaction(self, transaction_type: TransactionType, options: TypeDBOptions = None) -> TypeDBTransaction:
+    def transaction(self, transaction_type: TransactionType, options: TypeDBOptions = None, *,
+                    identity_map: bool = False) -> TypeDBTransaction:
+        pass
+
+    @abstractmethod
+    def read_transaction_pool(self, size: int, options: TypeDBOptions = None) -> ReadTransactionPool:
+        """
+        Keeps ``size`` read transactions open on this session, replacing them in the background as they close or
+        approach their transaction timeout. The pool is closed with the session.
+
+        A read transaction sees the data as of when it was opened, and a pooled one is only replaced once it reaches
+        80% of the transaction timeout (``transaction_timeout_millis``, 5 minutes by default). Reads through the pool
+        can therefore miss commits made up to 4 minutes earlier by default; lower the transaction timeout in
+        ``options`` to tighten that bound, or open a transaction directly for reads that must see the latest commits.
+        """
         pass
 
     @abstractmethod
@@ -0,0 +1,58 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import ContextManager, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typedb.api.connection.options import TypeDBOptions
+    from typedb.api.connection.session import TypeDBSession, SessionType
+
+
+class SessionPool(ABC):
+
+    @abstractmethod
+    def session(self, database: str, session_type: SessionType, options: Optional[TypeDBOptions] = None,
+                timeout: Optional[float] = None) -> ContextManager[TypeDBSession]:
+        """
+        Lends an open session for the given database, session type and options, returning it to the pool when the
+        context exits. Waits up to ``timeout`` seconds, or indefinitely if it is None, for a session when the pool
+        is at its maximum size.
+
+        **Examples**
+
+        - ``with client.session_pool.session("typedb", SessionType.DATA) as session: ...``
+        """
+        pass
+
+    @abstractmethod
+    def evict_idle(self) -> None:
+        """
+        Closes the sessions that have been idle for longer than their session idle timeout, keeping at least the
+        minimum number of sessions open for each database, session type and options.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
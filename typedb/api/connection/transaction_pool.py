@@ -0,0 +1,81 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import ContextManager, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typedb.api.connection.transaction import TypeDBTransaction
+
+
+class TransactionPoolMetrics:
+    """
+    A hit is a transaction lent without waiting; a miss had to wait for one to be opened or returned.
+    """
+
+    def __init__(self, hits: int, misses: int, total_wait_seconds: float, max_wait_seconds: float, recycled: int):
+        self.hits = hits
+        self.misses = misses
+        self.total_wait_seconds = total_wait_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self.recycled = recycled
+
+    def __repr__(self):
+        return "TransactionPoolMetrics(hits=%d, misses=%d, total_wait_seconds=%.6f, max_wait_seconds=%.6f, " \
+               "recycled=%d)" % (self.hits, self.misses, self.total_wait_seconds, self.max_wait_seconds,
+                                 self.recycled)
+
+
+class ReadTransactionPool(ABC):
+    """
+    Read transactions are kept open for up to 80% of the transaction timeout, so a lent transaction may not see
+    commits made since it was opened: up to 4 minutes earlier with the default 5 minute timeout.
+    """
+
+    @abstractmethod
+    def transaction(self, timeout: Optional[float] = None) -> ContextManager[TypeDBTransaction]:
+        """
+        Lends an open read transaction, returning it to the pool when the context exits. Waits up to ``timeout``
+        seconds, or indefinitely if it is None, when every transaction is lent out or still opening.
+
+        **Examples**
+
+        - ``with pool.transaction() as tx: tx.query.match(query)``
+        """
+        pass
+
+    @abstractmethod
+    def metrics(self) -> TransactionPoolMetrics:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def __enter__(self):
+        pass
+
+    @abstractmethod
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
@@ -31,6 +31,8 @@ if TYPE_CHECKING:
 
 class Explanation(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def rule(self) -> Rule:
         pass
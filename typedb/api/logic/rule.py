@@ -30,6 +30,8 @@ if TYPE_CHECKING:
 
 class Rule(ABC):
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def label(self) -> str:
@@ -22,39 +22,87 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional, TYPE_CHECKING
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Mapping, Optional, TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
+    from typedb.api.answer.concept_column import ConceptColumn
     from typedb.api.answer.concept_map import ConceptMap
     from typedb.api.answer.concept_map_group import ConceptMapGroup
     from typedb.api.answer.numeric import Numeric
     from typedb.api.answer.numeric_group import NumericGroup
+    from typedb.api.answer.snapshot import ConceptMapGroupSnapshot, ConceptMapSnapshot, NumericGroupSnapshot
     from typedb.api.connection.options import TypeDBOptions
     from typedb.api.logic.explanation import Explanation
+    from typedb.query.template import QueryTemplate
 
 
 class QueryManager(ABC):
 
     @abstractmethod
-    def match(self, query: str, options: Optional[TypeDBOptions] = None) -> Iterator[ConceptMap]:
+    def match(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+              cached: bool = False) -> Iterator[Union[ConceptMap, ConceptMapSnapshot]]:
+        """
+        Runs a match query. With ``detached``, every answer is read before returning and copied into a
+        ``ConceptMapSnapshot``, which outlives the transaction and can be pickled. ``match_aggregate``, ``match_group``
+        and ``match_group_aggregate`` take ``detached`` in the same way, returning a ``NumericSnapshot``,
+        ``ConceptMapGroupSnapshot`` or ``NumericGroupSnapshot`` respectively.
+
+        With ``cached``, the answers are snapshots as with ``detached``, and in a read transaction of a client with a
+        result cache they are taken from the cache, or streamed and cached as they are read. Queries whose options
+        enable ``explain`` are never cached.
+
+        **Examples**
+
+        - ``answers = list(tx.query.match("match $p isa person;", detached=True))``
+        - ``count = tx.query.match_aggregate("match $p isa person; count;", cached=True)``
+        """
+        pass
+
+    @abstractmethod
+    def match_values(self, query: str, options: Optional[TypeDBOptions] = None
+                     ) -> Iterator[dict[str, Union[bool, int, float, str, datetime]]]:
+        pass
+
+    @abstractmethod
+    def match_columns(self, query: str, variables: Optional[Iterable[str]] = None,
+                      options: Optional[TypeDBOptions] = None) -> dict[str, ConceptColumn]:
         pass
 
     @abstractmethod
-    def match_aggregate(self, query: str, options: Optional[TypeDBOptions] = None) -> Numeric:
+    def match_aggregate(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+                        cached: bool = False) -> Numeric:
         pass
 
     @abstractmethod
-    def match_group(self, query: str, options: Optional[TypeDBOptions] = None) -> Iterator[ConceptMapGroup]:
+    def match_group(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+                    cached: bool = False) -> Iterator[Union[ConceptMapGroup, ConceptMapGroupSnapshot]]:
         pass
 
     @abstractmethod
-    def match_group_aggregate(self, query: str, options: Optional[TypeDBOptions] = None) -> Iterator[NumericGroup]:
+    def match_group_aggregate(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+                              cached: bool = False) -> Iterator[Union[NumericGroup, NumericGroupSnapshot]]:
         pass
 
     @abstractmethod
     def insert(self, query: str, options: Optional[TypeDBOptions] = None) -> Iterator[ConceptMap]:
         pass
 
+    @abstractmethod
+    def insert_many(self, template: Union[str, QueryTemplate], rows: Iterable[Mapping[str, Any]],
+                    batch_size: int = 100, options: Optional[TypeDBOptions] = None, *, wrap_answers: bool = False
+                    ) -> Union[int, list[ConceptMap]]:
+        """
+        Runs ``template`` once per row, with every ``{name}`` parameter bound to the TypeQL literal of
+        ``row[name]``. Up to ``batch_size`` inserts are sent before their answers are awaited. Returns the number of
+        answers, or the answers themselves if ``wrap_answers`` is set.
+
+        **Examples**
+
+        - ``tx.query.insert_many('insert $p isa person, has name {name};', [{"name": "Alice"}, {"name": "Bob"}])``
+        """
+        pass
+
     @abstractmethod
     def delete(self, query: str, options: Optional[TypeDBOptions] = None) -> None:
         pass
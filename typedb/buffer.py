@@ -0,0 +1,318 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from mmap import mmap, ACCESS_READ
+from struct import Struct
+from tempfile import TemporaryFile
+from typing import Iterable, Iterator, Optional, Union, TYPE_CHECKING
+
+from typedb.api.answer.snapshot import ConceptMapSnapshot, ConceptSnapshot
+from typedb.api.concept.value.value import ValueType
+from typedb.common.exception import TypeDBClientExceptionExt, ANSWER_BUFFER_CLOSED
+from typedb.common.label import Label
+
+if TYPE_CHECKING:
+    from typedb.api.answer.concept_map import ConceptMap
+
+_END = Struct("<Q")
+_DOUBLE = Struct("<d")
+_EPOCH = datetime(1970, 1, 1)
+_VALUE_TYPES = tuple(ValueType)
+_VALUE_TYPE_IDS = {value_type: i for i, value_type in enumerate(_VALUE_TYPES)}
+
+# A concept is written as its kind, a byte of flags, then each field that its flags mark as present. The top three bits
+# of the flags hold the tag of its value's Python type.
+_HAS_IID = 0x01
+_HAS_LABEL = 0x02
+_HAS_VALUE_TYPE = 0x04
+_HAS_INFERRED = 0x08
+_INFERRED = 0x10
+_VALUE_TAG_SHIFT = 5
+
+_BOOLEAN_TAG = 1
+_INTEGER_TAG = 2
+_FLOAT_TAG = 3
+_STRING_TAG = 4
+_DATETIME_TAG = 5
+_VALUE_TAGS = {bool: _BOOLEAN_TAG, int: _INTEGER_TAG, float: _FLOAT_TAG, str: _STRING_TAG, datetime: _DATETIME_TAG}
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: mmap, position: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def _write_signed(out: bytearray, value: int) -> None:
+    _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _read_signed(data: mmap, position: int) -> tuple[int, int]:
+    value, position = _read_varint(data, position)
+    return (value >> 1 if not value & 1 else -((value + 1) >> 1)), position
+
+
+def _write_bytes(out: bytearray, value: bytes) -> None:
+    _write_varint(out, len(value))
+    out += value
+
+
+def _read_string(data: mmap, position: int) -> tuple[str, int]:
+    length, position = _read_varint(data, position)
+    return data[position:position + length].decode(), position + length
+
+
+def _write_value(out: bytearray, tag: int, value: Union[bool, int, float, str, datetime]) -> None:
+    if tag == _BOOLEAN_TAG:
+        out.append(value)
+    elif tag == _INTEGER_TAG:
+        _write_signed(out, value)
+    elif tag == _FLOAT_TAG:
+        out += _DOUBLE.pack(value)
+    elif tag == _STRING_TAG:
+        _write_bytes(out, value.encode())
+    else:
+        _write_signed(out, (value - _EPOCH) // timedelta(microseconds=1))
+
+
+def _read_value(data: mmap, position: int, tag: int) -> tuple[Union[bool, int, float, str, datetime], int]:
+    if tag == _BOOLEAN_TAG:
+        return bool(data[position]), position + 1
+    elif tag == _INTEGER_TAG:
+        return _read_signed(data, position)
+    elif tag == _FLOAT_TAG:
+        return _DOUBLE.unpack_from(data, position)[0], position + _DOUBLE.size
+    elif tag == _STRING_TAG:
+        return _read_string(data, position)
+    else:
+        microseconds, position = _read_signed(data, position)
+        return _EPOCH + timedelta(microseconds=microseconds), position
+
+
+class _Table:
+    """
+    Values that repeat across answers, such as variables, kinds and labels, written to the buffer as their index here.
+    """
+
+    def __init__(self):
+        self._values = []
+        self._ids = {}
+
+    def id(self, value) -> int:
+        if (id_ := self._ids.get(value)) is None:
+            id_ = self._ids[value] = len(self._values)
+            self._values.append(value)
+        return id_
+
+    def __getitem__(self, id_: int):
+        return self._values[id_]
+
+
+class AnswerBuffer(Sequence):
+    """
+    Snapshots of concept map answers spilled to a temporary file, which is memory-mapped to read them back, so that
+    large results can be traversed any number of times, in any order, without re-running their query or holding them
+    in memory. Each answer is written in a compact binary layout, with variables, kinds and labels stored once in
+    memory and referred to by their index. Indexing an answer reads it from the file, so iterating in order is faster
+    than random access.
+
+    The files are deleted when the buffer is closed, or garbage collected.
+
+    **Examples**
+
+    - ``answers = AnswerBuffer(tx.query.match("match $p isa person, has age $a;"))``
+    - ``mean = sum(answer.get_value("a") for answer in answers) / len(answers)``
+    """
+
+    def __init__(self, answers: Iterable[Union[ConceptMap, ConceptMapSnapshot]] = (), *,
+                 directory: Optional[str] = None):
+        self._data = TemporaryFile(dir=directory)
+        self._ends = TemporaryFile(dir=directory)
+        self._strings = _Table()
+        self._labels = _Table()
+        self._size = 0
+        self._count = 0
+        self._mapped_count = 0
+        self._data_view: Optional[mmap] = None
+        self._ends_view: Optional[mmap] = None
+        self._closed = False
+        self.extend(answers)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The size of the buffered answers on disk, excluding the index of their positions.
+        """
+        return self._size
+
+    def append(self, answer: Union[ConceptMap, ConceptMapSnapshot]) -> None:
+        if self._closed:
+            raise TypeDBClientExceptionExt.of(ANSWER_BUFFER_CLOSED)
+        record = self._encode(answer.snapshot())
+        self._data.write(record)
+        self._size += len(record)
+        self._ends.write(_END.pack(self._size))
+        self._count += 1
+
+    def extend(self, answers: Iterable[Union[ConceptMap, ConceptMapSnapshot]]) -> int:
+        """
+        Buffers every answer, returning the number of answers added.
+        """
+        count = self._count
+        for answer in answers:
+            self.append(answer)
+        return self._count - count
+
+    def _encode(self, answer: ConceptMapSnapshot) -> bytearray:
+        bindings = list(zip(answer.variables(), answer.concepts()))
+        out = bytearray()
+        _write_varint(out, len(bindings))
+        for variable, concept in bindings:
+            _write_varint(out, self._strings.id(variable))
+            _write_varint(out, self._strings.id(concept.kind))
+            tag = _VALUE_TAGS[type(concept.value)] if concept.value is not None else 0
+            flags = tag << _VALUE_TAG_SHIFT
+            if concept.iid is not None:
+                flags |= _HAS_IID
+            if concept.label is not None:
+                flags |= _HAS_LABEL
+            if concept.value_type is not None:
+                flags |= _HAS_VALUE_TYPE
+            if concept.inferred is not None:
+                flags |= _HAS_INFERRED | (_INFERRED if concept.inferred else 0)
+            out.append(flags)
+            if concept.iid is not None:
+                self._write_iid(out, concept.iid)
+            if concept.label is not None:
+                _write_varint(out, self._labels.id(concept.label))
+            if concept.value_type is not None:
+                out.append(_VALUE_TYPE_IDS[concept.value_type])
+            if tag:
+                _write_value(out, tag, concept.value)
+        return out
+
+    @staticmethod
+    def _write_iid(out: bytearray, iid: str) -> None:
+        # IIDs are hexadecimal, so are written as the bytes they spell; the low bit of the length marks any other text
+        try:
+            raw = bytes.fromhex(iid[2:]) if iid.startswith("0x") else None
+        except ValueError:
+            raw = None
+        if raw is not None and "0x" + raw.hex() == iid:
+            _write_varint(out, len(raw) << 1)
+            out += raw
+        else:
+            raw = iid.encode()
+            _write_varint(out, len(raw) << 1 | 1)
+            out += raw
+
+    def _decode(self, data: mmap, position: int) -> tuple[ConceptMapSnapshot, int]:
+        count, position = _read_varint(data, position)
+        bindings = []
+        for _ in range(count):
+            variable, position = _read_varint(data, position)
+            kind, position = _read_varint(data, position)
+            flags = data[position]
+            position += 1
+            iid = label = value_type = value = inferred = None
+            if flags & _HAS_IID:
+                length, position = _read_varint(data, position)
+                raw = data[position:position + (length >> 1)]
+                position += length >> 1
+                iid = raw.decode() if length & 1 else "0x" + raw.hex()
+            if flags & _HAS_LABEL:
+                id_, position = _read_varint(data, position)
+                label = self._labels[id_]
+            if flags & _HAS_VALUE_TYPE:
+                value_type = _VALUE_TYPES[data[position]]
+                position += 1
+            if flags & _HAS_INFERRED:
+                inferred = bool(flags & _INFERRED)
+            if tag := flags >> _VALUE_TAG_SHIFT:
+                value, position = _read_value(data, position, tag)
+            bindings.append((self._strings[variable],
+                             ConceptSnapshot(self._strings[kind], iid, label, value_type, value, inferred)))
+        return ConceptMapSnapshot(tuple(bindings)), position
+
+    def _views(self) -> tuple[Optional[mmap], Optional[mmap]]:
+        if self._closed:
+            raise TypeDBClientExceptionExt.of(ANSWER_BUFFER_CLOSED)
+        if self._mapped_count != self._count:
+            # Earlier views stay valid for the answers they cover, so iterators already reading them are unaffected
+            self._data.flush()
+            self._ends.flush()
+            self._data_view = mmap(self._data.fileno(), self._size, access=ACCESS_READ)
+            self._ends_view = mmap(self._ends.fileno(), self._count * _END.size, access=ACCESS_READ)
+            self._mapped_count = self._count
+        return self._data_view, self._ends_view
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ConceptMapSnapshot, list[ConceptMapSnapshot]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("answer buffer index out of range")
+        data, ends = self._views()
+        start = _END.unpack_from(ends, (index - 1) * _END.size)[0] if index else 0
+        return self._decode(data, start)[0]
+
+    def __iter__(self) -> Iterator[ConceptMapSnapshot]:
+        data, _ = self._views()
+        count, position = self._mapped_count, 0
+        for _ in range(count):
+            answer, position = self._decode(data, position)
+            yield answer
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._data_view = self._ends_view = None
+        self._data.close()
+        self._ends.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_tb is not None:
+            return False
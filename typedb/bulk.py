@@ -0,0 +1,237 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from collections import deque
+from itertools import islice
+from queue import Queue
+from random import uniform
+from threading import Event, Lock, Thread
+from time import perf_counter, sleep
+from typing import Any, Iterable, Mapping, Optional, Union
+
+from typedb.native_client_wrapper import TypeDBClientException
+
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.connection.session import TypeDBSession
+from typedb.api.connection.transaction import TransactionType
+from typedb.common.exception import TypeDBClientExceptionExt, NON_NEGATIVE_VALUE_REQUIRED, POSITIVE_VALUE_REQUIRED
+from typedb.query.template import QueryTemplate, compile_template
+
+# Transaction errors, among them commit conflicts between concurrent writes, can succeed when the batch is written
+# again; syntax, schema and other query errors fail the same way every time
+_RETRYABLE_ERROR_PREFIXES = ("TXN",)
+_ERROR_CODE = re.compile(r"\[([A-Z]{3})\d+]")
+
+
+def _is_retryable(error: TypeDBClientException) -> bool:
+    code = _ERROR_CODE.search(str(error))
+    return code is not None and code.group(1) in _RETRYABLE_ERROR_PREFIXES
+
+
+class LatencyHistogram:
+    """
+    Counts latencies in buckets whose upper bounds double from one millisecond, with a final unbounded bucket.
+    """
+
+    BOUNDS_SECONDS = tuple(0.001 * 2 ** exponent for exponent in range(17))
+
+    def __init__(self):
+        self._counts = [0] * (len(self.BOUNDS_SECONDS) + 1)
+        self._count = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        self._counts[bisect_left(self.BOUNDS_SECONDS, seconds)] += 1
+        self._count += 1
+        self._total_seconds += seconds
+        self._max_seconds = max(self._max_seconds, seconds)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_seconds(self) -> float:
+        return self._total_seconds / self._count if self._count else 0.0
+
+    @property
+    def max_seconds(self) -> float:
+        return self._max_seconds
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """
+        Returns the upper bound in seconds and count of every bucket, the last bound being infinite.
+        """
+        return list(zip(self.BOUNDS_SECONDS + (float("inf"),), self._counts))
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Returns the upper bound of the bucket holding the given fraction of latencies, at most the largest latency.
+        """
+        if not self._count:
+            return 0.0
+        rank = fraction * self._count
+        seen = 0
+        for bound, count in zip(self.BOUNDS_SECONDS, self._counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self._max_seconds)
+        return self._max_seconds
+
+    def __repr__(self):
+        return "LatencyHistogram(count=%d, mean_seconds=%.6f, p99_seconds=%.6f, max_seconds=%.6f)" % \
+               (self._count, self.mean_seconds, self.percentile(0.99), self._max_seconds)
+
+
+class LoadMetrics:
+    """
+    A retry is a batch written again after its transaction failed; a batch fails once it runs out of retries.
+    """
+
+    def __init__(self):
+        self.operations = 0
+        self.batches = 0
+        self.retries = 0
+        self.failed_operations = 0
+        self.failed_batches = 0
+        self.errors: list[Exception] = []
+        self.elapsed_seconds = 0.0
+        self.commit_latency = LatencyHistogram()
+
+    @property
+    def throughput(self) -> float:
+        """
+        Committed operations per second.
+        """
+        return self.operations / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def __repr__(self):
+        return "LoadMetrics(operations=%d, batches=%d, retries=%d, failed_operations=%d, failed_batches=%d, " \
+               "elapsed_seconds=%.3f, throughput=%.1f, commit_latency=%r)" % \
+               (self.operations, self.batches, self.retries, self.failed_operations, self.failed_batches,
+                self.elapsed_seconds, self.throughput, self.commit_latency)
+
+
+class Loader:
+    """
+    Writes a stream of insert queries, or of rows bound to a query template, over worker threads that each commit a
+    write transaction on the shared session every ``batch_size`` operations. Batches are committed in no particular
+    order. A batch whose transaction fails, as on a commit conflict, is written again in a new transaction, after an
+    exponential backoff with jitter, up to ``max_retries`` times. A batch that fails on an error in its queries, such
+    as a syntax or schema error, is not retried.
+
+    **Examples**
+
+    - ``Loader(session, workers=8, template="insert $p isa person, has name {name};").load(rows)``
+    """
+
+    def __init__(self, session: TypeDBSession, workers: int = 4, batch_size: int = 100, *,
+                 template: Optional[Union[str, QueryTemplate]] = None, max_retries: int = 5,
+                 backoff_seconds: float = 0.05, max_backoff_seconds: float = 5.0,
+                 options: Optional[TypeDBOptions] = None):
+        if workers < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, workers)
+        if batch_size < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, batch_size)
+        if max_retries < 0:
+            raise TypeDBClientExceptionExt.of(NON_NEGATIVE_VALUE_REQUIRED, max_retries)
+        self._session = session
+        self._workers = workers
+        self._batch_size = batch_size
+        self._render = compile_template(template)._render if template else None
+        self._max_retries = max_retries
+        self._backoff_seconds = backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._options = options
+        self._metrics_lock = Lock()
+
+    def load(self, operations: Iterable[Union[str, Mapping[str, Any]]]) -> LoadMetrics:
+        """
+        Writes every operation, returning once all are committed or have failed. Failures are counted in the returned
+        metrics rather than raised; an exception raised by ``operations`` itself is re-raised once the workers stop.
+        """
+        metrics = LoadMetrics()
+        batches: Queue[Optional[list]] = Queue(maxsize=self._workers * 2)
+        stopped = Event()
+        workers = [Thread(target=self._work, args=(batches, metrics, stopped), name="typedb-bulk-loader", daemon=True)
+                   for _ in range(self._workers)]
+        start = perf_counter()
+        for worker in workers:
+            worker.start()
+        try:
+            operations = iter(operations)
+            while batch := list(islice(operations, self._batch_size)):
+                batches.put(batch)
+        except BaseException:
+            stopped.set()
+            raise
+        finally:
+            for _ in workers:
+                batches.put(None)
+            for worker in workers:
+                worker.join()
+            metrics.elapsed_seconds = perf_counter() - start
+        return metrics
+
+    def _work(self, batches: Queue[Optional[list]], metrics: LoadMetrics, stopped: Event) -> None:
+        while (batch := batches.get()) is not None:
+            if not stopped.is_set():
+                self._load_batch(batch, metrics)
+
+    def _load_batch(self, batch: list, metrics: LoadMetrics) -> None:
+        retries = 0
+        try:
+            queries = [self._render(row) for row in batch] if self._render else batch
+            while True:
+                try:
+                    latency = self._write(queries)
+                    break
+                except TypeDBClientException as e:
+                    if not _is_retryable(e) or retries == self._max_retries or not self._session.is_open():
+                        raise
+                    sleep(min(self._max_backoff_seconds, self._backoff_seconds * 2 ** retries) * uniform(0.5, 1.0))
+                    retries += 1
+        except Exception as e:
+            with self._metrics_lock:
+                metrics.retries += retries
+                metrics.failed_operations += len(batch)
+                metrics.failed_batches += 1
+                metrics.errors.append(e)
+        else:
+            with self._metrics_lock:
+                metrics.retries += retries
+                metrics.operations += len(batch)
+                metrics.batches += 1
+                metrics.commit_latency.record(latency)
+
+    def _write(self, queries: list[str]) -> float:
+        with self._session.transaction(TransactionType.WRITE, self._options) as transaction:
+            # Every query is sent before any answers are read, so the server works through them in one go
+            for answers in [transaction.query.insert(query) for query in queries]:
+                deque(answers, maxlen=0)
+            start = perf_counter()
+            transaction.commit()
+            return perf_counter() - start
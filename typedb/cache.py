@@ -0,0 +1,170 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+import pickle
+import sqlite3
+from hashlib import sha256
+from threading import Lock
+from time import time
+from typing import Any, Callable, Optional, TYPE_CHECKING
+
+from typedb.api.answer.snapshot import ConceptMapSnapshot, ConceptMapGroupSnapshot, NumericSnapshot, \
+    NumericGroupSnapshot
+from typedb.common.options_key import _options_key
+
+if TYPE_CHECKING:
+    from typedb.api.connection.database import Database
+    from typedb.api.connection.options import TypeDBOptions
+    from typedb.api.connection.transaction import TypeDBTransaction
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    database TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    schema_fingerprint TEXT NOT NULL,
+    expires REAL,
+    answers BLOB NOT NULL,
+    PRIMARY KEY (database, fingerprint)
+)
+"""
+
+
+def _fingerprint(*parts: Any) -> str:
+    return sha256(repr(parts).encode()).hexdigest()
+
+
+class PersistentAnswerCache:
+    """
+    Snapshots of query answers kept in a SQLite file, so that they outlive the process. Answers are keyed by database,
+    by a fingerprint of the query, its kind and its options, and by a fingerprint of the database schema, so that a
+    schema change misses every answer cached before it. Answers expire after ``ttl_seconds``, if given.
+
+    The file stores pickles, and should only be shared with processes that are trusted.
+
+    **Examples**
+
+    - ``answers = PersistentAnswerCache("answers.sqlite").database(client.databases.get("typedb"))``
+    - ``with session.transaction(TransactionType.READ, TypeDBOptions(infer=True)) as tx: answers.match(tx, query)``
+    """
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None):
+        self._ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+
+    def database(self, database: Database) -> DatabaseAnswerCache:
+        """
+        Returns the view of this cache for ``database``, reading its schema once to fingerprint it.
+        """
+        return DatabaseAnswerCache(self, database.name, sha256(database.schema().encode()).hexdigest())
+
+    def _get(self, database: str, fingerprint: str, schema_fingerprint: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT answers FROM answers WHERE database = ? AND fingerprint = ? AND schema_fingerprint = ? "
+                "AND (expires IS NULL OR expires > ?)", (database, fingerprint, schema_fingerprint, time())
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def _put(self, database: str, fingerprint: str, schema_fingerprint: str, answers: Any) -> None:
+        expires = time() + self._ttl_seconds if self._ttl_seconds is not None else None
+        data = pickle.dumps(answers, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)",
+                                     (database, fingerprint, schema_fingerprint, expires, data))
+
+    def invalidate(self, database: Optional[str] = None) -> None:
+        """
+        Drops the answers for ``database``, or for every database if it is None.
+        """
+        with self._lock:
+            if database is None:
+                self._connection.execute("DELETE FROM answers")
+            else:
+                self._connection.execute("DELETE FROM answers WHERE database = ?", (database,))
+
+    def evict_expired(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM answers WHERE expires <= ?", (time(),))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_tb is not None:
+            return False
+
+
+class DatabaseAnswerCache:
+    """
+    Answers of one database in a persistent answer cache, for the schema the database had when the view was created.
+    """
+
+    def __init__(self, cache: PersistentAnswerCache, database: str, schema_fingerprint: str):
+        self._cache = cache
+        self._database = database
+        self._schema_fingerprint = schema_fingerprint
+
+    @property
+    def database(self) -> str:
+        return self._database
+
+    def _get_or_load(self, kind: str, transaction: TypeDBTransaction, query: str, options: Optional[TypeDBOptions],
+                     load: Callable[[], Any]) -> Any:
+        fingerprint = _fingerprint(kind, query.strip(), _options_key(transaction.options),
+                                   _options_key(options) if options else None)
+        answers = self._cache._get(self._database, fingerprint, self._schema_fingerprint)
+        if answers is None:
+            answers = load()
+            self._cache._put(self._database, fingerprint, self._schema_fingerprint, answers)
+        return answers
+
+    def match(self, transaction: TypeDBTransaction, query: str, options: Optional[TypeDBOptions] = None
+              ) -> list[ConceptMapSnapshot]:
+        return self._get_or_load("match", transaction, query, options,
+                                 lambda: list(transaction.query.match(query, options, detached=True)))
+
+    def match_aggregate(self, transaction: TypeDBTransaction, query: str, options: Optional[TypeDBOptions] = None
+                        ) -> NumericSnapshot:
+        return self._get_or_load("match_aggregate", transaction, query, options,
+                                 lambda: transaction.query.match_aggregate(query, options, detached=True))
+
+    def match_group(self, transaction: TypeDBTransaction, query: str, options: Optional[TypeDBOptions] = None
+                    ) -> list[ConceptMapGroupSnapshot]:
+        return self._get_or_load("match_group", transaction, query, options,
+                                 lambda: list(transaction.query.match_group(query, options, detached=True)))
+
+    def match_group_aggregate(self, transaction: TypeDBTransaction, query: str,
+                              options: Optional[TypeDBOptions] = None) -> list[NumericGroupSnapshot]:
+        return self._get_or_load("match_group_aggregate", transaction, query, options,
+                                 lambda: list(transaction.query.match_group_aggregate(query, options, detached=True)))
+
+    def invalidate(self) -> None:
+        self._cache.invalidate(self._database)
@@ -19,12 +19,14 @@
 # under the License.
 #
 
-from typing import Iterable
+from typing import Iterable, Optional, Union
 
+from typedb.api.answer.concept_column import *  # noqa # pylint: disable=unused-import
 from typedb.api.answer.concept_map import *  # noqa # pylint: disable=unused-import
 from typedb.api.answer.concept_map_group import *  # noqa # pylint: disable=unused-import
 from typedb.api.answer.numeric import *  # noqa # pylint: disable=unused-import
 from typedb.api.answer.numeric_group import *  # noqa # pylint: disable=unused-import
+from typedb.api.answer.snapshot import *  # noqa # pylint: disable=unused-import
 from typedb.api.concept.concept import *  # noqa # pylint: disable=unused-import
 from typedb.api.concept.concept_manager import *  # noqa # pylint: disable=unused-import
 from typedb.api.concept.thing.attribute import *  # noqa # pylint: disable=unused-import
@@ -43,8 +45,11 @@ from typedb.api.connection.client import *
 from typedb.api.connection.credential import *
 from typedb.api.connection.database import *  # noqa # pylint: disable=unused-import
 from typedb.api.connection.options import *  # noqa # pylint: disable=unused-import
+from typedb.api.connection.result_cache import *  # noqa # pylint: disable=unused-import
 from typedb.api.connection.session import *  # noqa # pylint: disable=unused-import
+from typedb.api.connection.session_pool import *  # noqa # pylint: disable=unused-import
 from typedb.api.connection.transaction import *  # noqa # pylint: disable=unused-import
+from typedb.api.connection.transaction_pool import *  # noqa # pylint: disable=unused-import
 from typedb.api.logic.explanation import *  # noqa # pylint: disable=unused-import
 from typedb.api.logic.logic_manager import *  # noqa # pylint: disable=unused-import
 from typedb.api.logic.rule import *  # noqa # pylint: disable=unused-import
@@ -53,22 +58,63 @@ from typedb.api.user.user import *  # noqa # pylint: disable=unused-import
 from typedb.common.exception import *  # noqa # pylint: disable=unused-import
 from typedb.common.label import *  # noqa # pylint: disable=unused-import
 from typedb.common.transitivity import *  # noqa # pylint: disable=unused-import
+from typedb.query.template import *  # noqa # pylint: disable=unused-import
+from typedb.connection.auto_commit_transaction import AutoCommitTransaction  # noqa # pylint: disable=unused-import
 from typedb.connection.client import _Client
+from typedb.connection.pooled_client import _PooledClient
+from typedb.connection.shared_client import _ClientRegistry
 
 
 # Repackaging these symbols allows them to be imported from "typedb.client"
 
 
+_client_registry = _ClientRegistry()
+
+
 class TypeDB:
     DEFAULT_ADDRESS = "localhost:1729"
 
     @staticmethod
-    def core_client(address: str) -> TypeDBClient:
-        return _Client([address])
+    def core_client(address: str, *, session_pool_min_size: int = 0, session_pool_max_size: int = 16,
+                    result_cache_size: int = 0, result_cache_ttl_seconds: Optional[float] = None) -> TypeDBClient:
+        return _Client([address], session_pool_min_size=session_pool_min_size,
+                       session_pool_max_size=session_pool_max_size, result_cache_size=result_cache_size,
+                       result_cache_ttl_seconds=result_cache_ttl_seconds)
+
+    @staticmethod
+    def cluster_client(addresses: Union[Iterable[str], str], credential: TypeDBCredential, *,
+                       session_pool_min_size: int = 0, session_pool_max_size: int = 16, result_cache_size: int = 0,
+                       result_cache_ttl_seconds: Optional[float] = None) -> TypeDBClient:
+        addresses = [addresses] if isinstance(addresses, str) else list(addresses)
+        return _Client(addresses, credential, session_pool_min_size=session_pool_min_size,
+                       session_pool_max_size=session_pool_max_size, result_cache_size=result_cache_size,
+                       result_cache_ttl_seconds=result_cache_ttl_seconds)
+
+    @staticmethod
+    def pooled_core_client(address: str, connections: int, load_balancing: LoadBalancing = LoadBalancing.LEAST_LOADED
+                           ) -> TypeDBClient:
+        return _PooledClient(lambda: _Client([address]), connections, load_balancing)
+
+    @staticmethod
+    def pooled_cluster_client(addresses: Union[Iterable[str], str], credential: TypeDBCredential, connections: int,
+                              load_balancing: LoadBalancing = LoadBalancing.LEAST_LOADED) -> TypeDBClient:
+        addresses = [addresses] if isinstance(addresses, str) else list(addresses)
+        return _PooledClient(lambda: _Client(addresses, credential), connections, load_balancing)
+
+    @staticmethod
+    def shared_core_client(address: str) -> TypeDBClient:
+        """
+        Returns a handle to the process-wide client for ``address``, opening it on first use. Closing the handle
+        releases it, and the connection closes when the last handle is closed.
+        """
+        return _client_registry.acquire((frozenset([address]), None), lambda: _Client([address]))
 
     @staticmethod
-    def cluster_client(addresses: Union[Iterable[str], str], credential: TypeDBCredential) -> TypeDBClient:
-        if isinstance(addresses, str):
-            return _Client([addresses], credential)
-        else:
-            return _Client(list(addresses), credential)
+    def shared_cluster_client(addresses: Union[Iterable[str], str], credential: TypeDBCredential) -> TypeDBClient:
+        """
+        Returns a handle to the process-wide client for these addresses and an equal credential, opening it on
+        first use. Closing the handle releases it, and the connection closes when the last handle is closed.
+        """
+        addresses = [addresses] if isinstance(addresses, str) else list(addresses)
+        return _client_registry.acquire((frozenset(addresses), credential._identity_key),
+                                        lambda: _Client(addresses, credential))
@@ -0,0 +1,128 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from contextlib import suppress
+from typing import Callable, Generic, Optional, TypeVar, TYPE_CHECKING
+
+from typedb.common.async_wrapper import _run_in_executor
+from typedb.common.exception import TypeDBClientExceptionExt, POSITIVE_VALUE_REQUIRED
+
+if TYPE_CHECKING:
+    from typedb.common.iterator_wrapper import IteratorWrapper
+
+T = TypeVar("T")
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    # Marks the failure of an abandoned fetch as retrieved; awaiting the future still raises it
+    if not future.cancelled():
+        future.exception()
+
+
+class AsyncIteratorWrapper(Generic[T]):
+    """
+    Streams answers to ``async for`` loops. Every hop to the executor opens the query or drains up to ``batch_size``
+    answers from it, and at most one batch is fetched ahead of the consumer, so a slow consumer holds back the
+    stream instead of buffering it.
+    """
+
+    def __init__(self, open_iterator: Callable[[], IteratorWrapper[T]], executor: Executor, batch_size: int):
+        if batch_size < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, batch_size)
+        self._open_iterator = open_iterator
+        self._iterator: Optional[IteratorWrapper[T]] = None
+        self._executor = executor
+        self._batch_size = batch_size
+        self._buffer = deque()
+        self._pending: Optional[asyncio.Future] = None
+        self._exhausted = False
+
+    async def open(self) -> AsyncIteratorWrapper[T]:
+        """
+        Runs the query on the executor now, rather than when the first answer is read.
+        """
+        if self._iterator is None:
+            self._iterator = await _run_in_executor(self._executor, self._open_iterator)
+        return self
+
+    def _fetch(self) -> list[T]:
+        if self._iterator is None:
+            self._iterator = self._open_iterator()
+        return self._iterator.next_batch(self._batch_size)
+
+    def _schedule_fetch(self) -> asyncio.Future:
+        future = _run_in_executor(self._executor, self._fetch)
+        future.add_done_callback(_retrieve_exception)
+        return future
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> T:
+        if not self._buffer:
+            if self._exhausted:
+                raise StopAsyncIteration
+            if self._pending is None:
+                self._pending = self._schedule_fetch()
+            try:
+                # A cancelled consumer leaves the fetch running, and the next call picks up its result, so that
+                # the native iterator is never drained by two executor threads at once
+                batch = await asyncio.shield(self._pending)
+            except Exception:
+                self._pending = None
+                self._exhausted = True
+                raise
+            if len(batch) < self._batch_size:
+                self._pending = None
+                self._exhausted = True
+            else:
+                self._pending = self._schedule_fetch()
+            self._buffer.extend(batch)
+            if not self._buffer:
+                raise StopAsyncIteration
+        return self._buffer.popleft()
+
+    async def collect(self) -> list[T]:
+        return [answer async for answer in self]
+
+    async def aclose(self) -> None:
+        """
+        Stops the stream, waiting for a fetch that is already running on the executor to finish.
+        """
+        self._exhausted = True
+        self._buffer.clear()
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            with suppress(Exception):
+                await pending
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        if exc_tb is not None:
+            return False
@@ -0,0 +1,71 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Generic, TypeVar
+
+from typedb.common.exception import TypeDBClientExceptionExt, CLIENT_CLOSED
+
+T = TypeVar("T")
+
+
+class AsyncWrapper(Generic[T]):
+    """
+    Exposes a blocking driver object to asyncio code by running its calls on the executor owned by the client.
+    """
+
+    def __init__(self, blocking: T, executor: Executor):
+        self._blocking = blocking
+        self._executor = executor
+
+    @property
+    def blocking(self) -> T:
+        """
+        The wrapped blocking object. Its methods must not be called from the event loop thread; use
+        ``run_blocking`` instead.
+        """
+        return self._blocking
+
+    async def run_blocking(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs a blocking driver call on the client's executor.
+
+        **Examples**
+
+        - ``await session.run_blocking(session.blocking.on_close, callback)``
+        """
+        return await _run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+    def _run(self, function: Callable[..., Any], *args) -> asyncio.Future:
+        return _run_in_executor(self._executor, function, *args)
+
+
+def _run_in_executor(executor: Executor, function: Callable[..., Any], *args) -> asyncio.Future:
+    loop = asyncio.get_running_loop()
+    try:
+        return loop.run_in_executor(executor, function, *args)
+    except RuntimeError as error:
+        # The executor only refuses new work once the client that owns it has been closed
+        raise TypeDBClientExceptionExt.of(CLIENT_CLOSED) from error
@@ -0,0 +1,128 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from collections import deque
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Generic, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typedb.common.iterator_wrapper import IteratorWrapper
+
+T = TypeVar("T")
+
+_POLL_INTERVAL_SECONDS = 0.1
+
+
+class _Done:
+    pass
+
+
+class _Failed:
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def _drain(iterator: IteratorWrapper, batch_size: int, queue: Queue, cancelled: Event) -> None:
+    try:
+        while not cancelled.is_set():
+            batch = iterator.next_batch(batch_size)
+            if batch and not _put(queue, batch, cancelled):
+                return
+            if len(batch) < batch_size:
+                break
+        _put(queue, _Done(), cancelled)
+    except BaseException as error:
+        _put(queue, _Failed(error), cancelled)
+
+
+def _put(queue: Queue, item, cancelled: Event) -> bool:
+    while not cancelled.is_set():
+        try:
+            queue.put(item, timeout=_POLL_INTERVAL_SECONDS)
+            return True
+        except Full:
+            pass
+    return False
+
+
+class BackgroundIterator(Generic[T]):
+    """
+    Drains an ``IteratorWrapper`` on a worker thread into a bounded queue, so that fetching and wrapping the next
+    answers overlaps with the processing of the current ones. Errors raised by the worker are re-raised to the
+    consumer, and ``close()`` stops the worker early, returning once it no longer reads from the native iterator.
+    """
+
+    def __init__(self, iterator: IteratorWrapper[T], queue_size: int, batch_size: int):
+        # Batches larger than the queue would hold more than queue_size items in it
+        batch_size = min(batch_size, queue_size)
+        self._queue = Queue(maxsize=max(1, queue_size // batch_size))
+        self._buffer = deque()
+        self._cancelled = Event()
+        self._finished = False
+        # The worker must not reference this iterator, so that an abandoned iterator is collected and cancels it
+        self._worker = Thread(target=_drain, args=(iterator, batch_size, self._queue, self._cancelled),
+                              name="typedb-prefetch", daemon=True)
+        self._worker.start()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> T:
+        if self._buffer:
+            return self._buffer.popleft()
+        if self._finished:
+            raise StopIteration
+        item = self._queue.get()
+        if isinstance(item, _Done):
+            self._finished = True
+            raise StopIteration
+        elif isinstance(item, _Failed):
+            self._finished = True
+            raise item.error
+        self._buffer.extend(item)
+        return self._buffer.popleft()
+
+    def close(self) -> None:
+        self._cancelled.set()
+        self._finished = True
+        self._buffer.clear()
+        try:
+            while True:
+                self._queue.get_nowait()
+        except Empty:
+            pass
+        # The worker may be inside a native fetch, which must finish before the transaction can be closed
+        self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_tb is not None:
+            return False
+
+    def __del__(self):
+        self._cancelled.set()
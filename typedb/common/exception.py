@@ -75,6 +75,13 @@ DATABASE_DELETED = ClientErrorMessage(4, "The database '%s' has been deleted and
 MISSING_DB_NAME = ClientErrorMessage(5, "Database name cannot be empty.")
 POSITIVE_VALUE_REQUIRED = ClientErrorMessage(6, "Value should be positive, was: '%d'.")
 CLUSTER_CREDENTIAL_INCONSISTENT = ClientErrorMessage(7, "TLS disabled but the Root CA path provided.")
+SESSION_POOL_EXHAUSTED = ClientErrorMessage(8, "No pooled session to database '%s' became available in time.")
+INVALID_POOL_SIZE = ClientErrorMessage(9, "Pool sizes should satisfy 0 <= minimum <= maximum and maximum > 0, "
+                                          "were: '%d' and '%d'.")
+TRANSACTION_POOL_EXHAUSTED = ClientErrorMessage(10, "No pooled read transaction became available in time.")
+NON_NEGATIVE_VALUE_REQUIRED = ClientErrorMessage(11, "Value should not be negative, was: '%d'.")
+INVALID_BATCH_SIZE = ClientErrorMessage(12, "Batch sizes should satisfy 0 < minimum <= maximum, were: '%d' and '%d'.")
+ANSWER_BUFFER_CLOSED = ClientErrorMessage(13, "The answer buffer has been closed and no further operation is allowed.")
 
 
 class ConceptErrorMessage(ErrorMessage):
@@ -107,6 +114,8 @@ class QueryErrorMessage(ErrorMessage):
 
 VARIABLE_DOES_NOT_EXIST = QueryErrorMessage(1, "The variable '%s' does not exist.")
 MISSING_QUERY = QueryErrorMessage(2, "Query cannot be null or empty.")
+INVALID_QUERY_PARAMETER = QueryErrorMessage(3, "The value '%s' of type '%s' cannot be bound to a query parameter.")
+MISSING_QUERY_PARAMETER = QueryErrorMessage(4, "No value was provided for the query parameter '%s'.")
 
 
 class InternalErrorMessage(ErrorMessage):
@@ -0,0 +1,62 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import os
+from threading import RLock
+from typing import Any
+
+_generation = 0
+_reopen_lock = RLock()
+
+
+def _after_fork_in_child() -> None:
+    global _generation, _reopen_lock
+    _generation += 1
+    # Only the forking thread survives in the child, so a lock held by any other thread would never be released
+    _reopen_lock = RLock()
+
+
+# Counting forks lets wrappers detect that they were created in a parent process with an integer comparison,
+# instead of calling os.getpid() on every use
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def fork_generation() -> int:
+    return _generation
+
+
+def reopen_lock() -> RLock:
+    """
+    Serialises the replacement of state inherited from the parent process, so that wrappers used from several
+    threads of a child reopen their native objects once. It is re-entrant, as reopening a session reopens its
+    client first.
+    """
+    return _reopen_lock
+
+
+def disown_inherited(native_object: Any) -> None:
+    """
+    Gives up a native object inherited from the parent process without dropping it: dropping it would try to shut
+    down connections and threads that only exist in the parent.
+    """
+    if native_object is not None and native_object.thisown:
+        native_object.thisown = 0
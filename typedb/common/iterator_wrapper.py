@@ -19,19 +19,87 @@
 # under the License.
 #
 
-from typing import Callable
+from __future__ import annotations
 
+from operator import itemgetter
+from typing import Callable, Generic, Iterable, Iterator, Optional, TypeVar
 
-class IteratorWrapper:
+from typedb.common.background_iterator import BackgroundIterator
+from typedb.common.exception import TypeDBClientExceptionExt, POSITIVE_VALUE_REQUIRED
 
-    def __init__(self, native_iterator: object, native_next: Callable):
+T = TypeVar("T")
+
+
+def _next_item(items: Iterator[T]) -> Optional[tuple[T]]:
+    # Boxed, so that items which are falsy do not read as the end of the iteration
+    for item in items:
+        return item,
+    return None
+
+
+class IteratorWrapper(Generic[T]):
+
+    def __init__(self, native_iterator: object, native_next: Callable, wrap: Optional[Callable[..., T]] = None):
         self._iterator = native_iterator
         self._next = native_next
+        self._wrap = wrap
+
+    @staticmethod
+    def of(items: Iterable[T]) -> IteratorWrapper[T]:
+        """
+        Iterates over answers that do not come from a native iterator, such as detached or cached answers, with the
+        same batching and prefetching as native answers.
+        """
+        return IteratorWrapper(iter(items), _next_item, itemgetter(0))
 
     def __iter__(self):
         return self
 
-    def __next__(self):
+    def __next__(self) -> T:
         if next_item := self._next(self._iterator):
-            return next_item
+            return self._wrap(next_item) if self._wrap else next_item
         raise StopIteration
+
+    def next_batch(self, size: int) -> list[T]:
+        """
+        Drains up to ``size`` items from the native iterator in one tight loop. An empty list means the iterator
+        is exhausted.
+        """
+        if size < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, size)
+        native_next, native_iterator, wrap = self._next, self._iterator, self._wrap
+        batch = []
+        append = batch.append
+        for _ in range(size):
+            if not (next_item := native_next(native_iterator)):
+                break
+            append(wrap(next_item) if wrap else next_item)
+        return batch
+
+    def batches(self, size: int) -> Iterator[list[T]]:
+        """
+        Iterates over the remaining items in lists of ``size`` items; only the last list may be shorter.
+
+        **Examples**
+
+        - ``for answers in tx.query.match(query).batches(1000): process(answers)``
+        """
+        while batch := self.next_batch(size):
+            yield batch
+            if len(batch) < size:
+                return
+
+    def prefetch_in_background(self, queue_size: int = 1000, batch_size: int = 50) -> BackgroundIterator[T]:
+        """
+        Continues iteration on a worker thread that keeps up to ``queue_size`` items fetched ahead of the consumer.
+        Close the returned iterator, or use it as a context manager, to stop the worker before exhaustion.
+
+        **Examples**
+
+        - ``with tx.query.match(query).prefetch_in_background() as answers: ...``
+        """
+        if queue_size < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, queue_size)
+        if batch_size < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, batch_size)
+        return BackgroundIterator(self, queue_size, batch_size)
@@ -32,6 +32,8 @@ T = TypeVar("T")
 
 class NativeWrapper(ABC, Generic[T]):
 
+    __slots__ = ("_native_object", "__weakref__")
+
     def __init__(self, native_object: T):
         self._native_object = native_object
 
@@ -42,6 +44,13 @@ class NativeWrapper(ABC, Generic[T]):
 
     @property
     def native_object(self) -> Any:
-        if not self._native_object.thisown:
+        native_object = self._native_object
+        # SWIG proxies expose ownership as a Python-level property that forwards to the owning pointer object; calling
+        # that pointer's own() method directly skips the property and lambda frames on every access
+        try:
+            owned = native_object.this.own()
+        except AttributeError:
+            owned = native_object.thisown
+        if not owned:
             raise self._native_object_not_owned_exception
-        return self._native_object
+        return native_object
@@ -0,0 +1,170 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+from typing import Iterable, Optional, Sequence, TYPE_CHECKING, Union
+
+from typedb.native_client_wrapper import concept_is_entity_type, concept_is_relation_type, \
+    concept_is_attribute_type, concept_is_root_thing_type, concept_is_entity, concept_is_relation, \
+    concept_is_attribute, concept_is_value, concept_is_role_type, concept_map_get, concept_map_get_variables, \
+    string_iterator_next, thing_get_iid, entity_get_type, relation_get_type, attribute_get_type, \
+    attribute_get_value, thing_type_get_label, role_type_get_scope, role_type_get_name
+
+from typedb.api.answer.concept_column import ConceptColumn
+from typedb.api.concept.value.value import ValueType
+from typedb.common.exception import TypeDBClientExceptionExt, VARIABLE_DOES_NOT_EXIST
+from typedb.common.iterator_wrapper import IteratorWrapper
+from typedb.common.label import Label
+from typedb.concept.concept_factory import _KindDispatcher
+from typedb.concept.type.thing_type import _Root
+from typedb.concept.value.value import _decode_native_value
+
+if TYPE_CHECKING:
+    from typedb.native_client_wrapper import Concept as NativeConcept, ConceptMap as NativeConceptMap
+
+_TYPED_ARRAY_CODES = {
+    ValueType.BOOLEAN: "b",
+    ValueType.LONG: "q",
+    ValueType.DOUBLE: "d",
+}
+
+_NO_LABEL = -1
+
+
+def _iid(native_thing: NativeConcept) -> bytes:
+    return bytes.fromhex(thing_get_iid(native_thing)[2:])
+
+
+# Each decoder returns the (iid, type label, value type, value) of one cell
+
+def _decode_entity(native_concept: NativeConcept) -> tuple:
+    return _iid(native_concept), Label.of(thing_type_get_label(entity_get_type(native_concept))), None, None
+
+
+def _decode_relation(native_concept: NativeConcept) -> tuple:
+    return _iid(native_concept), Label.of(thing_type_get_label(relation_get_type(native_concept))), None, None
+
+
+def _decode_attribute(native_concept: NativeConcept) -> tuple:
+    return (_iid(native_concept), Label.of(thing_type_get_label(attribute_get_type(native_concept))),
+            *_decode_native_value(attribute_get_value(native_concept)))
+
+
+def _decode_value(native_concept: NativeConcept) -> tuple:
+    return None, None, *_decode_native_value(native_concept)
+
+
+def _decode_thing_type(native_concept: NativeConcept) -> tuple:
+    return None, Label.of(thing_type_get_label(native_concept)), None, None
+
+
+def _decode_root_thing_type(_: NativeConcept) -> tuple:
+    return None, _Root.ROOT_LABEL, None, None
+
+
+def _decode_role_type(native_concept: NativeConcept) -> tuple:
+    return None, Label.of(role_type_get_scope(native_concept), role_type_get_name(native_concept)), None, None
+
+
+def _cell_decoder() -> _KindDispatcher:
+    return _KindDispatcher(
+        (concept_is_entity, lambda: _decode_entity),
+        (concept_is_attribute, lambda: _decode_attribute),
+        (concept_is_relation, lambda: _decode_relation),
+        (concept_is_value, lambda: _decode_value),
+        (concept_is_entity_type, lambda: _decode_thing_type),
+        (concept_is_attribute_type, lambda: _decode_thing_type),
+        (concept_is_relation_type, lambda: _decode_thing_type),
+        (concept_is_root_thing_type, lambda: _decode_root_thing_type),
+        (concept_is_role_type, lambda: _decode_role_type),
+    )
+
+
+class _ConceptColumn(ConceptColumn):
+
+    def __init__(self, variable: str):
+        self._variable = variable
+        self._decode = _cell_decoder()
+        self._iids: list[Optional[bytes]] = []
+        self._label_codes = array("i")
+        self._labels: list[Label] = []
+        self._label_index: dict[Label, int] = {}
+        self._values: Union[list, array] = []
+        self._value_types: set[ValueType] = set()
+
+    def _append(self, native_concept: NativeConcept) -> None:
+        iid, label, value_type, value = self._decode(native_concept)
+        self._iids.append(iid)
+        if label is None:
+            self._label_codes.append(_NO_LABEL)
+        else:
+            if (code := self._label_index.get(label)) is None:
+                code = self._label_index[label] = len(self._labels)
+                self._labels.append(label)
+            self._label_codes.append(code)
+        self._values.append(value)
+        self._value_types.add(value_type)
+
+    def _seal(self) -> _ConceptColumn:
+        if len(self._value_types) == 1 and (code := _TYPED_ARRAY_CODES.get(next(iter(self._value_types)))):
+            self._values = array(code, self._values)
+        del self._decode, self._label_index, self._value_types
+        return self
+
+    @property
+    def variable(self) -> str:
+        return self._variable
+
+    def __len__(self) -> int:
+        return len(self._iids)
+
+    def iids(self) -> Sequence[Optional[bytes]]:
+        return self._iids
+
+    def labels(self) -> Sequence[Label]:
+        return self._labels
+
+    def label_codes(self) -> Sequence[int]:
+        return self._label_codes
+
+    def values(self) -> Sequence[Optional[Union[bool, int, float, str, datetime]]]:
+        return self._values
+
+    def __repr__(self):
+        return f"ConceptColumn('{self._variable}', rows: {len(self)})"
+
+
+def _collect_columns(native_concept_maps: Iterable[NativeConceptMap],
+                     variables: Optional[Iterable[str]]) -> dict[str, _ConceptColumn]:
+    columns = {variable: _ConceptColumn(variable) for variable in variables} if variables else None
+    for native_concept_map in native_concept_maps:
+        if columns is None:
+            columns = {variable: _ConceptColumn(variable)
+                       for variable in IteratorWrapper(concept_map_get_variables(native_concept_map),
+                                                       string_iterator_next)}
+        for variable, column in columns.items():
+            if not (native_concept := concept_map_get(native_concept_map, variable)):
+                raise TypeDBClientExceptionExt.of(VARIABLE_DOES_NOT_EXIST, variable)
+            column._append(native_concept)
+    return {variable: column._seal() for variable, column in columns.items()} if columns else {}
@@ -21,25 +21,33 @@
 
 from __future__ import annotations
 
-from typing import Mapping, Iterator, TYPE_CHECKING
+from datetime import datetime
+from typing import Mapping, Iterator, Optional, TYPE_CHECKING, Union
 
 from typedb.native_client_wrapper import concept_map_get_variables, string_iterator_next, concept_map_get_values, \
     concept_iterator_next, concept_map_get, concept_map_get_explainables, concept_map_to_string, concept_map_equals, \
     explainables_get_relation, explainables_get_attribute, explainables_get_ownership, \
     explainables_get_relations_keys, explainables_get_attributes_keys, explainables_get_ownerships_keys, \
     string_pair_iterator_next, explainables_to_string, explainables_equals, explainable_get_conjunction, \
-    explainable_get_id, ConceptMap as NativeConceptMap, Explainables as NativeExplainables, \
+    explainable_get_id, concept_is_attribute, concept_is_value, concept_is_entity, concept_is_relation, \
+    concept_is_entity_type, concept_is_relation_type, concept_is_attribute_type, concept_is_root_thing_type, \
+    concept_is_role_type, ConceptMap as NativeConceptMap, Explainables as NativeExplainables, \
     Explainable as NativeExplainable
 
 from typedb.api.answer.concept_map import ConceptMap
-from typedb.common.exception import TypeDBClientExceptionExt, ILLEGAL_STATE, MISSING_VARIABLE, \
-    NONEXISTENT_EXPLAINABLE_CONCEPT, NONEXISTENT_EXPLAINABLE_OWNERSHIP, NULL_NATIVE_OBJECT, VARIABLE_DOES_NOT_EXIST
+from typedb.common.exception import TypeDBClientExceptionExt, ILLEGAL_STATE, INVALID_CONCEPT_CASTING, \
+    MISSING_VARIABLE, NONEXISTENT_EXPLAINABLE_CONCEPT, NONEXISTENT_EXPLAINABLE_OWNERSHIP, NULL_NATIVE_OBJECT, \
+    VARIABLE_DOES_NOT_EXIST
 from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.common.native_wrapper import NativeWrapper
 from typedb.concept import concept_factory
+from typedb.concept.concept_factory import _KindDispatcher
+from typedb.concept.identity_map import _IdentityMap, _interning
+from typedb.concept.value.value import _decode_native_attribute_value, _decode_native_value
 
 if TYPE_CHECKING:
     from typedb.api.concept.concept import Concept
+    from typedb.native_client_wrapper import Concept as NativeConcept
 
 
 def _not_blank_var(var: str) -> str:
@@ -48,12 +56,40 @@ def _not_blank_var(var: str) -> str:
     return var
 
 
+def _native_value(native_concept: NativeConcept) -> Union[bool, int, float, str, datetime]:
+    return _decode_native_value(native_concept)[1]
+
+
+def _no_value(_: NativeConcept) -> None:
+    return None
+
+
+def _value_decoder() -> _KindDispatcher:
+    return _KindDispatcher(
+        (concept_is_attribute, lambda: _decode_native_attribute_value),
+        (concept_is_value, lambda: _native_value),
+        (concept_is_entity, lambda: _no_value),
+        (concept_is_relation, lambda: _no_value),
+        (concept_is_entity_type, lambda: _no_value),
+        (concept_is_relation_type, lambda: _no_value),
+        (concept_is_attribute_type, lambda: _no_value),
+        (concept_is_root_thing_type, lambda: _no_value),
+        (concept_is_role_type, lambda: _no_value),
+    )
+
+
+_decode_value = _value_decoder()
+
+
 class _ConceptMap(ConceptMap, NativeWrapper[NativeConceptMap]):
 
-    def __init__(self, concept_map: NativeConceptMap):
+    __slots__ = ("_wrap_concept",)
+
+    def __init__(self, concept_map: NativeConceptMap, identity_map: Optional[_IdentityMap] = None):
         if not concept_map:
             raise TypeDBClientExceptionExt(NULL_NATIVE_OBJECT)
         super().__init__(concept_map)
+        self._wrap_concept = _interning(identity_map, concept_factory.wrap_concept)
 
     @property
     def _native_object_not_owned_exception(self) -> TypeDBClientExceptionExt:
@@ -63,14 +99,22 @@ class _ConceptMap(ConceptMap, NativeWrapper[NativeConceptMap]):
         return IteratorWrapper(concept_map_get_variables(self.native_object), string_iterator_next)
 
     def concepts(self) -> Iterator[Concept]:
-        return map(concept_factory.wrap_concept, IteratorWrapper(concept_map_get_values(self.native_object),
-                                                                 concept_iterator_next))
+        return IteratorWrapper(concept_map_get_values(self.native_object), concept_iterator_next, self._wrap_concept)
 
     def get(self, variable: str) -> Concept:
         concept = concept_map_get(self.native_object, _not_blank_var(variable))
         if not concept:
             raise TypeDBClientExceptionExt.of(VARIABLE_DOES_NOT_EXIST, variable)
-        return concept_factory.wrap_concept(concept)
+        return self._wrap_concept(concept)
+
+    def get_value(self, variable: str) -> Union[bool, int, float, str, datetime]:
+        concept = concept_map_get(self.native_object, _not_blank_var(variable))
+        if not concept:
+            raise TypeDBClientExceptionExt.of(VARIABLE_DOES_NOT_EXIST, variable)
+        if (value := _decode_value(concept)) is None:
+            raise TypeDBClientExceptionExt.of(INVALID_CONCEPT_CASTING,
+                                              (type(concept_factory.wrap_concept(concept)).__name__, "Value"))
+        return value
 
     def explainables(self) -> ConceptMap.Explainables:
         return _ConceptMap.Explainables(concept_map_get_explainables(self.native_object))
@@ -88,8 +132,30 @@ class _ConceptMap(ConceptMap, NativeWrapper[NativeConceptMap]):
     def __hash__(self):
         return hash((tuple(self.variables()), tuple(self.concepts())))
 
+    class Values:
+        """
+        Decodes the attribute and value variables of native concept maps straight to Python values, skipping the
+        concept wrappers. Each variable keeps its own kind dispatch, as a variable usually binds a single kind.
+        """
+
+        def __init__(self):
+            self._decoders: Optional[dict[str, _KindDispatcher]] = None
+
+        def __call__(self, concept_map: NativeConceptMap) -> dict[str, Union[bool, int, float, str, datetime]]:
+            if self._decoders is None:
+                self._decoders = {variable: _value_decoder()
+                                  for variable in IteratorWrapper(concept_map_get_variables(concept_map),
+                                                                  string_iterator_next)}
+            values = {}
+            for variable, decode in self._decoders.items():
+                if (value := decode(concept_map_get(concept_map, variable))) is not None:
+                    values[variable] = value
+            return values
+
     class Explainables(ConceptMap.Explainables, NativeWrapper[NativeExplainables]):
 
+        __slots__ = ()
+
         def __init__(self, explainables: NativeExplainables):
             if not explainables:
                 raise TypeDBClientExceptionExt(NULL_NATIVE_OBJECT)
@@ -148,6 +214,8 @@ class _ConceptMap(ConceptMap, NativeWrapper[NativeConceptMap]):
 
     class Explainable(ConceptMap.Explainable, NativeWrapper[NativeExplainable]):
 
+        __slots__ = ()
+
         def __init__(self, explainable: NativeExplainable):
             if not explainable:
                 raise TypeDBClientExceptionExt(NULL_NATIVE_OBJECT)
@@ -21,7 +21,8 @@
 
 from __future__ import annotations
 
-from typing import Iterator, TYPE_CHECKING
+from functools import partial
+from typing import Iterator, Optional, TYPE_CHECKING
 
 from typedb.native_client_wrapper import concept_map_group_get_owner, concept_map_group_get_concept_maps, \
     concept_map_iterator_next, concept_map_group_to_string, concept_map_group_equals, \
@@ -33,6 +34,7 @@ from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.common.native_wrapper import NativeWrapper
 from typedb.concept import concept_factory
 from typedb.concept.answer.concept_map import _ConceptMap
+from typedb.concept.identity_map import _IdentityMap, _interning
 
 if TYPE_CHECKING:
     from typedb.api.concept.concept import Concept
@@ -41,21 +43,25 @@ if TYPE_CHECKING:
 
 class _ConceptMapGroup(ConceptMapGroup, NativeWrapper[NativeConceptMapGroup]):
 
-    def __init__(self, concept_map_group: NativeConceptMapGroup):
+    __slots__ = ("_identity_map",)
+
+    def __init__(self, concept_map_group: NativeConceptMapGroup, identity_map: Optional[_IdentityMap] = None):
         if not concept_map_group:
             raise TypeDBClientExceptionExt(NULL_NATIVE_OBJECT)
         super().__init__(concept_map_group)
+        self._identity_map = identity_map
 
     @property
     def _native_object_not_owned_exception(self) -> TypeDBClientExceptionExt:
         return TypeDBClientExceptionExt.of(ILLEGAL_STATE)
 
     def owner(self) -> Concept:
-        return concept_factory.wrap_concept(concept_map_group_get_owner(self.native_object))
+        return _interning(self._identity_map, concept_factory.wrap_concept)(
+            concept_map_group_get_owner(self.native_object))
 
     def concept_maps(self) -> Iterator[ConceptMap]:
-        return map(_ConceptMap, IteratorWrapper(concept_map_group_get_concept_maps(self.native_object),
-                                                concept_map_iterator_next))
+        return IteratorWrapper(concept_map_group_get_concept_maps(self.native_object),
+                               concept_map_iterator_next, partial(_ConceptMap, identity_map=self._identity_map))
 
     def __repr__(self):
         return concept_map_group_to_string(self.native_object)
@@ -31,6 +31,8 @@ from typedb.common.native_wrapper import NativeWrapper
 
 class _Numeric(Numeric, NativeWrapper[NativeNumeric]):
 
+    __slots__ = ()
+
     def __init__(self, numeric: NativeNumeric):
         if not numeric:
             raise TypeDBClientExceptionExt(NULL_NATIVE_OBJECT)
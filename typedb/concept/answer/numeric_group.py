@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from typedb.native_client_wrapper import numeric_group_get_owner, numeric_group_get_numeric, \
     numeric_group_to_string, numeric_group_equals, NumericGroup as NativeNumericGroup
@@ -31,6 +31,7 @@ from typedb.common.exception import TypeDBClientExceptionExt, NULL_NATIVE_OBJECT
 from typedb.common.native_wrapper import NativeWrapper
 from typedb.concept import concept_factory
 from typedb.concept.answer.numeric import _Numeric
+from typedb.concept.identity_map import _IdentityMap, _interning
 
 if TYPE_CHECKING:
     from typedb.api.answer.numeric import Numeric
@@ -39,17 +40,21 @@ if TYPE_CHECKING:
 
 class _NumericGroup(NumericGroup, NativeWrapper[NativeNumericGroup]):
 
-    def __init__(self, numeric_group: NativeNumericGroup):
+    __slots__ = ("_identity_map",)
+
+    def __init__(self, numeric_group: NativeNumericGroup, identity_map: Optional[_IdentityMap] = None):
         if not numeric_group:
             raise TypeDBClientExceptionExt(NULL_NATIVE_OBJECT)
         super().__init__(numeric_group)
+        self._identity_map = identity_map
 
     @property
     def _native_object_not_owned_exception(self) -> TypeDBClientExceptionExt:
         return TypeDBClientExceptionExt.of(ILLEGAL_STATE)
 
     def owner(self) -> Concept:
-        return concept_factory.wrap_concept(numeric_group_get_owner(self.native_object))
+        return _interning(self._identity_map, concept_factory.wrap_concept)(
+            numeric_group_get_owner(self.native_object))
 
     def numeric(self) -> Numeric:
         return _Numeric(numeric_group_get_numeric(self.native_object))
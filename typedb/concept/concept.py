@@ -32,6 +32,8 @@ from typedb.common.native_wrapper import NativeWrapper
 
 class _Concept(Concept, NativeWrapper[NativeConcept], ABC):
 
+    __slots__ = ()
+
     def __init__(self, concept: NativeConcept):
         if not concept:
             raise TypeDBClientExceptionExt(NULL_NATIVE_OBJECT)
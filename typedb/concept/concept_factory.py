@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from typedb.native_client_wrapper import \
     concept_is_entity_type, concept_is_relation_type, concept_is_attribute_type, concept_is_root_thing_type, \
@@ -46,14 +46,8 @@ if TYPE_CHECKING:
 
 
 def wrap_concept(native_concept: NativeConcept) -> _Concept:
-    if concept_thing_type := _try_thing_type(native_concept):
-        return concept_thing_type
-    elif concept_thing := _try_thing(native_concept):
-        return concept_thing
-    elif concept_is_value(native_concept):
-        return typedb.concept.value.value._Value(native_concept)
-    elif concept_is_role_type(native_concept):
-        return typedb.concept.type.role_type._RoleType(native_concept)
+    if concept := _try_concept(native_concept):
+        return concept
     else:
         raise TypeDBClientExceptionExt(UNEXPECTED_NATIVE_VALUE)
 
@@ -135,25 +129,53 @@ def wrap_value(native_concept: NativeConcept) -> _Value:
         raise TypeDBClientExceptionExt(UNEXPECTED_NATIVE_VALUE)
 
 
-def _try_thing_type(native_concept: NativeConcept) -> Optional[_ThingType]:
-    if concept_is_entity_type(native_concept):
-        return typedb.concept.type.entity_type._EntityType(native_concept)
-    elif concept_is_attribute_type(native_concept):
-        return typedb.concept.type.attribute_type._AttributeType(native_concept)
-    elif concept_is_relation_type(native_concept):
-        return typedb.concept.type.relation_type._RelationType(native_concept)
-    elif concept_is_root_thing_type(native_concept):
-        return typedb.concept.type.thing_type._Root(native_concept)
-    else:
-        return None
+class _KindDispatcher:
+    """
+    Passes a native concept to the handler of the first kind in the table whose native predicate accepts it. Handlers
+    are resolved lazily, as the wrapper classes import this module.
 
+    Concept kinds are mutually exclusive, so the table may be reordered freely: the kind that matched last is moved
+    to the front, which makes a homogeneous stream of answers cost a single native probe per concept.
+    """
 
-def _try_thing(native_concept: NativeConcept) -> Optional[_Thing]:
-    if concept_is_entity(native_concept):
-        return typedb.concept.thing.entity._Entity(native_concept)
-    elif concept_is_attribute(native_concept):
-        return typedb.concept.thing.attribute._Attribute(native_concept)
-    elif concept_is_relation(native_concept):
-        return typedb.concept.thing.relation._Relation(native_concept)
-    else:
+    def __init__(self, *kinds: tuple[Callable[[NativeConcept], bool], Callable[[], Callable[[NativeConcept], Any]]]):
+        self._unresolved_kinds = kinds
+        self._kinds: Optional[tuple[tuple[Callable[[NativeConcept], bool], Callable[[NativeConcept], Any]], ...]] = None
+
+    def _resolve(self) -> tuple[tuple[Callable[[NativeConcept], bool], Callable[[NativeConcept], Any]], ...]:
+        self._kinds = tuple((is_kind, resolve_handler()) for is_kind, resolve_handler in self._unresolved_kinds)
+        return self._kinds
+
+    def __call__(self, native_concept: NativeConcept) -> Any:
+        kinds = self._kinds or self._resolve()
+        for index, (is_kind, handler) in enumerate(kinds):
+            if is_kind(native_concept):
+                if index:
+                    self._kinds = (kinds[index],) + kinds[:index] + kinds[index + 1:]
+                return handler(native_concept)
         return None
+
+
+_THING_TYPE_KINDS = (
+    (concept_is_entity_type, lambda: typedb.concept.type.entity_type._EntityType),
+    (concept_is_attribute_type, lambda: typedb.concept.type.attribute_type._AttributeType),
+    (concept_is_relation_type, lambda: typedb.concept.type.relation_type._RelationType),
+    (concept_is_root_thing_type, lambda: typedb.concept.type.thing_type._Root),
+)
+
+_THING_KINDS = (
+    (concept_is_entity, lambda: typedb.concept.thing.entity._Entity),
+    (concept_is_attribute, lambda: typedb.concept.thing.attribute._Attribute),
+    (concept_is_relation, lambda: typedb.concept.thing.relation._Relation),
+)
+
+_try_thing_type = _KindDispatcher(*_THING_TYPE_KINDS)
+
+_try_thing = _KindDispatcher(*_THING_KINDS)
+
+_try_concept = _KindDispatcher(
+    *_THING_KINDS,
+    (concept_is_value, lambda: typedb.concept.value.value._Value),
+    *_THING_TYPE_KINDS,
+    (concept_is_role_type, lambda: typedb.concept.type.role_type._RoleType),
+)
@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TypeVar, TYPE_CHECKING
 
 from typedb.native_client_wrapper import concepts_get_entity_type, concepts_get_relation_type, \
     concepts_get_attribute_type, concepts_put_entity_type, concepts_put_relation_type, concepts_put_attribute_type, \
@@ -41,6 +41,10 @@ from typedb.concept.type.relation_type import _RelationType
 
 if TYPE_CHECKING:
     from typedb.api.concept.value.value import ValueType
+    from typedb.concept.concept import _Concept
+    from typedb.concept.identity_map import _IdentityMap
+
+C = TypeVar("C", bound="_Concept")
 
 
 def _not_blank_label(label: str) -> str:
@@ -57,8 +61,12 @@ def _not_blank_iid(iid: str) -> str:
 
 class _ConceptManager(ConceptManager, NativeWrapper[NativeTransaction]):
 
-    def __init__(self, transaction: NativeTransaction):
+    def __init__(self, transaction: NativeTransaction, identity_map: Optional[_IdentityMap] = None):
         super().__init__(transaction)
+        self._identity_map = identity_map
+
+    def _interned(self, concept: C) -> C:
+        return self._identity_map.intern(concept) if self._identity_map is not None else concept
 
     @property
     def _native_object_not_owned_exception(self) -> TypeDBClientExceptionExt:
@@ -79,42 +87,44 @@ class _ConceptManager(ConceptManager, NativeWrapper[NativeTransaction]):
 
     def get_entity_type(self, label: str) -> Optional[_EntityType]:
         if _type := concepts_get_entity_type(self.native_transaction, _not_blank_label(label)):
-            return _EntityType(_type)
+            return self._interned(_EntityType(_type))
         return None
 
     def get_relation_type(self, label: str) -> Optional[_RelationType]:
         if _type := concepts_get_relation_type(self.native_transaction, _not_blank_label(label)):
-            return _RelationType(_type)
+            return self._interned(_RelationType(_type))
         return None
 
     def get_attribute_type(self, label: str) -> Optional[_AttributeType]:
         if _type := concepts_get_attribute_type(self.native_transaction, _not_blank_label(label)):
-            return _AttributeType(_type)
+            return self._interned(_AttributeType(_type))
         return None
 
     def put_entity_type(self, label: str) -> _EntityType:
-        return _EntityType(concepts_put_entity_type(self.native_transaction, _not_blank_label(label)))
+        return self._interned(_EntityType(concepts_put_entity_type(self.native_transaction, _not_blank_label(label))))
 
     def put_relation_type(self, label: str) -> _RelationType:
-        return _RelationType(concepts_put_relation_type(self.native_transaction, _not_blank_label(label)))
+        return self._interned(_RelationType(concepts_put_relation_type(self.native_transaction,
+                                                                       _not_blank_label(label))))
 
     def put_attribute_type(self, label: str, value_type: ValueType) -> _AttributeType:
-        return _AttributeType(concepts_put_attribute_type(self.native_transaction, _not_blank_label(label),
-                                                          value_type.native_object))
+        return self._interned(_AttributeType(concepts_put_attribute_type(self.native_transaction,
+                                                                         _not_blank_label(label),
+                                                                         value_type.native_object)))
 
     def get_entity(self, iid: str) -> Optional[_Entity]:
         if concept := concepts_get_entity(self.native_transaction, _not_blank_iid(iid)):
-            return _Entity(concept)
+            return self._interned(_Entity(concept))
         return None
 
     def get_relation(self, iid: str) -> Optional[_Relation]:
         if concept := concepts_get_relation(self.native_transaction, _not_blank_iid(iid)):
-            return _Relation(concept)
+            return self._interned(_Relation(concept))
         return None
 
     def get_attribute(self, iid: str) -> Optional[_Attribute]:
         if concept := concepts_get_attribute(self.native_transaction, _not_blank_iid(iid)):
-            return _Attribute(concept)
+            return self._interned(_Attribute(concept))
         return None
 
     def get_schema_exception(self) -> list[TypeDBException]:
@@ -0,0 +1,82 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Callable, Optional, TypeVar, TYPE_CHECKING
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from typedb.common.label import Label
+    from typedb.concept.concept import _Concept
+
+C = TypeVar("C", bound="_Concept")
+
+
+class _IdentityMap:
+    """
+    Resolves the concepts of one transaction that share an IID (things) or a label (types) to a single wrapper.
+    Wrappers are held weakly, so the map only keeps alive the concepts that the application still references.
+
+    Every accessor that takes the transaction resolves its concepts through the map. ``Thing.get_type()`` takes no
+    transaction, so the type it returns is a fresh wrapper (equal to, but not the same object as, the interned one).
+    """
+
+    def __init__(self):
+        self._concepts: WeakValueDictionary = WeakValueDictionary()
+        self._lock = Lock()
+
+    def intern(self, concept: C) -> C:
+        if concept.is_thing():
+            key = concept.get_iid()
+        elif concept.is_type():
+            key = concept.get_label()
+        else:
+            return concept
+        with self._lock:
+            return self._concepts.setdefault(key, concept)
+
+    def relabel(self, concept: C, old_label: Label) -> None:
+        """
+        Re-keys a type that was renamed, so that its old label no longer resolves to it.
+        """
+        new_label = concept.get_label()
+        with self._lock:
+            self._concepts.pop(old_label, None)
+            self._concepts[new_label] = concept
+
+    def clear(self) -> None:
+        with self._lock:
+            self._concepts.clear()
+
+    def __len__(self):
+        return len(self._concepts)
+
+
+def _interned(identity_map: Optional[_IdentityMap], concept: C) -> C:
+    return identity_map.intern(concept) if identity_map is not None else concept
+
+
+def _interning(identity_map: Optional[_IdentityMap], wrap: Callable[..., C]) -> Callable[..., C]:
+    if identity_map is None:
+        return wrap
+    return lambda native_concept: identity_map.intern(wrap(native_concept))
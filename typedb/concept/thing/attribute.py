@@ -30,6 +30,7 @@ from typedb.api.concept.thing.attribute import Attribute
 from typedb.api.concept.value.value import ValueType
 from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.concept.concept_factory import wrap_attribute_type, wrap_thing, wrap_value
+from typedb.concept.identity_map import _interning
 from typedb.concept.thing.thing import _Thing
 from typedb.concept.type.attribute_type import _AttributeType
 from typedb.concept.value.value import _Value
@@ -38,18 +39,27 @@ if TYPE_CHECKING:
     from datetime import datetime
     from typedb.concept.type.thing_type import _ThingType
     from typedb.connection.transaction import _Transaction
+    from typedb.native_client_wrapper import Concept as NativeConcept
 
 
 class _Attribute(Attribute, _Thing):
 
+    __slots__ = ("_value_wrapper",)
+
+    def __init__(self, concept: NativeConcept):
+        super().__init__(concept)
+        self._value_wrapper: Optional[_Value] = None
+
     def _value(self) -> _Value:
-        return wrap_value(attribute_get_value(self.native_object))
+        if self._value_wrapper is None:
+            self._value_wrapper = wrap_value(attribute_get_value(self.native_object))
+        return self._value_wrapper
 
     def get_type(self) -> _AttributeType:
         return wrap_attribute_type(attribute_get_type(self.native_object))
 
     def get_value(self) -> Union[bool, int, float, str, datetime]:
-        return wrap_value(attribute_get_value(self.native_object)).get()
+        return self._value().get()
 
     def get_value_type(self) -> ValueType:
         return self._value().get_value_type()
@@ -88,6 +98,7 @@ class _Attribute(Attribute, _Thing):
         return {"type": self.get_type().get_label().scoped_name()} | self._value().to_json()
 
     def get_owners(self, transaction: _Transaction, owner_type: Optional[_ThingType] = None) -> Iterator[Any]:
-        return map(wrap_thing, IteratorWrapper(attribute_get_owners(transaction.native_object, self.native_object,
-                                                                    owner_type.native_object if owner_type else None),
-                                               concept_iterator_next))
+        return IteratorWrapper(attribute_get_owners(transaction.native_object, self.native_object,
+                                                    owner_type.native_object if owner_type else None),
+                               concept_iterator_next,
+                               _interning(transaction.identity_map, wrap_thing))
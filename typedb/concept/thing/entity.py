@@ -35,5 +35,7 @@ if TYPE_CHECKING:
 
 class _Entity(Entity, _Thing):
 
+    __slots__ = ()
+
     def get_type(self) -> _EntityType:
         return wrap_entity_type(entity_get_type(self.native_object))
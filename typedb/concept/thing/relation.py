@@ -30,6 +30,7 @@ from typedb.native_client_wrapper import relation_get_type, relation_add_role_pl
 from typedb.api.concept.thing.relation import Relation
 from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.concept.concept_factory import wrap_relation_type, wrap_role_type, wrap_thing
+from typedb.concept.identity_map import _interning
 from typedb.concept.thing.thing import _Thing
 from typedb.concept.type.role_type import _RoleType
 
@@ -40,34 +41,39 @@ if TYPE_CHECKING:
 
 class _Relation(Relation, _Thing):
 
+    __slots__ = ()
+
     def get_type(self) -> _RelationType:
         return wrap_relation_type(relation_get_type(self.native_object))
 
     def add_player(self, transaction: _Transaction, role_type: _RoleType, player: _Thing) -> None:
-        relation_add_role_player(transaction.native_object, self.native_object,
+        relation_add_role_player(transaction.native_write_object, self.native_object,
                                  role_type.native_object, player.native_object)
 
     def remove_player(self, transaction: _Transaction, role_type: _RoleType, player: _Thing) -> None:
-        relation_remove_role_player(transaction.native_object, self.native_object,
+        relation_remove_role_player(transaction.native_write_object, self.native_object,
                                     role_type.native_object, player.native_object)
 
     def get_players_by_role_type(self, transaction: _Transaction, *role_types: _RoleType) -> Iterator[Any]:
         native_role_types = [rt.native_object for rt in role_types]
-        return map(wrap_thing, IteratorWrapper(relation_get_players_by_role_type(transaction.native_object,
-                                                                                 self.native_object,
-                                                                                 native_role_types),
-                                               concept_iterator_next))
+        return IteratorWrapper(relation_get_players_by_role_type(transaction.native_object,
+                                                                 self.native_object,
+                                                                 native_role_types),
+                               concept_iterator_next,
+                               _interning(transaction.identity_map, wrap_thing))
 
     def get_players(self, transaction: _Transaction) -> dict[_RoleType, list[_Thing]]:
         role_players = {}
+        wrap_role = _interning(transaction.identity_map, wrap_role_type)
+        wrap_player = _interning(transaction.identity_map, wrap_thing)
         for role_player in IteratorWrapper(relation_get_role_players(transaction.native_object, self.native_object),
                                            role_player_iterator_next):
-            role = wrap_role_type(role_player_get_role_type(role_player))
-            player = wrap_thing(role_player_get_player(role_player))
+            role = wrap_role(role_player_get_role_type(role_player))
+            player = wrap_player(role_player_get_player(role_player))
             role_players.setdefault(role, [])
             role_players[role].append(player)
         return role_players
 
     def get_relating(self, transaction: _Transaction) -> Iterator[_RoleType]:
-        return map(wrap_role_type, IteratorWrapper(relation_get_relating(transaction.native_object, self.native_object),
-                                                   concept_iterator_next))
+        return IteratorWrapper(relation_get_relating(transaction.native_object, self.native_object),
+                               concept_iterator_next, _interning(transaction.identity_map, wrap_role_type))
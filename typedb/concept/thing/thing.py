@@ -32,6 +32,7 @@ from typedb.common.exception import TypeDBClientExceptionExt, GET_HAS_WITH_MULTI
 from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.concept.concept import _Concept
 from typedb.concept.concept_factory import wrap_attribute, wrap_relation, wrap_role_type
+from typedb.concept.identity_map import _interning
 
 if TYPE_CHECKING:
     from typedb.api.concept.type.annotation import Annotation
@@ -40,15 +41,27 @@ if TYPE_CHECKING:
     from typedb.concept.type.role_type import _RoleType
     from typedb.concept.type.attribute_type import _AttributeType
     from typedb.connection.transaction import _Transaction
+    from typedb.native_client_wrapper import Concept as NativeConcept
 
 
 class _Thing(Thing, _Concept, ABC):
 
+    __slots__ = ("_iid", "_is_inferred")
+
+    def __init__(self, concept: NativeConcept):
+        super().__init__(concept)
+        self._iid: Optional[str] = None
+        self._is_inferred: Optional[bool] = None
+
     def get_iid(self) -> str:
-        return thing_get_iid(self.native_object)
+        if self._iid is None:
+            self._iid = thing_get_iid(self.native_object)
+        return self._iid
 
     def is_inferred(self) -> bool:
-        return thing_get_is_inferred(self.native_object)
+        if self._is_inferred is None:
+            self._is_inferred = thing_get_is_inferred(self.native_object)
+        return self._is_inferred
 
     def get_has(self,
                 transaction: _Transaction,
@@ -63,31 +76,30 @@ class _Thing(Thing, _Concept, ABC):
             attribute_types = [attribute_type]
         native_attribute_types = [type_.native_object for type_ in attribute_types]
         native_annotations = [anno.native_object for anno in annotations]
-        return map(wrap_attribute,
-                   IteratorWrapper(thing_get_has(transaction.native_object, self.native_object,
-                                                 native_attribute_types, native_annotations),
-                                   concept_iterator_next))
+        return IteratorWrapper(thing_get_has(transaction.native_object, self.native_object,
+                                             native_attribute_types, native_annotations),
+                               concept_iterator_next,
+                               _interning(transaction.identity_map, wrap_attribute))
 
     def get_relations(self, transaction: _Transaction, *role_types: _RoleType) -> Iterator[_Relation]:
         native_role_types = [rt.native_object for rt in role_types]
-        return map(wrap_relation,
-                   IteratorWrapper(thing_get_relations(transaction.native_object, self.native_object,
-                                                       native_role_types),
-                                   concept_iterator_next))
+        return IteratorWrapper(thing_get_relations(transaction.native_object, self.native_object,
+                                                   native_role_types),
+                               concept_iterator_next,
+                               _interning(transaction.identity_map, wrap_relation))
 
     def get_playing(self, transaction: _Transaction) -> Iterator[_RoleType]:
-        return map(wrap_role_type,
-                   IteratorWrapper(thing_get_playing(transaction.native_object, self.native_object),
-                                   concept_iterator_next))
+        return IteratorWrapper(thing_get_playing(transaction.native_object, self.native_object),
+                               concept_iterator_next, _interning(transaction.identity_map, wrap_role_type))
 
     def set_has(self, transaction: _Transaction, attribute: _Attribute) -> None:
-        thing_set_has(transaction.native_object, self.native_object, attribute.native_object)
+        thing_set_has(transaction.native_write_object, self.native_object, attribute.native_object)
 
     def unset_has(self, transaction: _Transaction, attribute: _Attribute) -> None:
-        thing_unset_has(transaction.native_object, self.native_object, attribute.native_object)
+        thing_unset_has(transaction.native_write_object, self.native_object, attribute.native_object)
 
     def delete(self, transaction: _Transaction) -> None:
-        thing_delete(transaction.native_object, self.native_object)
+        thing_delete(transaction.native_write_object, self.native_object)
 
     def is_deleted(self, transaction: _Transaction) -> bool:
         return thing_is_deleted(transaction.native_object, self.native_object)
@@ -35,6 +35,7 @@ from typedb.api.concept.value.value import ValueType
 from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.common.transitivity import Transitivity
 from typedb.concept.concept_factory import wrap_attribute, wrap_thing_type
+from typedb.concept.identity_map import _interned, _interning
 from typedb.concept.type.thing_type import _ThingType
 from typedb.concept.value.value import _Value
 
@@ -47,6 +48,8 @@ if TYPE_CHECKING:
 
 class _AttributeType(AttributeType, _ThingType):
 
+    __slots__ = ()
+
     def get_value_type(self) -> ValueType:
         return ValueType.of(attribute_type_get_value_type(self.native_object))
 
@@ -67,55 +70,52 @@ class _AttributeType(AttributeType, _ThingType):
 
     def get_supertype(self, transaction: _Transaction) -> Optional[_AttributeType]:
         if res := attribute_type_get_supertype(transaction.native_object, self.native_object):
-            return _AttributeType(res)
+            return _interned(transaction.identity_map, _AttributeType(res))
         return None
 
     def get_supertypes(self, transaction: _Transaction) -> Iterator[_AttributeType]:
-        return map(_AttributeType,
-                   IteratorWrapper(attribute_type_get_supertypes(transaction.native_object, self.native_object),
-                                   concept_iterator_next))
+        return IteratorWrapper(attribute_type_get_supertypes(transaction.native_object, self.native_object),
+                               concept_iterator_next, _interning(transaction.identity_map, _AttributeType))
 
     def get_subtypes(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                      ) -> Iterator[_AttributeType]:
-        return map(_AttributeType,
-                   IteratorWrapper(attribute_type_get_subtypes(transaction.native_object, self.native_object,
-                                                               transitivity.value),
-                                   concept_iterator_next))
+        return IteratorWrapper(attribute_type_get_subtypes(transaction.native_object, self.native_object,
+                                                           transitivity.value),
+                               concept_iterator_next, _interning(transaction.identity_map, _AttributeType))
 
     def get_subtypes_with_value_type(self, transaction: _Transaction, value_type: ValueType,
                                      transitivity: Transitivity = Transitivity.TRANSITIVE
                                      ) -> Iterator[_AttributeType]:
-        return map(_AttributeType,
-                   IteratorWrapper(attribute_type_get_subtypes_with_value_type(transaction.native_object,
-                                                                               self.native_object,
-                                                                               value_type.native_object,
-                                                                               transitivity.value),
-                                   concept_iterator_next))
+        return IteratorWrapper(attribute_type_get_subtypes_with_value_type(transaction.native_object,
+                                                                           self.native_object,
+                                                                           value_type.native_object,
+                                                                           transitivity.value),
+                               concept_iterator_next, _interning(transaction.identity_map, _AttributeType))
 
     def get_instances(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                       ) -> Iterator[_Attribute]:
-        return map(wrap_attribute,
-                   IteratorWrapper(attribute_type_get_instances(transaction.native_object, self.native_object,
-                                                                transitivity.value),
-                                   concept_iterator_next))
+        return IteratorWrapper(attribute_type_get_instances(transaction.native_object, self.native_object,
+                                                            transitivity.value),
+                               concept_iterator_next,
+                               _interning(transaction.identity_map, wrap_attribute))
 
     def get_owners(self, transaction: _Transaction,
                    annotations: Optional[set[Annotation]] = None,
                    transitivity: Transitivity = Transitivity.TRANSITIVE) -> Iterator[Any]:
         annotations_array = [anno.native_object for anno in annotations] if annotations else []
-        return map(wrap_thing_type,
-                   IteratorWrapper(attribute_type_get_owners(transaction.native_object, self.native_object,
-                                                             transitivity.value, annotations_array),
-                                   concept_iterator_next))
+        return IteratorWrapper(attribute_type_get_owners(transaction.native_object, self.native_object,
+                                                         transitivity.value, annotations_array),
+                               concept_iterator_next, _interning(transaction.identity_map, wrap_thing_type))
 
     def put(self, transaction: _Transaction, value: Union[Value, bool, int, float, str, datetime]) -> _Attribute:
-        return wrap_attribute(attribute_type_put(transaction.native_object, self.native_object,
-                                                 _Value.of(value).native_object))
+        return _interned(transaction.identity_map,
+                         wrap_attribute(attribute_type_put(transaction.native_write_object, self.native_object,
+                                                           _Value.of(value).native_object)))
 
     def get(self, transaction: _Transaction, value: Union[Value, bool, int, float, str, datetime]
             ) -> Optional[_Attribute]:
         if res := attribute_type_get(transaction.native_object, self.native_object, _Value.of(value).native_object):
-            return wrap_attribute(res)
+            return _interned(transaction.identity_map, wrap_attribute(res))
         return None
 
     def get_regex(self, transaction: _Transaction) -> str:
@@ -30,6 +30,7 @@ from typedb.api.concept.type.entity_type import EntityType
 from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.common.transitivity import Transitivity
 from typedb.concept.concept_factory import wrap_entity
+from typedb.concept.identity_map import _interned, _interning
 from typedb.concept.type.thing_type import _ThingType
 
 if TYPE_CHECKING:
@@ -39,8 +40,11 @@ if TYPE_CHECKING:
 
 class _EntityType(EntityType, _ThingType):
 
+    __slots__ = ()
+
     def create(self, transaction: _Transaction) -> _Entity:
-        return wrap_entity(entity_type_create(transaction.native_object, self.native_object))
+        return _interned(transaction.identity_map,
+                         wrap_entity(entity_type_create(transaction.native_write_object, self.native_object)))
 
     def set_supertype(self, transaction: _Transaction, super_entity_type: _EntityType) -> None:
         entity_type_set_supertype(transaction.native_object, self.native_object,
@@ -48,22 +52,23 @@ class _EntityType(EntityType, _ThingType):
 
     def get_supertype(self, transaction: _Transaction) -> Optional[_EntityType]:
         if res := entity_type_get_supertype(transaction.native_object, self.native_object):
-            return _EntityType(res)
+            return _interned(transaction.identity_map, _EntityType(res))
         return None
 
     def get_supertypes(self, transaction: _Transaction) -> Iterator[_EntityType]:
-        return map(_EntityType, IteratorWrapper(entity_type_get_supertypes(transaction.native_object,
-                                                                           self.native_object),
-                                                concept_iterator_next))
+        return IteratorWrapper(entity_type_get_supertypes(transaction.native_object,
+                                                          self.native_object),
+                               concept_iterator_next, _interning(transaction.identity_map, _EntityType))
 
     def get_subtypes(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                      ) -> Iterator[_EntityType]:
-        return map(_EntityType, IteratorWrapper(entity_type_get_subtypes(transaction.native_object, self.native_object,
-                                                                         transitivity.value),
-                                                concept_iterator_next))
+        return IteratorWrapper(entity_type_get_subtypes(transaction.native_object, self.native_object,
+                                                        transitivity.value),
+                               concept_iterator_next, _interning(transaction.identity_map, _EntityType))
 
     def get_instances(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                       ) -> Iterator[_Entity]:
-        return map(wrap_entity, IteratorWrapper(entity_type_get_instances(transaction.native_object, self.native_object,
-                                                                          transitivity.value),
-                                                concept_iterator_next))
+        return IteratorWrapper(entity_type_get_instances(transaction.native_object, self.native_object,
+                                                         transitivity.value),
+                               concept_iterator_next,
+                               _interning(transaction.identity_map, wrap_entity))
@@ -32,6 +32,7 @@ from typedb.api.concept.type.relation_type import RelationType
 from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.common.transitivity import Transitivity
 from typedb.concept.concept_factory import wrap_relation, wrap_role_type
+from typedb.concept.identity_map import _interned, _interning
 from typedb.concept.type.thing_type import _ThingType
 
 if TYPE_CHECKING:
@@ -42,15 +43,18 @@ if TYPE_CHECKING:
 
 class _RelationType(RelationType, _ThingType):
 
+    __slots__ = ()
+
     def create(self, transaction: _Transaction) -> _Relation:
-        return wrap_relation(relation_type_create(transaction.native_object, self.native_object))
+        return _interned(transaction.identity_map,
+                         wrap_relation(relation_type_create(transaction.native_write_object, self.native_object)))
 
     def get_instances(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                       ) -> Iterator[_Relation]:
-        return map(wrap_relation,
-                   IteratorWrapper(relation_type_get_instances(transaction.native_object,
-                                                               self.native_object, transitivity.value),
-                                   concept_iterator_next))
+        return IteratorWrapper(relation_type_get_instances(transaction.native_object,
+                                                           self.native_object, transitivity.value),
+                               concept_iterator_next,
+                               _interning(transaction.identity_map, wrap_relation))
 
     def get_relates(self, transaction: _Transaction, role_label: Optional[str] = None,
                     transitivity: Transitivity = Transitivity.TRANSITIVE) \
@@ -58,16 +62,16 @@ class _RelationType(RelationType, _ThingType):
         if role_label:
             if res := relation_type_get_relates_for_role_label(transaction.native_object,
                                                                self.native_object, role_label):
-                return wrap_role_type(res)
+                return _interned(transaction.identity_map, wrap_role_type(res))
             return None
-        return map(wrap_role_type, IteratorWrapper(relation_type_get_relates(transaction.native_object,
-                                                                             self.native_object,
-                                                                             transitivity.value),
-                                                   concept_iterator_next))
+        return IteratorWrapper(relation_type_get_relates(transaction.native_object,
+                                                         self.native_object,
+                                                         transitivity.value),
+                               concept_iterator_next, _interning(transaction.identity_map, wrap_role_type))
 
     def get_relates_overridden(self, transaction: _Transaction, role_label: str) -> Optional[_RoleType]:
         if res := relation_type_get_relates_overridden(transaction.native_object, self.native_object, role_label):
-            return wrap_role_type(res)
+            return _interned(transaction.identity_map, wrap_role_type(res))
         return None
 
     def set_relates(self, transaction: _Transaction, role_label: str, overridden_label: Optional[str] = None) -> None:
@@ -78,20 +82,20 @@ class _RelationType(RelationType, _ThingType):
 
     def get_subtypes(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                      ) -> Iterator[_RelationType]:
-        return map(_RelationType, IteratorWrapper(relation_type_get_subtypes(transaction.native_object,
-                                                                             self.native_object,
-                                                                             transitivity.value),
-                                                  concept_iterator_next))
+        return IteratorWrapper(relation_type_get_subtypes(transaction.native_object,
+                                                          self.native_object,
+                                                          transitivity.value),
+                               concept_iterator_next, _interning(transaction.identity_map, _RelationType))
 
     def get_supertype(self, transaction: _Transaction) -> Optional[_RelationType]:
         if res := relation_type_get_supertype(transaction.native_object, self.native_object):
-            return _RelationType(res)
+            return _interned(transaction.identity_map, _RelationType(res))
         return None
 
     def get_supertypes(self, transaction: _Transaction) -> Iterator[_RelationType]:
-        return map(_RelationType, IteratorWrapper(relation_type_get_supertypes(transaction.native_object,
-                                                                               self.native_object),
-                                                  concept_iterator_next))
+        return IteratorWrapper(relation_type_get_supertypes(transaction.native_object,
+                                                            self.native_object),
+                               concept_iterator_next, _interning(transaction.identity_map, _RelationType))
 
     def set_supertype(self, transaction: _Transaction, super_relation_type: _RelationType) -> None:
         relation_type_set_supertype(transaction.native_object, self.native_object, super_relation_type.native_object)
@@ -34,6 +34,7 @@ from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.common.label import Label
 from typedb.common.transitivity import Transitivity
 from typedb.concept.concept_factory import wrap_relation, wrap_thing, wrap_relation_type, wrap_thing_type
+from typedb.concept.identity_map import _interned, _interning
 from typedb.concept.type.type import _Type
 
 if TYPE_CHECKING:
@@ -45,6 +46,8 @@ if TYPE_CHECKING:
 
 class _RoleType(_Type, RoleType):
 
+    __slots__ = ()
+
     def is_root(self) -> bool:
         return role_type_is_root(self.native_object)
 
@@ -52,7 +55,9 @@ class _RoleType(_Type, RoleType):
         return role_type_is_abstract(self.native_object)
 
     def get_label(self) -> Label:
-        return Label.of(role_type_get_scope(self.native_object), role_type_get_name(self.native_object))
+        if self._label is None:
+            self._label = Label.of(role_type_get_scope(self.native_object), role_type_get_name(self.native_object))
+        return self._label
 
     def delete(self, transaction: _Transaction) -> None:
         role_type_delete(transaction.native_object, self.native_object)
@@ -61,48 +66,53 @@ class _RoleType(_Type, RoleType):
         return role_type_is_deleted(transaction.native_object, self.native_object)
 
     def set_label(self, transaction: _Transaction, new_label: Label) -> None:
+        identity_map = transaction.identity_map
+        old_label = self.get_label() if identity_map is not None else None
         role_type_set_label(transaction.native_object, self.native_object, new_label)
+        self._label = None
+        if identity_map is not None:
+            identity_map.relabel(self, old_label)
 
     def get_supertype(self, transaction: _Transaction) -> Optional[_RoleType]:
         if res := role_type_get_supertype(transaction.native_object, self.native_object):
-            return _RoleType(res)
+            return _interned(transaction.identity_map, _RoleType(res))
         return None
 
     def get_supertypes(self, transaction: _Transaction) -> Iterator[_RoleType]:
-        return map(_RoleType, IteratorWrapper(role_type_get_supertypes(transaction.native_object, self.native_object),
-                                              concept_iterator_next))
+        return IteratorWrapper(role_type_get_supertypes(transaction.native_object, self.native_object),
+                               concept_iterator_next, _interning(transaction.identity_map, _RoleType))
 
     def get_subtypes(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                      ) -> Iterator[_RoleType]:
-        return map(_RoleType, IteratorWrapper(role_type_get_subtypes(transaction.native_object, self.native_object,
-                                                                     transitivity.value),
-                                              concept_iterator_next))
+        return IteratorWrapper(role_type_get_subtypes(transaction.native_object, self.native_object,
+                                                      transitivity.value),
+                               concept_iterator_next, _interning(transaction.identity_map, _RoleType))
 
     def get_relation_type(self, transaction: _Transaction) -> _RelationType:
-        return wrap_relation_type(role_type_get_relation_type(transaction.native_object, self.native_object))
+        return _interned(transaction.identity_map,
+                         wrap_relation_type(role_type_get_relation_type(transaction.native_object, self.native_object)))
 
     def get_relation_types(self, transaction: _Transaction) -> Iterator[_RelationType]:
-        return map(wrap_relation_type,
-                   IteratorWrapper(role_type_get_relation_types(transaction.native_object, self.native_object),
-                                   concept_iterator_next))
+        return IteratorWrapper(role_type_get_relation_types(transaction.native_object, self.native_object),
+                               concept_iterator_next, _interning(transaction.identity_map, wrap_relation_type))
 
     def get_player_types(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                          ) -> Iterator[Any]:
-        return map(wrap_thing_type,
-                   IteratorWrapper(role_type_get_player_types(transaction.native_object, self.native_object,
-                                                              transitivity.value),
-                                   concept_iterator_next))
+        return IteratorWrapper(role_type_get_player_types(transaction.native_object, self.native_object,
+                                                          transitivity.value),
+                               concept_iterator_next, _interning(transaction.identity_map, wrap_thing_type))
 
     def get_relation_instances(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                                ) -> Iterator[_Relation]:
-        return map(wrap_relation,
-                   IteratorWrapper(role_type_get_relation_instances(transaction.native_object,
-                                                                    self.native_object, transitivity.value),
-                                   concept_iterator_next))
+        return IteratorWrapper(role_type_get_relation_instances(transaction.native_object,
+                                                                self.native_object, transitivity.value),
+                               concept_iterator_next,
+                               _interning(transaction.identity_map, wrap_relation))
 
     def get_player_instances(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                              ) -> Iterator[_Thing]:
-        return map(wrap_thing, IteratorWrapper(role_type_get_player_instances(transaction.native_object,
-                                                                              self.native_object,
-                                                                              transitivity.value),
-                                               concept_iterator_next))
+        return IteratorWrapper(role_type_get_player_instances(transaction.native_object,
+                                                              self.native_object,
+                                                              transitivity.value),
+                               concept_iterator_next,
+                               _interning(transaction.identity_map, wrap_thing))
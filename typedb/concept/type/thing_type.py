@@ -36,6 +36,7 @@ from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.common.label import Label
 from typedb.common.transitivity import Transitivity
 from typedb.concept.concept_factory import wrap_attribute_type, wrap_role_type
+from typedb.concept.identity_map import _interned, _interning
 from typedb.concept.type.type import _Type
 
 if TYPE_CHECKING:
@@ -49,6 +50,8 @@ if TYPE_CHECKING:
 
 class _ThingType(ThingType, _Type, ABC):
 
+    __slots__ = ()
+
     def as_thing_type(self) -> ThingType:
         return self
 
@@ -59,7 +62,9 @@ class _ThingType(ThingType, _Type, ABC):
         return thing_type_is_abstract(self.native_object)
 
     def get_label(self) -> Label:
-        return Label.of(thing_type_get_label(self.native_object))
+        if self._label is None:
+            self._label = Label.of(thing_type_get_label(self.native_object))
+        return self._label
 
     def delete(self, transaction: _Transaction) -> None:
         thing_type_delete(transaction.native_object, self.native_object)
@@ -68,7 +73,12 @@ class _ThingType(ThingType, _Type, ABC):
         return thing_type_is_deleted(transaction.native_object, self.native_object)
 
     def set_label(self, transaction: _Transaction, new_label: Label) -> None:
+        identity_map = transaction.identity_map
+        old_label = self.get_label() if identity_map is not None else None
         thing_type_set_label(transaction.native_object, self.native_object, new_label)
+        self._label = None
+        if identity_map is not None:
+            identity_map.relabel(self, old_label)
 
     @abstractmethod
     def get_instances(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE):
@@ -108,33 +118,31 @@ class _ThingType(ThingType, _Type, ABC):
 
     def get_plays(self, transaction: _Transaction, transitivity: Transitivity = Transitivity.TRANSITIVE
                   ) -> Iterator[_RoleType]:
-        return map(wrap_role_type,
-                   IteratorWrapper(thing_type_get_plays(transaction.native_object, self.native_object,
-                                                        transitivity.value),
-                                   concept_iterator_next))
+        return IteratorWrapper(thing_type_get_plays(transaction.native_object, self.native_object,
+                                                    transitivity.value),
+                               concept_iterator_next, _interning(transaction.identity_map, wrap_role_type))
 
     def get_plays_overridden(self, transaction: _Transaction, role_type: _RoleType) -> Optional[_RoleType]:
         if res := thing_type_get_plays_overridden(transaction.native_object,
                                                   self.native_object, role_type.native_object):
-            return wrap_role_type(res)
+            return _interned(transaction.identity_map, wrap_role_type(res))
         return None
 
     def get_owns(self, transaction: _Transaction, value_type: Optional[ValueType] = None,
                  transitivity: Transitivity = Transitivity.TRANSITIVE, annotations: Optional[set[Annotation]] = None
                  ) -> Iterator[AttributeType]:
-        return map(wrap_attribute_type,
-                   IteratorWrapper(thing_type_get_owns(transaction.native_object,
-                                                       self.native_object,
-                                                       value_type.native_object if value_type else None,
-                                                       transitivity.value,
-                                                       [anno.native_object for anno in annotations] if annotations
-                                                       else []),
-                                   concept_iterator_next))
+        return IteratorWrapper(thing_type_get_owns(transaction.native_object,
+                                                   self.native_object,
+                                                   value_type.native_object if value_type else None,
+                                                   transitivity.value,
+                                                   [anno.native_object for anno in annotations] if annotations
+                                                   else []),
+                               concept_iterator_next, _interning(transaction.identity_map, wrap_attribute_type))
 
     def get_owns_overridden(self, transaction: _Transaction, attribute_type: _AttributeType) -> Optional[AttributeType]:
         if res := thing_type_get_owns_overridden(transaction.native_object,
                                                  self.native_object, attribute_type.native_object):
-            return wrap_attribute_type(res)
+            return _interned(transaction.identity_map, wrap_attribute_type(res))
         return None
 
     def get_syntax(self, transaction: _Transaction) -> str:
@@ -143,6 +151,8 @@ class _ThingType(ThingType, _Type, ABC):
 
 class _Root(_ThingType):
 
+    __slots__ = ()
+
     ROOT_LABEL = Label.of("thing")
 
     def get_label(self) -> Label:
@@ -29,11 +29,19 @@ from typedb.common.transitivity import Transitivity
 from typedb.concept.concept import _Concept
 
 if TYPE_CHECKING:
+    from typedb.common.label import Label
+    from typedb.native_client_wrapper import Concept as NativeConcept
     from typedb.connection.transaction import _Transaction
 
 
 class _Type(Type, _Concept, ABC):
 
+    __slots__ = ("_label",)
+
+    def __init__(self, concept: NativeConcept):
+        super().__init__(concept)
+        self._label: Optional[Label] = None
+
     def as_type(self) -> Type:
         return self
 
@@ -23,20 +23,41 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from functools import singledispatchmethod
-from typing import Union
+from typing import Optional, Union
 
 from typedb.native_client_wrapper import value_new_boolean, value_new_long, value_new_double, value_new_string, \
     value_new_date_time_from_millis, value_is_boolean, value_is_long, value_is_double, value_is_string, \
     value_is_date_time, value_get_boolean, value_get_long, value_get_double, value_get_string, \
-    value_get_date_time_as_millis
+    value_get_date_time_as_millis, attribute_get_value, Concept as NativeConcept
 
 from typedb.api.concept.value.value import Value, ValueType
 from typedb.common.exception import TypeDBClientExceptionExt, UNEXPECTED_NATIVE_VALUE, ILLEGAL_STATE, MISSING_VALUE
 from typedb.concept.concept import _Concept
 
 
+def _decode_native_value(native_value: NativeConcept) -> tuple[ValueType, Union[bool, int, float, str, datetime]]:
+    if value_is_boolean(native_value):
+        return ValueType.BOOLEAN, value_get_boolean(native_value)
+    elif value_is_long(native_value):
+        return ValueType.LONG, value_get_long(native_value)
+    elif value_is_double(native_value):
+        return ValueType.DOUBLE, value_get_double(native_value)
+    elif value_is_string(native_value):
+        return ValueType.STRING, value_get_string(native_value)
+    elif value_is_date_time(native_value):
+        return ValueType.DATETIME, datetime.utcfromtimestamp(value_get_date_time_as_millis(native_value) / 1000)
+    else:
+        raise TypeDBClientExceptionExt(ILLEGAL_STATE)
+
+
+def _decode_native_attribute_value(native_attribute: NativeConcept) -> Union[bool, int, float, str, datetime]:
+    return _decode_native_value(attribute_get_value(native_attribute))[1]
+
+
 class _Value(Value, _Concept):
 
+    __slots__ = ("_decoded",)
+
     @singledispatchmethod
     def of(value):
         raise TypeDBClientExceptionExt.of(UNEXPECTED_NATIVE_VALUE)
@@ -67,63 +88,53 @@ class _Value(Value, _Concept):
     def _(value: Value):
         return value
 
+    def __init__(self, concept: NativeConcept):
+        super().__init__(concept)
+        self._decoded: Optional[tuple[ValueType, Union[bool, int, float, str, datetime]]] = None
+
+    def _decode(self) -> tuple[ValueType, Union[bool, int, float, str, datetime]]:
+        if self._decoded is None:
+            self._decoded = _decode_native_value(self.native_object)
+        return self._decoded
+
     def get_value_type(self) -> ValueType:
-        if self.is_boolean():
-            return ValueType.BOOLEAN
-        elif self.is_long():
-            return ValueType.LONG
-        elif self.is_double():
-            return ValueType.DOUBLE
-        elif self.is_string():
-            return ValueType.STRING
-        elif self.is_datetime():
-            return ValueType.DATETIME
-        else:
-            raise TypeDBClientExceptionExt(ILLEGAL_STATE)
+        return self._decode()[0]
 
     def get(self) -> Union[bool, int, float, str, datetime]:
-        if self.is_boolean():
-            return self.as_boolean()
-        elif self.is_long():
-            return self.as_long()
-        elif self.is_double():
-            return self.as_double()
-        elif self.is_string():
-            return self.as_string()
-        elif self.is_datetime():
-            return self.as_datetime()
-        else:
-            raise TypeDBClientExceptionExt(ILLEGAL_STATE)
+        return self._decode()[1]
 
     def is_boolean(self) -> bool:
-        return value_is_boolean(self.native_object)
+        return self._decode()[0] is ValueType.BOOLEAN
 
     def is_long(self) -> bool:
-        return value_is_long(self.native_object)
+        return self._decode()[0] is ValueType.LONG
 
     def is_double(self) -> bool:
-        return value_is_double(self.native_object)
+        return self._decode()[0] is ValueType.DOUBLE
 
     def is_string(self) -> bool:
-        return value_is_string(self.native_object)
+        return self._decode()[0] is ValueType.STRING
 
     def is_datetime(self) -> bool:
-        return value_is_date_time(self.native_object)
+        return self._decode()[0] is ValueType.DATETIME
+
+    # Casting to the wrong type is left to the native library, which reports the error
 
     def as_boolean(self) -> bool:
-        return value_get_boolean(self.native_object)
+        return self.get() if self.is_boolean() else value_get_boolean(self.native_object)
 
     def as_long(self) -> int:
-        return value_get_long(self.native_object)
+        return self.get() if self.is_long() else value_get_long(self.native_object)
 
     def as_double(self) -> float:
-        return value_get_double(self.native_object)
+        return self.get() if self.is_double() else value_get_double(self.native_object)
 
     def as_string(self) -> str:
-        return value_get_string(self.native_object)
+        return self.get() if self.is_string() else value_get_string(self.native_object)
 
     def as_datetime(self) -> datetime:
-        return datetime.utcfromtimestamp(value_get_date_time_as_millis(self.native_object) / 1000)
+        return self.get() if self.is_datetime() else \
+            datetime.utcfromtimestamp(value_get_date_time_as_millis(self.native_object) / 1000)
 
     def __str__(self):
         return str(self.get())
@@ -0,0 +1,85 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TYPE_CHECKING
+
+from typedb.api.connection.client import TypeDBClient
+from typedb.common.async_wrapper import AsyncWrapper, _run_in_executor
+from typedb.connection.async_database_manager import AsyncDatabaseManager
+from typedb.connection.async_session import AsyncSession
+from typedb.user.async_user_manager import AsyncUser, AsyncUserManager
+
+if TYPE_CHECKING:
+    from typedb.api.connection.options import TypeDBOptions
+    from typedb.api.connection.session import SessionType
+
+
+class AsyncClient(AsyncWrapper[TypeDBClient]):
+    """
+    Owns the thread pool that every blocking call of the client, and of the sessions, transactions and answer
+    streams opened through it, is offloaded to. Closing the client shuts the pool down.
+    """
+
+    @staticmethod
+    async def _open(connect: Callable[[], TypeDBClient], max_workers: Optional[int] = None) -> AsyncClient:
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="typedb-aio")
+        try:
+            return AsyncClient(await _run_in_executor(executor, connect), executor)
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+
+    def is_open(self) -> bool:
+        return self._blocking.is_open()
+
+    @property
+    def databases(self) -> AsyncDatabaseManager:
+        return AsyncDatabaseManager(self._blocking.databases, self._executor)
+
+    async def session(self, database: str, session_type: SessionType, options: Optional[TypeDBOptions] = None
+                      ) -> AsyncSession:
+        return AsyncSession(await self._run(self._blocking.session, database, session_type, options),
+                            self._executor)
+
+    @property
+    def users(self) -> AsyncUserManager:
+        return AsyncUserManager(self._blocking.users, self._executor)
+
+    async def user(self) -> AsyncUser:
+        return AsyncUser(await self._run(self._blocking.user), self._executor)
+
+    async def close(self) -> None:
+        try:
+            if self._blocking.is_open():
+                await self._run(self._blocking.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        if exc_tb is not None:
+            return False
@@ -0,0 +1,73 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from typing import Optional, TYPE_CHECKING
+
+from typedb.api.connection.database import Database, DatabaseManager
+from typedb.common.async_wrapper import AsyncWrapper
+
+if TYPE_CHECKING:
+    from typedb.api.connection.database import Replica
+
+
+class AsyncDatabase(AsyncWrapper[Database]):
+
+    @property
+    def name(self) -> str:
+        return self._blocking.name
+
+    async def schema(self) -> str:
+        return await self._run(self._blocking.schema)
+
+    async def rule_schema(self) -> str:
+        return await self._run(self._blocking.rule_schema)
+
+    async def type_schema(self) -> str:
+        return await self._run(self._blocking.type_schema)
+
+    async def delete(self) -> None:
+        await self._run(self._blocking.delete)
+
+    async def replicas(self) -> set[Replica]:
+        return await self._run(self._blocking.replicas)
+
+    async def primary_replica(self) -> Optional[Replica]:
+        return await self._run(self._blocking.primary_replica)
+
+    async def preferred_replica(self) -> Optional[Replica]:
+        return await self._run(self._blocking.preferred_replica)
+
+
+class AsyncDatabaseManager(AsyncWrapper[DatabaseManager]):
+
+    async def get(self, name: str) -> AsyncDatabase:
+        return AsyncDatabase(await self._run(self._blocking.get, name), self._executor)
+
+    async def contains(self, name: str) -> bool:
+        return await self._run(self._blocking.contains, name)
+
+    async def create(self, name: str) -> None:
+        await self._run(self._blocking.create, name)
+
+    async def all(self) -> list[AsyncDatabase]:
+        return [AsyncDatabase(database, self._executor) for database in await self._run(self._blocking.all)]
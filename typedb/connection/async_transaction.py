@@ -0,0 +1,75 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING
+
+from typedb.api.connection.transaction import TypeDBTransaction
+from typedb.common.async_wrapper import AsyncWrapper
+from typedb.query.async_query_manager import AsyncQueryManager
+
+if TYPE_CHECKING:
+    from typedb.api.connection.options import TypeDBOptions
+    from typedb.api.connection.transaction import TransactionType
+
+
+class AsyncTransaction(AsyncWrapper[TypeDBTransaction]):
+
+    def __init__(self, transaction: TypeDBTransaction, executor: Executor):
+        super().__init__(transaction, executor)
+        self._query_manager = AsyncQueryManager(transaction.query, executor)
+
+    def is_open(self) -> bool:
+        return self._blocking.is_open()
+
+    @property
+    def transaction_type(self) -> TransactionType:
+        return self._blocking.transaction_type
+
+    @property
+    def options(self) -> TypeDBOptions:
+        return self._blocking.options
+
+    @property
+    def query(self) -> AsyncQueryManager:
+        return self._query_manager
+
+    async def commit(self) -> None:
+        await self._run(self._blocking.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self._blocking.rollback)
+
+    def on_close(self, function: callable):
+        self._blocking.on_close(function)
+
+    async def close(self) -> None:
+        await self._run(self._blocking.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        if exc_tb is not None:
+            return False
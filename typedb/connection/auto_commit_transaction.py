@@ -0,0 +1,366 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from datetime import datetime
+from time import monotonic
+from typing import Any, Iterable, Iterator, Mapping, Optional, TYPE_CHECKING, Union
+
+from typedb.api.concept.concept_manager import ConceptManager
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.connection.transaction import TypeDBTransaction, TransactionType
+from typedb.api.logic.logic_manager import LogicManager
+from typedb.api.query.query_manager import QueryManager
+from typedb.common.exception import TypeDBClientExceptionExt, INVALID_BATCH_SIZE, POSITIVE_VALUE_REQUIRED, \
+    TRANSACTION_CLOSED
+from typedb.connection.transaction_pool import _DEFAULT_TRANSACTION_TIMEOUT_MILLIS
+
+if TYPE_CHECKING:
+    from typedb.api.answer.concept_column import ConceptColumn
+    from typedb.api.answer.concept_map import ConceptMap
+    from typedb.api.answer.concept_map_group import ConceptMapGroup
+    from typedb.api.answer.numeric import Numeric
+    from typedb.api.answer.numeric_group import NumericGroup
+    from typedb.api.answer.snapshot import ConceptMapGroupSnapshot, ConceptMapSnapshot, NumericGroupSnapshot
+    from typedb.api.concept.thing.attribute import Attribute
+    from typedb.api.concept.thing.entity import Entity
+    from typedb.api.concept.thing.relation import Relation
+    from typedb.api.concept.type.attribute_type import AttributeType
+    from typedb.api.concept.type.entity_type import EntityType
+    from typedb.api.concept.type.relation_type import RelationType
+    from typedb.api.concept.value.value import ValueType
+    from typedb.api.connection.session import TypeDBSession
+    from typedb.api.logic.explanation import Explanation
+    from typedb.api.logic.rule import Rule
+    from typedb.common.exception import TypeDBException
+    from typedb.concept.identity_map import _IdentityMap
+    from typedb.native_client_wrapper import Transaction as NativeTransaction
+    from typedb.query.template import QueryTemplate
+
+# A batch is grown or shrunk by at most this factor after each commit
+_MAX_ADJUSTMENT = 2.0
+# A batch should be committed within this fraction of the transaction timeout
+_TIMEOUT_HEADROOM_FRACTION = 0.5
+
+
+class AutoCommitTransaction(TypeDBTransaction):
+    """
+    A write transaction that commits every ``batch_size`` mutations and carries on in a new one. Mutations are
+    counted for insert, delete, update and insert_many queries, for the concept and logic managers' put methods, and
+    for concept methods that write data, such as ``set_has``, ``add_player``, ``create`` and ``put``; other writes
+    can be counted with ``track``. A commit happens before the mutation that would exceed the batch, so answers to
+    a query should be consumed before the next mutation.
+
+    After each commit, the batch size is adjusted so that commits take about ``target_commit_seconds`` and every
+    transaction is committed within half its timeout. Leaving the context commits the remaining mutations, unless an
+    exception was raised.
+
+    **Examples**
+
+    - ``with AutoCommitTransaction(session) as tx: for row in rows: tx.query.insert(query_for(row))``
+    """
+
+    def __init__(self, session: TypeDBSession, options: Optional[TypeDBOptions] = None, *, batch_size: int = 1000,
+                 min_batch_size: int = 10, max_batch_size: int = 100_000, target_commit_seconds: float = 1.0,
+                 identity_map: bool = False):
+        if min_batch_size < 1 or max_batch_size < min_batch_size:
+            raise TypeDBClientExceptionExt.of(INVALID_BATCH_SIZE, (min_batch_size, max_batch_size))
+        if batch_size < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, batch_size)
+        if not options:
+            options = TypeDBOptions()
+        self._session = session
+        self._options = options
+        self._identity_map = identity_map
+        self._batch_size = min(max(batch_size, min_batch_size), max_batch_size)
+        self._min_batch_size = min_batch_size
+        self._max_batch_size = max_batch_size
+        self._target_commit_seconds = target_commit_seconds
+        timeout_millis = options.transaction_timeout_millis or _DEFAULT_TRANSACTION_TIMEOUT_MILLIS
+        self._lifetime_limit_seconds = timeout_millis / 1000 * _TIMEOUT_HEADROOM_FRACTION
+        self._transaction: Optional[TypeDBTransaction] = None
+        self._opened_at = 0.0
+        self._mutations = 0
+        self._commits = 0
+        self._on_close_functions: list[callable] = []
+        self._closed = False
+        self._concept_manager = _AutoCommitConceptManager(self)
+        self._query_manager = _AutoCommitQueryManager(self)
+        self._logic_manager = _AutoCommitLogicManager(self)
+
+    def _current(self) -> TypeDBTransaction:
+        if self._closed:
+            raise TypeDBClientExceptionExt.of(TRANSACTION_CLOSED)
+        if self._transaction is None:
+            self._transaction = self._session.transaction(TransactionType.WRITE, self._options,
+                                                          identity_map=self._identity_map)
+            for function in self._on_close_functions:
+                self._transaction.on_close(function)
+            self._opened_at = monotonic()
+        return self._transaction
+
+    def _write(self, mutations: int = 1) -> TypeDBTransaction:
+        if self._mutations and self._mutations + mutations > self._batch_size:
+            self.commit()
+        self._mutations += mutations
+        return self._current()
+
+    def _adapt(self, mutations: int, commit_seconds: float, lifetime_seconds: float) -> None:
+        by_latency = self._target_commit_seconds * mutations / max(commit_seconds, 1e-6)
+        by_timeout = self._lifetime_limit_seconds * mutations / max(lifetime_seconds, 1e-6)
+        target = min(by_latency, by_timeout, self._batch_size * _MAX_ADJUSTMENT)
+        target = max(target, self._batch_size / _MAX_ADJUSTMENT)
+        self._batch_size = int(min(max(target, self._min_batch_size), self._max_batch_size))
+
+    @property
+    def batch_size(self) -> int:
+        """
+        The number of mutations after which the current transaction is committed.
+        """
+        return self._batch_size
+
+    @property
+    def pending_mutations(self) -> int:
+        return self._mutations
+
+    @property
+    def commits(self) -> int:
+        return self._commits
+
+    def track(self, mutations: int = 1) -> None:
+        """
+        Counts writes made in ways this transaction cannot see, and should be called before making them: if they
+        would exceed the batch, the mutations so far are committed first.
+        """
+        self._write(mutations)
+
+    def is_open(self) -> bool:
+        return not self._closed and self._session.is_open()
+
+    @property
+    def transaction_type(self) -> TransactionType:
+        return TransactionType.WRITE
+
+    @property
+    def options(self) -> TypeDBOptions:
+        return self._options
+
+    @property
+    def native_object(self) -> NativeTransaction:
+        return self._current().native_object
+
+    @property
+    def native_write_object(self) -> NativeTransaction:
+        return self._write().native_object
+
+    @property
+    def identity_map(self) -> Optional[_IdentityMap]:
+        return self._current().identity_map
+
+    @property
+    def concepts(self) -> ConceptManager:
+        return self._concept_manager
+
+    @property
+    def logic(self) -> LogicManager:
+        return self._logic_manager
+
+    @property
+    def query(self) -> QueryManager:
+        return self._query_manager
+
+    def commit(self) -> None:
+        """
+        Commits the mutations made since the last commit. The transaction stays usable, continuing in a new one.
+        """
+        if self._closed:
+            raise TypeDBClientExceptionExt.of(TRANSACTION_CLOSED)
+        if self._transaction is None:
+            return
+        transaction, mutations = self._transaction, self._mutations
+        self._transaction = None
+        self._mutations = 0
+        start = monotonic()
+        transaction.commit()
+        end = monotonic()
+        self._commits += 1
+        if mutations:
+            self._adapt(mutations, end - start, end - self._opened_at)
+
+    def rollback(self) -> None:
+        """
+        Discards the mutations made since the last commit.
+        """
+        if self._transaction is not None:
+            self._transaction.rollback()
+        self._mutations = 0
+
+    def on_close(self, function: callable):
+        """
+        Registers ``function`` to be called when each of the underlying transactions closes.
+        """
+        self._on_close_functions.append(function)
+        if self._transaction is not None:
+            self._transaction.on_close(function)
+
+    def close(self) -> None:
+        self._closed = True
+        if self._transaction is not None:
+            self._transaction.close()
+            self._transaction = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_tb is None and not self._closed:
+                self.commit()
+        finally:
+            self.close()
+        if exc_tb is not None:
+            return False
+
+
+class _AutoCommitQueryManager(QueryManager):
+
+    def __init__(self, transaction: AutoCommitTransaction):
+        self._transaction = transaction
+
+    def match(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+              cached: bool = False) -> Iterator[Union[ConceptMap, ConceptMapSnapshot]]:
+        return self._transaction._current().query.match(query, options, detached=detached, cached=cached)
+
+    def match_values(self, query: str, options: Optional[TypeDBOptions] = None
+                     ) -> Iterator[dict[str, Union[bool, int, float, str, datetime]]]:
+        return self._transaction._current().query.match_values(query, options)
+
+    def match_columns(self, query: str, variables: Optional[Iterable[str]] = None,
+                      options: Optional[TypeDBOptions] = None) -> dict[str, ConceptColumn]:
+        return self._transaction._current().query.match_columns(query, variables, options)
+
+    def match_aggregate(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+                        cached: bool = False) -> Numeric:
+        return self._transaction._current().query.match_aggregate(query, options, detached=detached, cached=cached)
+
+    def match_group(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+                    cached: bool = False) -> Iterator[Union[ConceptMapGroup, ConceptMapGroupSnapshot]]:
+        return self._transaction._current().query.match_group(query, options, detached=detached, cached=cached)
+
+    def match_group_aggregate(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+                              cached: bool = False) -> Iterator[Union[NumericGroup, NumericGroupSnapshot]]:
+        return self._transaction._current().query.match_group_aggregate(query, options, detached=detached,
+                                                                        cached=cached)
+
+    def insert(self, query: str, options: Optional[TypeDBOptions] = None) -> Iterator[ConceptMap]:
+        return self._transaction._write().query.insert(query, options)
+
+    def insert_many(self, template: Union[str, QueryTemplate], rows: Iterable[Mapping[str, Any]],
+                    batch_size: int = 100, options: Optional[TypeDBOptions] = None, *, wrap_answers: bool = False
+                    ) -> Union[int, list[ConceptMap]]:
+        """
+        Runs ``template`` once per row, in slices of ``batch_size`` rows that are each counted before being written.
+        """
+        if batch_size < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, batch_size)
+        result: Union[int, list[ConceptMap]] = [] if wrap_answers else 0
+        rows = iter(rows)
+        while batch := [row for _, row in zip(range(batch_size), rows)]:
+            result += self._transaction._write(len(batch)).query.insert_many(template, batch, batch_size, options,
+                                                                             wrap_answers=wrap_answers)
+        return result
+
+    def delete(self, query: str, options: Optional[TypeDBOptions] = None) -> None:
+        self._transaction._write().query.delete(query, options)
+
+    def define(self, query: str, options: TypeDBOptions = None) -> None:
+        self._transaction._write().query.define(query, options)
+
+    def undefine(self, query: str, options: TypeDBOptions = None) -> None:
+        self._transaction._write().query.undefine(query, options)
+
+    def update(self, query: str, options: Optional[TypeDBOptions] = None) -> Iterator[ConceptMap]:
+        return self._transaction._write().query.update(query, options)
+
+    def explain(self, explainable: ConceptMap.Explainable, options: Optional[TypeDBOptions] = None
+                ) -> Iterator[Explanation]:
+        return self._transaction._current().query.explain(explainable, options)
+
+
+class _AutoCommitConceptManager(ConceptManager):
+
+    def __init__(self, transaction: AutoCommitTransaction):
+        self._transaction = transaction
+
+    def get_root_entity_type(self) -> EntityType:
+        return self._transaction._current().concepts.get_root_entity_type()
+
+    def get_root_relation_type(self) -> RelationType:
+        return self._transaction._current().concepts.get_root_relation_type()
+
+    def get_root_attribute_type(self) -> AttributeType:
+        return self._transaction._current().concepts.get_root_attribute_type()
+
+    def get_entity_type(self, label: str) -> EntityType:
+        return self._transaction._current().concepts.get_entity_type(label)
+
+    def put_entity_type(self, label: str) -> EntityType:
+        return self._transaction._write().concepts.put_entity_type(label)
+
+    def get_relation_type(self, label: str) -> RelationType:
+        return self._transaction._current().concepts.get_relation_type(label)
+
+    def put_relation_type(self, label: str) -> RelationType:
+        return self._transaction._write().concepts.put_relation_type(label)
+
+    def get_attribute_type(self, label: str) -> AttributeType:
+        return self._transaction._current().concepts.get_attribute_type(label)
+
+    def put_attribute_type(self, label: str, value_type: ValueType) -> AttributeType:
+        return self._transaction._write().concepts.put_attribute_type(label, value_type)
+
+    def get_entity(self, iid: str) -> Entity:
+        return self._transaction._current().concepts.get_entity(iid)
+
+    def get_relation(self, iid: str) -> Relation:
+        return self._transaction._current().concepts.get_relation(iid)
+
+    def get_attribute(self, iid: str) -> Attribute:
+        return self._transaction._current().concepts.get_attribute(iid)
+
+    def get_schema_exception(self) -> list[TypeDBException]:
+        return self._transaction._current().concepts.get_schema_exception()
+
+
+class _AutoCommitLogicManager(LogicManager):
+
+    def __init__(self, transaction: AutoCommitTransaction):
+        self._transaction = transaction
+
+    def get_rule(self, label: str) -> Optional[Rule]:
+        return self._transaction._current().logic.get_rule(label)
+
+    def get_rules(self) -> Iterator[Rule]:
+        return self._transaction._current().logic.get_rules()
+
+    def put_rule(self, label: str, when: str, then: str) -> Rule:
+        return self._transaction._write().logic.put_rule(label, when, then)
@@ -28,28 +28,70 @@ from typedb.native_client_wrapper import connection_open_plaintext, connection_o
 
 from typedb.api.connection.client import TypeDBClient
 from typedb.api.connection.options import TypeDBOptions
-from typedb.common.exception import TypeDBClientExceptionExt, CLIENT_CLOSED
+from typedb.common.exception import TypeDBClientExceptionExt, CLIENT_CLOSED, NON_NEGATIVE_VALUE_REQUIRED
+from typedb.common.fork import disown_inherited, fork_generation, reopen_lock
 from typedb.common.native_wrapper import NativeWrapper
 from typedb.connection.database_manager import _DatabaseManager
+from typedb.connection.result_cache import _ResultCache
 from typedb.connection.session import _Session
+from typedb.connection.session_pool import _SessionPool
 from typedb.user.user_manager import _UserManager
 
 if TYPE_CHECKING:
     from typedb.api.connection.credential import TypeDBCredential
+    from typedb.api.connection.result_cache import ResultCache
     from typedb.api.connection.session import SessionType
+    from typedb.api.connection.session_pool import SessionPool
     from typedb.api.user.user import UserManager, User
+    from typedb.connection.database import _Database
 
 
 class _Client(TypeDBClient, NativeWrapper[NativeConnection]):
 
-    def __init__(self, addresses: list[str], credential: Optional[TypeDBCredential] = None):
-        if credential:
-            native_connection = connection_open_encrypted(addresses, credential.native_object)
+    def __init__(self, addresses: list[str], credential: Optional[TypeDBCredential] = None, *,
+                 session_pool_min_size: int = 0, session_pool_max_size: int = 16, result_cache_size: int = 0,
+                 result_cache_ttl_seconds: Optional[float] = None):
+        if result_cache_size < 0:
+            raise TypeDBClientExceptionExt.of(NON_NEGATIVE_VALUE_REQUIRED, result_cache_size)
+        self._addresses = addresses
+        self._credential = credential
+        self._result_cache = _ResultCache(result_cache_size, result_cache_ttl_seconds) if result_cache_size else None
+        super().__init__(self._open_connection())
+        self._database_manager = _DatabaseManager(self._native_object)
+        self._user_manager = _UserManager(self._native_object)
+        self._session_pool = _SessionPool(self._open_database, session_pool_min_size, session_pool_max_size,
+                                          result_cache=self._result_cache)
+        self._fork_generation = fork_generation()
+
+    def _open_connection(self) -> NativeConnection:
+        if self._credential:
+            return connection_open_encrypted(self._addresses, self._credential.native_object)
         else:
-            native_connection = connection_open_plaintext(addresses[0])
-        super().__init__(native_connection)
-        self._database_manager = _DatabaseManager(native_connection)
-        self._user_manager = _UserManager(native_connection)
+            return connection_open_plaintext(self._addresses[0])
+
+    def _check_fork(self) -> None:
+        if self._fork_generation != fork_generation():
+            with reopen_lock():
+                if self._fork_generation != fork_generation():
+                    self._reopen_after_fork()
+
+    def _disown_after_fork(self) -> None:
+        for native_object in (self._native_object, self._database_manager._native_object,
+                              self._user_manager._native_object):
+            disown_inherited(native_object)
+        self._session_pool._reset_after_fork()
+        if self._result_cache is not None:
+            self._result_cache._reset_after_fork()
+
+    def _reopen_after_fork(self) -> None:
+        self._disown_after_fork()
+        NativeWrapper.__init__(self, self._open_connection())
+        self._database_manager = _DatabaseManager(self._native_object)
+        self._user_manager = _UserManager(self._native_object)
+        self._fork_generation = fork_generation()
+
+    def _open_database(self, name: str) -> _Database:
+        return self.databases._get_unchecked(name)
 
     @property
     def _native_object_not_owned_exception(self) -> TypeDBClientExceptionExt:
@@ -57,24 +99,40 @@ class _Client(TypeDBClient, NativeWrapper[NativeConnection]):
 
     @property
     def _native_connection(self) -> NativeConnection:
+        self._check_fork()
         return self.native_object
 
     def session(self, database: str, session_type: SessionType, options: TypeDBOptions = None) -> _Session:
-        return _Session(self.databases.get(database), session_type, options if options else TypeDBOptions())
+        return _Session(self.databases.get(database), session_type, options if options else TypeDBOptions(),
+                        reopen_database=self._open_database, result_cache=self._result_cache)
+
+    @property
+    def session_pool(self) -> SessionPool:
+        self._check_fork()
+        return self._session_pool
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        self._check_fork()
+        return self._result_cache
 
     def is_open(self) -> bool:
-        return connection_is_open(self._native_connection)
+        self._check_fork()
+        # A client closed in a forked child only gives up the connection inherited from its parent
+        return bool(self._native_object.thisown) and connection_is_open(self._native_object)
 
     @property
     def databases(self) -> _DatabaseManager:
+        self._check_fork()
         return self._database_manager
 
     @property
     def users(self) -> UserManager:
+        self._check_fork()
         return self._user_manager
 
     def user(self) -> User:
-        return self._user_manager.get_current_user()
+        return self.users.get_current_user()
 
     def __enter__(self):
         return self
@@ -85,4 +143,11 @@ class _Client(TypeDBClient, NativeWrapper[NativeConnection]):
             return False
 
     def close(self) -> None:
+        if self._fork_generation != fork_generation():
+            with reopen_lock():
+                if self._fork_generation != fork_generation():
+                    self._disown_after_fork()
+                    self._fork_generation = fork_generation()
+                    return
+        self._session_pool.close()
         connection_force_close(self._native_connection)
@@ -56,6 +56,10 @@ class _DatabaseManager(DatabaseManager, NativeWrapper[NativeDatabaseManager]):
             raise TypeDBClientExceptionExt.of(DATABASE_DELETED, name)
         return _Database(databases_get(self.native_object, name))
 
+    def _get_unchecked(self, name: str) -> _Database:
+        # Skips the round trip of contains() for callers that handle the native error of a missing database
+        return _Database(databases_get(self.native_object, _not_blank(name)))
+
     def contains(self, name: str) -> bool:
         return databases_contains(self.native_object, _not_blank(name))
 
@@ -63,4 +67,4 @@ class _DatabaseManager(DatabaseManager, NativeWrapper[NativeDatabaseManager]):
         databases_create(self.native_object, _not_blank(name))
 
     def all(self) -> list[_Database]:
-        return list(map(_Database, IteratorWrapper(databases_all(self.native_object), database_iterator_next)))
+        return list(IteratorWrapper(databases_all(self.native_object), database_iterator_next, _Database))
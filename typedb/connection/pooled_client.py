@@ -0,0 +1,165 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from functools import partial
+from itertools import count
+from threading import Lock
+from typing import Callable, Iterator, Optional, TYPE_CHECKING
+
+from typedb.api.connection.client import TypeDBClient, LoadBalancing
+from typedb.api.connection.session_pool import SessionPool
+from typedb.common.exception import TypeDBClientExceptionExt, POSITIVE_VALUE_REQUIRED
+from typedb.common.fork import fork_generation, reopen_lock
+
+if TYPE_CHECKING:
+    from typedb.api.connection.options import TypeDBOptions
+    from typedb.api.connection.result_cache import ResultCache
+    from typedb.api.connection.session import SessionType
+    from typedb.api.user.user import UserManager, User
+    from typedb.connection.client import _Client
+    from typedb.connection.database_manager import _DatabaseManager
+    from typedb.connection.session import _Session
+
+
+class _PooledClient(TypeDBClient):
+    """
+    Spreads sessions over several native connections to the same server or cluster. Database and user management
+    go through the first connection.
+    """
+
+    def __init__(self, connect: Callable[[], _Client], connections: int, load_balancing: LoadBalancing):
+        if connections < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, connections)
+        self._clients: list[_Client] = []
+        try:
+            for _ in range(connections):
+                self._clients.append(connect())
+        except BaseException:
+            for client in self._clients:
+                client.close()
+            raise
+        self._load_balancing = load_balancing
+        self._loads = [0] * connections
+        self._round_robin = count()
+        self._lock = Lock()
+        self._fork_generation = fork_generation()
+        self._session_pool = _PooledSessionPool(self)
+
+    def _check_fork(self) -> None:
+        # A lock held by another thread at the time of a fork is never released in the child
+        if self._fork_generation != fork_generation():
+            with reopen_lock():
+                if self._fork_generation != fork_generation():
+                    self._lock = Lock()
+                    self._fork_generation = fork_generation()
+
+    def _acquire_connection(self) -> int:
+        self._check_fork()
+        with self._lock:
+            if self._load_balancing is LoadBalancing.ROUND_ROBIN:
+                index = next(self._round_robin) % len(self._clients)
+            else:
+                index = min(range(len(self._loads)), key=self._loads.__getitem__)
+            self._loads[index] += 1
+            return index
+
+    def _release_connection(self, index: int) -> None:
+        self._check_fork()
+        with self._lock:
+            self._loads[index] -= 1
+
+    @property
+    def connections(self) -> int:
+        return len(self._clients)
+
+    def session(self, database: str, session_type: SessionType, options: Optional[TypeDBOptions] = None
+                ) -> _Session:
+        index = self._acquire_connection()
+        try:
+            session = self._clients[index].session(database, session_type, options)
+        except BaseException:
+            self._release_connection(index)
+            raise
+        session.on_close(partial(self._release_connection, index))
+        return session
+
+    @property
+    def session_pool(self) -> SessionPool:
+        return self._session_pool
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        # Each connection would only see commits made through itself, so pooled clients do not cache answers
+        return None
+
+    def is_open(self) -> bool:
+        return all(client.is_open() for client in self._clients)
+
+    @property
+    def databases(self) -> _DatabaseManager:
+        return self._clients[0].databases
+
+    @property
+    def users(self) -> UserManager:
+        return self._clients[0].users
+
+    def user(self) -> User:
+        return self._clients[0].user()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_tb is not None:
+            return False
+
+    def close(self) -> None:
+        for client in self._clients:
+            client.close()
+
+
+class _PooledSessionPool(SessionPool):
+
+    def __init__(self, client: _PooledClient):
+        self._client = client
+
+    @contextmanager
+    def session(self, database: str, session_type: SessionType, options: Optional[TypeDBOptions] = None,
+                timeout: Optional[float] = None) -> Iterator[_Session]:
+        index = self._client._acquire_connection()
+        try:
+            with self._client._clients[index].session_pool.session(database, session_type, options,
+                                                                   timeout) as session:
+                yield session
+        finally:
+            self._client._release_connection(index)
+
+    def evict_idle(self) -> None:
+        for client in self._client._clients:
+            client.session_pool.evict_idle()
+
+    def close(self) -> None:
+        for client in self._client._clients:
+            client.session_pool.close()
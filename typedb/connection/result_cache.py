@@ -0,0 +1,150 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
+
+from typedb.api.connection.result_cache import ResultCache
+from typedb.common.exception import TypeDBClientExceptionExt, POSITIVE_VALUE_REQUIRED
+from typedb.common.iterator_wrapper import IteratorWrapper
+from typedb.common.options_key import _options_key
+
+if TYPE_CHECKING:
+    from typedb.api.connection.options import TypeDBOptions
+
+
+class _ResultCache(ResultCache):
+
+    def __init__(self, max_entries: int, ttl_seconds: Optional[float] = None):
+        if max_entries < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, max_entries)
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        # Least recently used first, mapping keys to (database generation, expiry, answers)
+        self._entries: OrderedDict[tuple, tuple[int, float, Any]] = OrderedDict()
+        # Bumped by every commit on a database; answers read before the bump are never stored or served after it
+        self._generations: dict[str, int] = {}
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _reset_after_fork(self) -> None:
+        self._lock = Lock()
+        self.clear()
+
+    def _reads(self, database: str, options: TypeDBOptions) -> _CachedReads:
+        with self._lock:
+            generation = self._generations.get(database, 0)
+        return _CachedReads(self, database, generation, _options_key(options))
+
+    def _get(self, key: tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                generation, expiry, answers = entry
+                if generation == self._generations.get(key[0], 0) and expiry > monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return answers
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def _put(self, key: tuple, generation: int, answers: Any) -> None:
+        expiry = monotonic() + self._ttl_seconds if self._ttl_seconds is not None else float("inf")
+        with self._lock:
+            if generation != self._generations.get(key[0], 0):
+                return
+            self._entries[key] = (generation, expiry, answers)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def invalidate(self, database: str) -> None:
+        with self._lock:
+            self._generations[database] = self._generations.get(database, 0) + 1
+            for key in [key for key in self._entries if key[0] == database]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            for database in self._generations:
+                self._generations[database] += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _CachedReads:
+    """
+    The view of a result cache from one read transaction, which stores answers only if no commit on its database
+    happened since the transaction opened. Explainable answers belong to their transaction, so they are not cached.
+    """
+
+    def __init__(self, cache: _ResultCache, database: str, generation: int, transaction_options_key: tuple):
+        self._cache = cache
+        self._database = database
+        self._generation = generation
+        self._transaction_options_key = transaction_options_key
+
+    def key(self, kind: str, query: str, options: Optional[TypeDBOptions]) -> Optional[tuple]:
+        """
+        The key of a query's answers in the cache, or None if they must not be cached.
+        """
+        if options and options.explain:
+            return None
+        return self._database, kind, query, self._transaction_options_key, _options_key(options) if options else None
+
+    def get_or_load(self, key: tuple, load: Callable[[], Any]) -> Any:
+        if (answers := self._cache._get(key)) is None:
+            answers = load()
+            self._cache._put(key, self._generation, answers)
+        return answers
+
+    def stream(self, key: tuple, load: Callable[[], Iterator[Any]]) -> IteratorWrapper[Any]:
+        """
+        Returns the cached snapshots of a stream of answers, or otherwise streams snapshots of the answers as they are
+        loaded, and caches them once the stream is exhausted.
+        """
+        if (answers := self._cache._get(key)) is not None:
+            return IteratorWrapper.of(answers)
+        return IteratorWrapper.of(self._snapshots_then_put(key, load()))
+
+    def _snapshots_then_put(self, key: tuple, answers: Iterator[Any]) -> Iterator[Any]:
+        snapshots = []
+        for answer in answers:
+            snapshot = answer.snapshot()
+            snapshots.append(snapshot)
+            yield snapshot
+        self._cache._put(key, self._generation, tuple(snapshots))
@@ -21,7 +21,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import Callable, TYPE_CHECKING, Optional
+from weakref import WeakSet
 
 from typedb.native_client_wrapper import session_new, session_on_close, session_force_close, session_is_open, \
     session_get_database_name, SessionCallbackDirector, Session as NativeSession
@@ -29,25 +30,59 @@ from typedb.native_client_wrapper import session_new, session_on_close, session_
 from typedb.api.connection.options import TypeDBOptions
 from typedb.api.connection.session import TypeDBSession
 from typedb.common.exception import TypeDBClientExceptionExt, SESSION_CLOSED
+from typedb.common.fork import disown_inherited, fork_generation, reopen_lock
 from typedb.common.native_wrapper import NativeWrapper
 from typedb.connection.transaction import _Transaction
+from typedb.connection.transaction_pool import _ReadTransactionPool
 
 if TYPE_CHECKING:
     from typedb.api.connection.session import SessionType
     from typedb.api.connection.transaction import TypeDBTransaction, TransactionType
+    from typedb.api.connection.transaction_pool import ReadTransactionPool
     from typedb.connection.database import _Database
+    from typedb.connection.result_cache import _ResultCache
 
 
 class _Session(TypeDBSession, NativeWrapper[NativeSession]):
 
-    def __init__(self, database: _Database, session_type: SessionType, options: Optional[TypeDBOptions] = None):
+    def __init__(self, database: _Database, session_type: SessionType, options: Optional[TypeDBOptions] = None, *,
+                 reopen_database: Optional[Callable[[str], _Database]] = None,
+                 result_cache: Optional[_ResultCache] = None):
         if not options:
             options = TypeDBOptions()
         self._type = session_type
         self._options = options
+        self._transaction_pools = WeakSet()
+        self._database_name = database.name
+        self._reopen_database = reopen_database
+        self._result_cache = result_cache
+        self._on_close_functions = []
+        self._closed = False
+        self._fork_generation = fork_generation()
+        super().__init__(self._open(database))
+
+    def _open(self, database: _Database) -> NativeSession:
         native_database = database.native_object
         native_database.thisown = 0
-        super().__init__(session_new(native_database, session_type.value, options.native_object))
+        return session_new(native_database, self._type.value, self._options.native_object)
+
+    @property
+    def native_object(self) -> NativeSession:
+        if self._fork_generation != fork_generation():
+            with reopen_lock():
+                if self._fork_generation != fork_generation():
+                    self._reopen_after_fork()
+        return super().native_object
+
+    def _reopen_after_fork(self) -> None:
+        # A session that was open in the parent process is reopened through the client's new connection, and its
+        # on_close callbacks registered again; without a client to reopen through, it stays closed
+        disown_inherited(self._native_object)
+        if not self._closed and self._reopen_database is not None:
+            NativeWrapper.__init__(self, self._open(self._reopen_database(self._database_name)))
+            for function in self._on_close_functions:
+                session_on_close(self._native_object, _Session.Callback(function).__disown__())
+        self._fork_generation = fork_generation()
 
     @property
     def _native_object_not_owned_exception(self) -> TypeDBClientExceptionExt:
@@ -67,14 +102,30 @@ class _Session(TypeDBSession, NativeWrapper[NativeSession]):
     def options(self) -> TypeDBOptions:
         return self._options
 
-    def transaction(self, transaction_type: TransactionType, options: TypeDBOptions = None) -> TypeDBTransaction:
-        return _Transaction(self, transaction_type, options)
+    def transaction(self, transaction_type: TransactionType, options: TypeDBOptions = None, *,
+                    identity_map: bool = False) -> TypeDBTransaction:
+        return _Transaction(self, transaction_type, options, identity_map=identity_map)
+
+    def read_transaction_pool(self, size: int, options: TypeDBOptions = None) -> ReadTransactionPool:
+        pool = _ReadTransactionPool(self, size, options)
+        self._transaction_pools.add(pool)
+        return pool
 
     def close(self) -> None:
+        for pool in list(self._transaction_pools):
+            pool.close()
+        self._closed = True
+        if self._fork_generation != fork_generation():
+            # The session was inherited from the parent process, which still owns it and is the one to close it
+            with reopen_lock():
+                self._fork_generation = fork_generation()
+                disown_inherited(self._native_object)
+            return
         session_force_close(self.native_object)
 
     def on_close(self, function: callable):
         session_on_close(self.native_object, _Session.Callback(function).__disown__())
+        self._on_close_functions.append(function)
 
     class Callback(SessionCallbackDirector):
 
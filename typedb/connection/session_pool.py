@@ -0,0 +1,230 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition, Lock, RLock
+from time import monotonic
+from typing import Callable, Iterator, Optional, TYPE_CHECKING
+
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.connection.session_pool import SessionPool
+from typedb.common.exception import TypeDBClientExceptionExt, CLIENT_CLOSED, INVALID_POOL_SIZE, \
+    SESSION_POOL_EXHAUSTED
+from typedb.common.fork import disown_inherited
+from typedb.common.options_key import _options_key
+from typedb.connection.session import _Session
+
+if TYPE_CHECKING:
+    from typedb.api.connection.session import SessionType
+    from typedb.connection.database import _Database
+    from typedb.connection.result_cache import _ResultCache
+
+# The server's default session idle timeout, used when the session options do not set one
+_DEFAULT_IDLE_TIMEOUT_MILLIS = 30_000
+_EVICTION_INTERVAL_SECONDS = 1.0
+
+
+def _close_all(sessions: list[_Session]) -> None:
+    for session in sessions:
+        if session.is_open():
+            session.close()
+
+
+class _PooledSessions:
+    """
+    The sessions for one database, session type and options. Idle sessions are lent most recently used first, so
+    that the least recently used ones age out.
+    """
+
+    def __init__(self, open_session: Callable[[], _Session], min_size: int, max_size: int,
+                 idle_timeout_seconds: float):
+        self._open_session = open_session
+        self._min_size = min_size
+        self._max_size = max_size
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._idle: deque[tuple[_Session, float]] = deque()
+        self._size = 0
+        self._closed = False
+        # Re-entrant, as closing a session may run its on_close callback on the closing thread
+        self._available = Condition(RLock())
+
+    def warm(self) -> None:
+        while True:
+            with self._available:
+                if self._closed or self._size >= self._min_size:
+                    return
+                self._size += 1
+            self.release(self._open())
+
+    def acquire(self, database: str, timeout: Optional[float]) -> _Session:
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._available:
+            while True:
+                if self._closed:
+                    raise TypeDBClientExceptionExt.of(CLIENT_CLOSED)
+                while self._idle:
+                    session, _ = self._idle.pop()
+                    if session.is_open():
+                        return session
+                    self._size -= 1
+                if self._size < self._max_size:
+                    self._size += 1
+                    break
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TypeDBClientExceptionExt.of(SESSION_POOL_EXHAUSTED, database)
+                self._available.wait(remaining)
+        return self._open()
+
+    def _open(self) -> _Session:
+        try:
+            session = self._open_session()
+        except BaseException:
+            with self._available:
+                self._size -= 1
+                self._available.notify()
+            raise
+        session.on_close(self._on_close_callback(weakref.ref(session)))
+        return session
+
+    def _on_close_callback(self, session_ref: weakref.ref) -> Callable[[], None]:
+        def on_close():
+            if (session := session_ref()) is not None:
+                self._discard(session)
+        return on_close
+
+    def _discard(self, session: _Session) -> None:
+        # Only idle sessions are counted here: a lent session is counted out when it is released closed
+        with self._available:
+            for index, (idle_session, _) in enumerate(self._idle):
+                if idle_session is session:
+                    del self._idle[index]
+                    self._size -= 1
+                    self._available.notify()
+                    return
+
+    def release(self, session: _Session) -> None:
+        with self._available:
+            if session.is_open() and not self._closed:
+                self._idle.append((session, monotonic()))
+                self._available.notify()
+                return
+            self._size -= 1
+            self._available.notify()
+        _close_all([session])
+
+    def evict_idle(self, now: float) -> None:
+        evicted = []
+        with self._available:
+            while self._idle and self._size > self._min_size \
+                    and now - self._idle[0][1] > self._idle_timeout_seconds:
+                evicted.append(self._idle.popleft()[0])
+                self._size -= 1
+        _close_all(evicted)
+
+    def _disown_after_fork(self) -> None:
+        for session, _ in self._idle:
+            disown_inherited(session._native_object)
+
+    def close(self) -> None:
+        with self._available:
+            self._closed = True
+            idle = [session for session, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._available.notify_all()
+        _close_all(idle)
+
+
+class _SessionPool(SessionPool):
+
+    def __init__(self, open_database: Callable[[str], _Database], min_size: int = 0, max_size: int = 16, *,
+                 result_cache: Optional[_ResultCache] = None):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise TypeDBClientExceptionExt.of(INVALID_POOL_SIZE, (min_size, max_size))
+        self._open_database = open_database
+        self._result_cache = result_cache
+        self._min_size = min_size
+        self._max_size = max_size
+        self._pools: dict[tuple, _PooledSessions] = {}
+        self._lock = Lock()
+        self._next_eviction = monotonic() + _EVICTION_INTERVAL_SECONDS
+        self._closed = False
+
+    def _pooled_sessions(self, database: str, session_type: SessionType, options: TypeDBOptions) -> _PooledSessions:
+        key = (database, session_type, _options_key(options))
+        with self._lock:
+            if self._closed:
+                raise TypeDBClientExceptionExt.of(CLIENT_CLOSED)
+            if pooled_sessions := self._pools.get(key):
+                return pooled_sessions
+            idle_timeout_millis = options.session_idle_timeout_millis or _DEFAULT_IDLE_TIMEOUT_MILLIS
+            pooled_sessions = self._pools[key] = _PooledSessions(
+                lambda: _Session(self._open_database(database), session_type, options,
+                                 reopen_database=self._open_database, result_cache=self._result_cache),
+                self._min_size, self._max_size, idle_timeout_millis / 1000)
+        pooled_sessions.warm()
+        return pooled_sessions
+
+    @contextmanager
+    def session(self, database: str, session_type: SessionType, options: Optional[TypeDBOptions] = None,
+                timeout: Optional[float] = None) -> Iterator[_Session]:
+        if not options:
+            options = TypeDBOptions()
+        self._evict_idle_if_due()
+        pooled_sessions = self._pooled_sessions(database, session_type, options)
+        session = pooled_sessions.acquire(database, timeout)
+        try:
+            yield session
+        finally:
+            pooled_sessions.release(session)
+
+    def _evict_idle_if_due(self) -> None:
+        now = monotonic()
+        if now >= self._next_eviction:
+            self._next_eviction = now + _EVICTION_INTERVAL_SECONDS
+            self.evict_idle()
+
+    def evict_idle(self) -> None:
+        now = monotonic()
+        with self._lock:
+            pools = list(self._pools.values())
+        for pooled_sessions in pools:
+            pooled_sessions.evict_idle(now)
+
+    def _reset_after_fork(self) -> None:
+        # Drops the sessions inherited from the parent process, along with locks that its other threads may hold
+        self._lock = Lock()
+        for pooled_sessions in self._pools.values():
+            pooled_sessions._disown_after_fork()
+        self._pools = {}
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pooled_sessions in pools:
+            pooled_sessions.close()
@@ -0,0 +1,145 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Callable, Hashable, Optional, TYPE_CHECKING
+
+from typedb.api.connection.client import TypeDBClient
+from typedb.common.exception import TypeDBClientExceptionExt, CLIENT_CLOSED
+from typedb.common.fork import fork_generation, reopen_lock
+
+if TYPE_CHECKING:
+    from typedb.api.connection.options import TypeDBOptions
+    from typedb.api.connection.session import SessionType
+    from typedb.api.connection.result_cache import ResultCache
+    from typedb.api.connection.session_pool import SessionPool
+    from typedb.api.user.user import UserManager, User
+    from typedb.connection.client import _Client
+    from typedb.connection.database_manager import _DatabaseManager
+    from typedb.connection.session import _Session
+
+
+class _SharedConnection:
+
+    def __init__(self, key: Hashable, client: _Client):
+        self.key = key
+        self.client = client
+        self.references = 0
+
+
+class _ClientRegistry:
+    """
+    Shares one client per address set and credential across the process. Every handle holds a reference, and
+    the connection is closed when the last handle is closed.
+    """
+
+    def __init__(self):
+        self._connections: dict[Hashable, _SharedConnection] = {}
+        self._lock = Lock()
+        self._fork_generation = fork_generation()
+
+    def _check_fork(self) -> None:
+        # A lock held by another thread at the time of a fork is never released in the child
+        if self._fork_generation != fork_generation():
+            with reopen_lock():
+                if self._fork_generation != fork_generation():
+                    self._lock = Lock()
+                    self._fork_generation = fork_generation()
+
+    def acquire(self, key: Hashable, connect: Callable[[], _Client]) -> _SharedClient:
+        self._check_fork()
+        with self._lock:
+            connection = self._connections.get(key)
+            if connection is None or not connection.client.is_open():
+                # Connecting under the lock makes concurrent first users of an address wait for one connection
+                connection = self._connections[key] = _SharedConnection(key, connect())
+            connection.references += 1
+        return _SharedClient(self, connection)
+
+    def release(self, connection: _SharedConnection) -> None:
+        self._check_fork()
+        with self._lock:
+            connection.references -= 1
+            if connection.references > 0:
+                return
+            if self._connections.get(connection.key) is connection:
+                del self._connections[connection.key]
+        connection.client.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._connections)
+
+
+class _SharedClient(TypeDBClient):
+
+    def __init__(self, registry: _ClientRegistry, connection: _SharedConnection):
+        self._registry = registry
+        self._connection: Optional[_SharedConnection] = connection
+        self._lock = Lock()
+
+    @property
+    def _client(self) -> _Client:
+        if (connection := self._connection) is None:
+            raise TypeDBClientExceptionExt.of(CLIENT_CLOSED)
+        return connection.client
+
+    def is_open(self) -> bool:
+        return self._connection is not None and self._connection.client.is_open()
+
+    @property
+    def databases(self) -> _DatabaseManager:
+        return self._client.databases
+
+    def session(self, database: str, session_type: SessionType, options: Optional[TypeDBOptions] = None
+                ) -> _Session:
+        return self._client.session(database, session_type, options)
+
+    @property
+    def session_pool(self) -> SessionPool:
+        return self._client.session_pool
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        return self._client.result_cache
+
+    @property
+    def users(self) -> UserManager:
+        return self._client.users
+
+    def user(self) -> User:
+        return self._client.user()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_tb is not None:
+            return False
+
+    def close(self) -> None:
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            self._registry.release(connection)
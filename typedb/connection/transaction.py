@@ -21,7 +21,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from typedb.native_client_wrapper import error_code, error_message, transaction_new, transaction_commit, \
     transaction_rollback, transaction_is_open, transaction_on_close, transaction_force_close, \
@@ -32,6 +32,7 @@ from typedb.api.connection.transaction import TypeDBTransaction
 from typedb.common.exception import TypeDBClientExceptionExt, TRANSACTION_CLOSED, TypeDBException
 from typedb.common.native_wrapper import NativeWrapper
 from typedb.concept.concept_manager import _ConceptManager
+from typedb.concept.identity_map import _IdentityMap
 from typedb.logic.logic_manager import _LogicManager
 from typedb.query.query_manager import _QueryManager
 
@@ -43,14 +44,23 @@ if TYPE_CHECKING:
 
 class _Transaction(TypeDBTransaction, NativeWrapper[NativeTransaction]):
 
-    def __init__(self, session: _Session, transaction_type: TransactionType, options: TypeDBOptions = None):
+    def __init__(self, session: _Session, transaction_type: TransactionType, options: TypeDBOptions = None, *,
+                 identity_map: bool = False):
         if not options:
             options = TypeDBOptions()
         self._transaction_type = transaction_type
         self._options = options
+        self._identity_map = _IdentityMap() if identity_map else None
+        self._result_cache = session._result_cache
+        self._database_name = session._database_name
+        # Taken before the transaction opens, so that no commit can come between its snapshot and the cache's view
+        if self._result_cache is not None and transaction_type.is_read() and not identity_map and not options.explain:
+            cached_reads = self._result_cache._reads(self._database_name, options)
+        else:
+            cached_reads = None
         super().__init__(transaction_new(session.native_object, transaction_type.value, options.native_object))
-        self._concept_manager = _ConceptManager(self._native_object)
-        self._query_manager = _QueryManager(self._native_object)
+        self._concept_manager = _ConceptManager(self._native_object, self._identity_map)
+        self._query_manager = _QueryManager(self._native_object, self._identity_map, cached_reads)
         self._logic_manager = _LogicManager(self._native_object)
 
     @property
@@ -65,6 +75,21 @@ class _Transaction(TypeDBTransaction, NativeWrapper[NativeTransaction]):
     def options(self) -> TypeDBOptions:
         return self._options
 
+    @property
+    def native_write_object(self) -> NativeTransaction:
+        """
+        The native transaction, as used by concept methods that write data.
+        """
+        return self.native_object
+
+    @property
+    def identity_map(self) -> Optional[_IdentityMap]:
+        return self._identity_map
+
+    def _clear_identity_map(self) -> None:
+        if self._identity_map is not None:
+            self._identity_map.clear()
+
     @property
     def concepts(self) -> _ConceptManager:
         return self._concept_manager
@@ -96,12 +121,19 @@ class _Transaction(TypeDBTransaction, NativeWrapper[NativeTransaction]):
 
     def commit(self):
         self.native_object.thisown = 0
-        transaction_commit(self._native_object)
+        self._clear_identity_map()
+        try:
+            transaction_commit(self._native_object)
+        finally:
+            if self._result_cache is not None and self._transaction_type.is_write():
+                self._result_cache.invalidate(self._database_name)
 
     def rollback(self):
         transaction_rollback(self.native_object)
+        self._clear_identity_map()
 
     def close(self):
+        self._clear_identity_map()
         if self._native_object.thisown:
             transaction_force_close(self._native_object)
 
@@ -0,0 +1,238 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition, Thread
+from time import monotonic
+from typing import Iterator, Optional, TYPE_CHECKING
+
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.connection.transaction import TransactionType
+from typedb.api.connection.transaction_pool import ReadTransactionPool, TransactionPoolMetrics
+from typedb.common.exception import TypeDBClientExceptionExt, POSITIVE_VALUE_REQUIRED, SESSION_CLOSED, \
+    TRANSACTION_POOL_EXHAUSTED
+from typedb.common.fork import disown_inherited, fork_generation, reopen_lock
+from typedb.connection.transaction import _Transaction
+
+if TYPE_CHECKING:
+    from typedb.connection.session import _Session
+
+# The server's default transaction timeout, used when the transaction options do not set one
+_DEFAULT_TRANSACTION_TIMEOUT_MILLIS = 300_000
+# Transactions are replaced at this fraction of their timeout, so that none expires while it is lent out
+_RECYCLE_AT_TIMEOUT_FRACTION = 0.8
+_RETRY_INTERVAL_SECONDS = 1.0
+
+
+def _close_all(transactions: list[_Transaction]) -> None:
+    for transaction in transactions:
+        transaction.close()
+
+
+class _ReadTransactionPool(ReadTransactionPool):
+
+    def __init__(self, session: _Session, size: int, options: Optional[TypeDBOptions] = None):
+        if size < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, size)
+        if not options:
+            options = TypeDBOptions()
+        self._session = session
+        self._size = size
+        self._options = options
+        timeout_millis = options.transaction_timeout_millis or _DEFAULT_TRANSACTION_TIMEOUT_MILLIS
+        self._lifetime_seconds = timeout_millis / 1000 * _RECYCLE_AT_TIMEOUT_FRACTION
+        self._idle: deque[tuple[_Transaction, float]] = deque()
+        self._count = 0
+        self._closed = False
+        self._changed = Condition()
+        self._hits = 0
+        self._misses = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._recycled = 0
+        self._fork_generation = fork_generation()
+        self._start_refresher()
+
+    def _start_refresher(self) -> None:
+        self._refresher = Thread(target=self._refresh, name="typedb-read-transactions", daemon=True)
+        self._refresher.start()
+
+    def _check_fork(self) -> None:
+        if self._fork_generation != fork_generation():
+            with reopen_lock():
+                if self._fork_generation != fork_generation():
+                    self._disown_after_fork()
+                    if not self._closed:
+                        self._start_refresher()
+
+    def _disown_after_fork(self) -> None:
+        # The refresher thread does not survive the fork, and the lock may have been held by a thread that did not
+        # either, so both are replaced along with the transactions inherited from the parent process
+        self._changed = Condition()
+        for transaction, _ in self._idle:
+            disown_inherited(transaction._native_object)
+        self._idle.clear()
+        self._count = 0
+        self._fork_generation = fork_generation()
+
+    def _is_fresh(self, opened_at: float, now: float) -> bool:
+        return now - opened_at < self._lifetime_seconds
+
+    def _refresh(self) -> None:
+        while True:
+            with self._changed:
+                while not self._closed and not self._needs_refresh(monotonic()):
+                    self._changed.wait(self._seconds_until_stale(monotonic()))
+                if self._closed:
+                    return
+                stale = self._take_stale(monotonic())
+                missing = self._size - self._count
+                self._count += missing
+            _close_all(stale)
+            opened = 0
+            try:
+                for _ in range(missing):
+                    transaction = _Transaction(self._session, TransactionType.READ, self._options)
+                    opened += 1
+                    self._add_idle(transaction, monotonic())
+            except Exception:
+                with self._changed:
+                    self._count -= missing - opened
+                if not self._session.is_open():
+                    self.close()
+                    return
+                with self._changed:
+                    self._changed.wait(_RETRY_INTERVAL_SECONDS)
+
+    def _needs_refresh(self, now: float) -> bool:
+        return self._count < self._size \
+            or any(not self._is_fresh(opened_at, now) for _, opened_at in self._idle)
+
+    def _seconds_until_stale(self, now: float) -> Optional[float]:
+        if not self._idle:
+            return None
+        return max(0.0, min(opened_at for _, opened_at in self._idle) + self._lifetime_seconds - now)
+
+    def _take_stale(self, now: float) -> list[_Transaction]:
+        stale = [transaction for transaction, opened_at in self._idle if not self._is_fresh(opened_at, now)]
+        if stale:
+            self._idle = deque(entry for entry in self._idle if self._is_fresh(entry[1], now))
+            self._count -= len(stale)
+            self._recycled += len(stale)
+        return stale
+
+    def _add_idle(self, transaction: _Transaction, opened_at: float) -> None:
+        with self._changed:
+            if not self._closed:
+                self._idle.append((transaction, opened_at))
+                self._changed.notify_all()
+                return
+            self._count -= 1
+        transaction.close()
+
+    def _acquire(self, timeout: Optional[float]) -> tuple[_Transaction, float]:
+        start = monotonic()
+        deadline = None if timeout is None else start + timeout
+        discarded = []
+        try:
+            with self._changed:
+                waited = False
+                while True:
+                    if self._closed:
+                        raise TypeDBClientExceptionExt.of(SESSION_CLOSED)
+                    while self._idle:
+                        transaction, opened_at = self._idle.pop()
+                        now = monotonic()
+                        if transaction.is_open() and self._is_fresh(opened_at, now):
+                            self._record_wait(waited, now - start)
+                            return transaction, opened_at
+                        discarded.append(transaction)
+                        self._count -= 1
+                        self._recycled += 1
+                        self._changed.notify_all()
+                    remaining = None if deadline is None else deadline - monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self._record_wait(True, monotonic() - start)
+                        raise TypeDBClientExceptionExt.of(TRANSACTION_POOL_EXHAUSTED)
+                    waited = True
+                    self._changed.wait(remaining)
+        finally:
+            _close_all(discarded)
+
+    def _record_wait(self, waited: bool, wait_seconds: float) -> None:
+        if not waited:
+            self._hits += 1
+            return
+        self._misses += 1
+        self._total_wait_seconds += wait_seconds
+        self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+
+    def _release(self, transaction: _Transaction, opened_at: float) -> None:
+        if transaction.is_open() and self._is_fresh(opened_at, monotonic()):
+            self._add_idle(transaction, opened_at)
+            return
+        with self._changed:
+            self._count -= 1
+            if not self._closed:
+                self._recycled += 1
+            self._changed.notify_all()
+        transaction.close()
+
+    @contextmanager
+    def transaction(self, timeout: Optional[float] = None) -> Iterator[_Transaction]:
+        self._check_fork()
+        transaction, opened_at = self._acquire(timeout)
+        try:
+            yield transaction
+        finally:
+            self._release(transaction, opened_at)
+
+    def metrics(self) -> TransactionPoolMetrics:
+        self._check_fork()
+        with self._changed:
+            return TransactionPoolMetrics(self._hits, self._misses, self._total_wait_seconds, self._max_wait_seconds,
+                                          self._recycled)
+
+    def close(self) -> None:
+        if self._fork_generation != fork_generation():
+            with reopen_lock():
+                if self._fork_generation != fork_generation():
+                    self._disown_after_fork()
+        with self._changed:
+            if self._closed:
+                return
+            self._closed = True
+            idle = [transaction for transaction, _ in self._idle]
+            self._idle.clear()
+            self._count -= len(idle)
+            self._changed.notify_all()
+        _close_all(idle)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_tb is not None:
+            return False
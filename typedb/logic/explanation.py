@@ -41,6 +41,8 @@ if TYPE_CHECKING:
 
 class _Explanation(Explanation, NativeWrapper[NativeExplanation]):
 
+    __slots__ = ()
+
     def __init__(self, explanation: NativeExplanation):
         if not explanation:
             raise TypeDBClientExceptionExt(NULL_NATIVE_OBJECT)
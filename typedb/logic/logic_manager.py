@@ -59,7 +59,7 @@ class _LogicManager(LogicManager, NativeWrapper[NativeTransaction]):
         return None
 
     def get_rules(self):
-        return map(_Rule, IteratorWrapper(logic_manager_get_rules(self._native_transaction), rule_iterator_next))
+        return IteratorWrapper(logic_manager_get_rules(self._native_transaction), rule_iterator_next, _Rule)
 
     def put_rule(self, label: str, when: str, then: str):
         return _Rule(logic_manager_put_rule(self._native_transaction, _not_blank_label(label), when, then))
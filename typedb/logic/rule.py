@@ -36,6 +36,8 @@ if TYPE_CHECKING:
 
 class _Rule(Rule, NativeWrapper[NativeRule]):
 
+    __slots__ = ("_rule", "_when", "_then")
+
     def __init__(self, rule: NativeRule):
         if not rule:
             raise TypeDBClientExceptionExt(NULL_NATIVE_OBJECT)
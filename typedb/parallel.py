@@ -0,0 +1,139 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from multiprocessing import get_all_start_methods, get_context
+from typing import Callable, Iterator, Optional, TypeVar, TYPE_CHECKING
+
+from typedb.common.exception import TypeDBClientExceptionExt, POSITIVE_VALUE_REQUIRED
+
+if TYPE_CHECKING:
+    from typedb.api.answer.snapshot import ConceptMapSnapshot
+    from typedb.api.connection.options import TypeDBOptions
+    from typedb.api.connection.transaction import TypeDBTransaction
+
+R = TypeVar("R")
+
+
+def _apply(function: Callable[[ConceptMapSnapshot], R], chunk: list[ConceptMapSnapshot]) -> list[R]:
+    return [function(answer) for answer in chunk]
+
+
+def _worker_context():
+    return get_context("forkserver" if "forkserver" in get_all_start_methods() else "spawn")
+
+
+def map_answers(transaction: TypeDBTransaction, query: str, function: Callable[[ConceptMapSnapshot], R], *,
+                processes: Optional[int] = None, chunk_size: int = 100, max_chunks_in_flight: Optional[int] = None,
+                ordered: bool = True, options: Optional[TypeDBOptions] = None,
+                executor: Optional[Executor] = None) -> Iterator[R]:
+    """
+    Applies ``function`` to snapshots of the answers to a match query in a pool of worker processes, yielding its
+    results in answer order or, unless ``ordered``, in the order their chunks complete. Answers are read from the
+    transaction in the calling thread as results are consumed, and sent to the workers in chunks of ``chunk_size``,
+    with at most ``max_chunks_in_flight`` chunks submitted and not yet yielded (twice the number of processes by
+    default).
+
+    A pool of ``processes`` workers is started for the call and shut down when the iteration ends, unless an
+    ``executor`` is given. The workers are started by a fork server, or spawned where there is none, as forking a
+    process that runs the native client's threads can deadlock its children. They import ``function`` by name, so it
+    must be defined at the top level of an importable module, not in ``__main__`` of an interactive session or
+    inside another function.
+
+    **Examples**
+
+    - ``for score in map_answers(tx, "match $p isa person, has name $n;", score_name, processes=8): ...``
+    """
+    if chunk_size < 1:
+        raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, chunk_size)
+    if processes is not None and processes < 1:
+        raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, processes)
+    if max_chunks_in_flight is None:
+        max_chunks_in_flight = 2 * (processes or os.cpu_count() or 1)
+    elif max_chunks_in_flight < 1:
+        raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, max_chunks_in_flight)
+    return _map_answers(transaction, query, function, processes, chunk_size, max_chunks_in_flight, ordered, options,
+                        executor)
+
+
+def _map_answers(transaction: TypeDBTransaction, query: str, function: Callable[[ConceptMapSnapshot], R],
+                 processes: Optional[int], chunk_size: int, max_chunks_in_flight: int, ordered: bool,
+                 options: Optional[TypeDBOptions], executor: Optional[Executor]) -> Iterator[R]:
+    snapshots = (answer.snapshot() for answer in transaction.query.match(query, options))
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(processes, mp_context=_worker_context())
+    pending = _OrderedChunks() if ordered else _CompletedChunks()
+    try:
+        while chunk := list(islice(snapshots, chunk_size)):
+            if len(pending) >= max_chunks_in_flight:
+                yield from pending.next_results()
+            pending.add(executor.submit(_apply, function, chunk))
+        while pending:
+            yield from pending.next_results()
+    finally:
+        pending.cancel()
+        if owns_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _OrderedChunks:
+
+    def __init__(self):
+        self._futures: deque[Future] = deque()
+
+    def add(self, future: Future) -> None:
+        self._futures.append(future)
+
+    def next_results(self) -> list:
+        return self._futures.popleft().result()
+
+    def cancel(self) -> None:
+        for future in self._futures:
+            future.cancel()
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+
+class _CompletedChunks:
+
+    def __init__(self):
+        self._futures: set[Future] = set()
+
+    def add(self, future: Future) -> None:
+        self._futures.add(future)
+
+    def next_results(self) -> list:
+        done, self._futures = wait(self._futures, return_when=FIRST_COMPLETED)
+        return [result for future in done for result in future.result()]
+
+    def cancel(self) -> None:
+        for future in self._futures:
+            future.cancel()
+
+    def __len__(self) -> int:
+        return len(self._futures)
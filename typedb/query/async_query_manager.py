@@ -0,0 +1,109 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Optional, Union
+
+from typedb.common.async_iterator_wrapper import AsyncIteratorWrapper
+from typedb.common.async_wrapper import AsyncWrapper
+
+if TYPE_CHECKING:
+    from typedb.api.answer.concept_column import ConceptColumn
+    from typedb.api.answer.concept_map import ConceptMap
+    from typedb.api.answer.concept_map_group import ConceptMapGroup
+    from typedb.api.answer.numeric import Numeric
+    from typedb.api.answer.numeric_group import NumericGroup
+    from typedb.api.answer.snapshot import ConceptMapGroupSnapshot, ConceptMapSnapshot, NumericGroupSnapshot
+    from typedb.api.connection.options import TypeDBOptions
+    from typedb.api.logic.explanation import Explanation
+    from typedb.query.template import QueryTemplate
+    from typedb.api.query.query_manager import QueryManager
+
+DEFAULT_BATCH_SIZE = 50
+
+
+class AsyncQueryManager(AsyncWrapper["QueryManager"]):
+
+    def _stream(self, query_method, *args, batch_size: int, **kwargs) -> AsyncIteratorWrapper:
+        return AsyncIteratorWrapper(partial(query_method, *args, **kwargs), self._executor, batch_size)
+
+    def match(self, query: str, options: Optional[TypeDBOptions] = None, *, batch_size: int = DEFAULT_BATCH_SIZE,
+              detached: bool = False, cached: bool = False
+              ) -> AsyncIteratorWrapper[Union[ConceptMap, ConceptMapSnapshot]]:
+        return self._stream(self._blocking.match, query, options, batch_size=batch_size, detached=detached,
+                            cached=cached)
+
+    def match_values(self, query: str, options: Optional[TypeDBOptions] = None, *, batch_size: int = DEFAULT_BATCH_SIZE
+                     ) -> AsyncIteratorWrapper[dict[str, Union[bool, int, float, str, datetime]]]:
+        return self._stream(self._blocking.match_values, query, options, batch_size=batch_size)
+
+    async def match_columns(self, query: str, variables: Optional[Iterable[str]] = None,
+                            options: Optional[TypeDBOptions] = None) -> dict[str, ConceptColumn]:
+        return await self._run(self._blocking.match_columns, query, variables, options)
+
+    async def match_aggregate(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+                              cached: bool = False) -> Numeric:
+        return await self._run(partial(self._blocking.match_aggregate, query, options, detached=detached,
+                                       cached=cached))
+
+    def match_group(self, query: str, options: Optional[TypeDBOptions] = None, *,
+                    batch_size: int = DEFAULT_BATCH_SIZE, detached: bool = False, cached: bool = False
+                    ) -> AsyncIteratorWrapper[Union[ConceptMapGroup, ConceptMapGroupSnapshot]]:
+        return self._stream(self._blocking.match_group, query, options, batch_size=batch_size, detached=detached,
+                            cached=cached)
+
+    def match_group_aggregate(self, query: str, options: Optional[TypeDBOptions] = None, *,
+                              batch_size: int = DEFAULT_BATCH_SIZE, detached: bool = False, cached: bool = False
+                              ) -> AsyncIteratorWrapper[Union[NumericGroup, NumericGroupSnapshot]]:
+        return self._stream(self._blocking.match_group_aggregate, query, options, batch_size=batch_size,
+                            detached=detached, cached=cached)
+
+    async def insert(self, query: str, options: Optional[TypeDBOptions] = None, *,
+                     batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIteratorWrapper[ConceptMap]:
+        # Sent before returning, as a write must reach the server by commit even if its answers are never read
+        return await self._stream(self._blocking.insert, query, options, batch_size=batch_size).open()
+
+    async def insert_many(self, template: Union[str, QueryTemplate], rows: Iterable[Mapping[str, Any]],
+                          batch_size: int = 100, options: Optional[TypeDBOptions] = None, *, wrap_answers: bool = False
+                          ) -> Union[int, list[ConceptMap]]:
+        return await self._run(partial(self._blocking.insert_many, template, rows, batch_size, options,
+                                       wrap_answers=wrap_answers))
+
+    async def delete(self, query: str, options: Optional[TypeDBOptions] = None) -> None:
+        return await self._run(self._blocking.delete, query, options)
+
+    async def define(self, query: str, options: TypeDBOptions = None) -> None:
+        return await self._run(self._blocking.define, query, options)
+
+    async def undefine(self, query: str, options: TypeDBOptions = None) -> None:
+        return await self._run(self._blocking.undefine, query, options)
+
+    async def update(self, query: str, options: Optional[TypeDBOptions] = None, *,
+                     batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIteratorWrapper[ConceptMap]:
+        # Sent before returning, as a write must reach the server by commit even if its answers are never read
+        return await self._stream(self._blocking.update, query, options, batch_size=batch_size).open()
+
+    def explain(self, explainable: ConceptMap.Explainable, options: Optional[TypeDBOptions] = None, *,
+                batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIteratorWrapper[Explanation]:
+        return self._stream(self._blocking.explain, explainable, options, batch_size=batch_size)
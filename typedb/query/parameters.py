@@ -0,0 +1,77 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+import math
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from functools import singledispatch
+
+from typedb.common.exception import TypeDBClientExceptionExt, INVALID_QUERY_PARAMETER
+
+
+def _invalid(value) -> TypeDBClientExceptionExt:
+    return TypeDBClientExceptionExt.of(INVALID_QUERY_PARAMETER, (value, type(value).__name__))
+
+
+@singledispatch
+def _typeql_literal(value) -> str:
+    raise _invalid(value)
+
+
+@_typeql_literal.register
+def _(value: bool) -> str:
+    return "true" if value else "false"
+
+
+@_typeql_literal.register
+def _(value: int) -> str:
+    return str(value)
+
+
+@_typeql_literal.register
+def _(value: float) -> str:
+    if not math.isfinite(value):
+        raise _invalid(value)
+    literal = repr(value)
+    if "e" in literal:
+        # TypeQL doubles have no exponent notation
+        literal = format(Decimal(literal), "f")
+    return literal if "." in literal else literal + ".0"
+
+
+@_typeql_literal.register
+def _(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@_typeql_literal.register
+def _(value: datetime) -> str:
+    # Datetimes are stored without a time zone: aware values are converted to UTC, like naive ones are read as UTC
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="milliseconds")
+
+
+@_typeql_literal.register
+def _(value: date) -> str:
+    return value.isoformat()
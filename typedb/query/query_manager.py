@@ -21,7 +21,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator, Optional
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Optional, Union
 
 from typedb.native_client_wrapper import query_match, concept_map_iterator_next, query_match_group, \
     concept_map_group_iterator_next, query_insert, query_update, query_explain, explanation_iterator_next, \
@@ -30,27 +32,51 @@ from typedb.native_client_wrapper import query_match, concept_map_iterator_next,
 
 from typedb.api.connection.options import TypeDBOptions
 from typedb.api.query.query_manager import QueryManager
-from typedb.common.exception import TypeDBClientExceptionExt, MISSING_QUERY, TRANSACTION_CLOSED
+from typedb.common.exception import TypeDBClientExceptionExt, MISSING_QUERY, POSITIVE_VALUE_REQUIRED, \
+    TRANSACTION_CLOSED
 from typedb.common.iterator_wrapper import IteratorWrapper
 from typedb.common.native_wrapper import NativeWrapper
+from typedb.concept.answer.concept_column import _collect_columns
 from typedb.concept.answer.concept_map import _ConceptMap
 from typedb.concept.answer.concept_map_group import _ConceptMapGroup
 from typedb.concept.answer.numeric import _Numeric
 from typedb.concept.answer.numeric_group import _NumericGroup
 from typedb.logic.explanation import _Explanation
+from typedb.query.template import QueryTemplate, compile_template
 
 if TYPE_CHECKING:
+    from typedb.concept.identity_map import _IdentityMap
+    from typedb.connection.result_cache import _CachedReads
+    from typedb.api.answer.concept_column import ConceptColumn
     from typedb.api.answer.concept_map import ConceptMap
     from typedb.api.answer.concept_map_group import ConceptMapGroup
     from typedb.api.answer.numeric import Numeric
     from typedb.api.answer.numeric_group import NumericGroup
+    from typedb.api.answer.snapshot import ConceptMapGroupSnapshot, ConceptMapSnapshot, NumericGroupSnapshot
     from typedb.api.logic.explanation import Explanation
 
 
+def _drain(native_streams: list, answers: Optional[list[ConceptMap]], wrap: Callable[..., ConceptMap]) -> int:
+    count = 0
+    for native_stream in native_streams:
+        while native_answer := concept_map_iterator_next(native_stream):
+            count += 1
+            if answers is not None:
+                answers.append(wrap(native_answer))
+    return count
+
+
+def _snapshots(answers: Iterator[Union[ConceptMap, ConceptMapGroup, NumericGroup]]) -> tuple:
+    return tuple(answer.snapshot() for answer in answers)
+
+
 class _QueryManager(QueryManager, NativeWrapper[NativeTransaction]):
 
-    def __init__(self, transaction: NativeTransaction):
+    def __init__(self, transaction: NativeTransaction, identity_map: Optional[_IdentityMap] = None,
+                 cached_reads: Optional[_CachedReads] = None):
         super().__init__(transaction)
+        self._identity_map = identity_map
+        self._cached_reads = cached_reads
 
     @property
     def _native_object_not_owned_exception(self) -> TypeDBClientExceptionExt:
@@ -60,46 +86,123 @@ class _QueryManager(QueryManager, NativeWrapper[NativeTransaction]):
     def _native_transaction(self) -> NativeTransaction:
         return self.native_object
 
-    def match(self, query: str, options: Optional[TypeDBOptions] = None) -> Iterator[ConceptMap]:
+    def _cache_key(self, kind: str, query: str, options: Optional[TypeDBOptions]) -> Optional[tuple]:
+        return self._cached_reads.key(kind, query, options) if self._cached_reads is not None else None
+
+    def match(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+              cached: bool = False) -> Iterator[Union[ConceptMap, ConceptMapSnapshot]]:
+        if not query:
+            raise TypeDBClientExceptionExt(MISSING_QUERY)
+        if cached and (key := self._cache_key("match", query, options)):
+            return self._cached_reads.stream(key, lambda: self._match(query, options))
+        if detached or cached:
+            return IteratorWrapper.of(_snapshots(self._match(query, options)))
+        return self._match(query, options)
+
+    def _match(self, query: str, options: Optional[TypeDBOptions]) -> Iterator[ConceptMap]:
+        if not options:
+            options = TypeDBOptions()
+        return IteratorWrapper(query_match(self._native_transaction, query, options.native_object),
+                               concept_map_iterator_next, partial(_ConceptMap, identity_map=self._identity_map))
+
+    def match_values(self, query: str, options: Optional[TypeDBOptions] = None
+                     ) -> Iterator[dict[str, Union[bool, int, float, str, datetime]]]:
         if not query:
             raise TypeDBClientExceptionExt(MISSING_QUERY)
         if not options:
             options = TypeDBOptions()
-        return map(_ConceptMap, IteratorWrapper(query_match(self._native_transaction, query, options.native_object),
-                                                concept_map_iterator_next))
+        return IteratorWrapper(query_match(self._native_transaction, query, options.native_object),
+                               concept_map_iterator_next, _ConceptMap.Values())
 
-    def match_aggregate(self, query: str, options: Optional[TypeDBOptions] = None) -> Numeric:
+    def match_columns(self, query: str, variables: Optional[Iterable[str]] = None,
+                      options: Optional[TypeDBOptions] = None) -> dict[str, ConceptColumn]:
         if not query:
             raise TypeDBClientExceptionExt(MISSING_QUERY)
+        if not options:
+            options = TypeDBOptions()
+        return _collect_columns(IteratorWrapper(query_match(self._native_transaction, query, options.native_object),
+                                                concept_map_iterator_next),
+                                variables)
+
+    def match_aggregate(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+                        cached: bool = False) -> Numeric:
+        if not query:
+            raise TypeDBClientExceptionExt(MISSING_QUERY)
+        if cached and (key := self._cache_key("match_aggregate", query, options)):
+            return self._cached_reads.get_or_load(key, lambda: self._match_aggregate(query, options).snapshot())
+        if detached or cached:
+            return self._match_aggregate(query, options).snapshot()
+        return self._match_aggregate(query, options)
+
+    def _match_aggregate(self, query: str, options: Optional[TypeDBOptions]) -> Numeric:
         if not options:
             options = TypeDBOptions()
         return _Numeric(query_match_aggregate(self._native_transaction, query, options.native_object))
 
-    def match_group(self, query: str, options: Optional[TypeDBOptions] = None) -> Iterator[ConceptMapGroup]:
+    def match_group(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+                    cached: bool = False) -> Iterator[Union[ConceptMapGroup, ConceptMapGroupSnapshot]]:
         if not query:
             raise TypeDBClientExceptionExt(MISSING_QUERY)
+        if cached and (key := self._cache_key("match_group", query, options)):
+            return self._cached_reads.stream(key, lambda: self._match_group(query, options))
+        if detached or cached:
+            return IteratorWrapper.of(_snapshots(self._match_group(query, options)))
+        return self._match_group(query, options)
+
+    def _match_group(self, query: str, options: Optional[TypeDBOptions]) -> Iterator[ConceptMapGroup]:
         if not options:
             options = TypeDBOptions()
-        return map(_ConceptMapGroup, IteratorWrapper(query_match_group(self._native_transaction, query,
-                                                                       options.native_object),
-                                                     concept_map_group_iterator_next))
+        return IteratorWrapper(query_match_group(self._native_transaction, query,
+                                                 options.native_object),
+                               concept_map_group_iterator_next,
+                               partial(_ConceptMapGroup, identity_map=self._identity_map))
 
-    def match_group_aggregate(self, query: str, options: Optional[TypeDBOptions] = None) -> Iterator[NumericGroup]:
+    def match_group_aggregate(self, query: str, options: Optional[TypeDBOptions] = None, *, detached: bool = False,
+                              cached: bool = False) -> Iterator[Union[NumericGroup, NumericGroupSnapshot]]:
         if not query:
             raise TypeDBClientExceptionExt(MISSING_QUERY)
+        if cached and (key := self._cache_key("match_group_aggregate", query, options)):
+            return self._cached_reads.stream(key, lambda: self._match_group_aggregate(query, options))
+        if detached or cached:
+            return IteratorWrapper.of(_snapshots(self._match_group_aggregate(query, options)))
+        return self._match_group_aggregate(query, options)
+
+    def _match_group_aggregate(self, query: str, options: Optional[TypeDBOptions]) -> Iterator[NumericGroup]:
         if not options:
             options = TypeDBOptions()
-        return map(_NumericGroup, IteratorWrapper(query_match_group_aggregate(self._native_transaction, query,
-                                                                              options.native_object),
-                                                  numeric_group_iterator_next))
+        return IteratorWrapper(query_match_group_aggregate(self._native_transaction, query,
+                                                           options.native_object),
+                               numeric_group_iterator_next,
+                               partial(_NumericGroup, identity_map=self._identity_map))
 
     def insert(self, query: str, options: Optional[TypeDBOptions] = None) -> Iterator[ConceptMap]:
         if not query:
             raise TypeDBClientExceptionExt(MISSING_QUERY)
         if not options:
             options = TypeDBOptions()
-        return map(_ConceptMap, IteratorWrapper(query_insert(self._native_transaction, query, options.native_object),
-                                                concept_map_iterator_next))
+        return IteratorWrapper(query_insert(self._native_transaction, query, options.native_object),
+                               concept_map_iterator_next, partial(_ConceptMap, identity_map=self._identity_map))
+
+    def insert_many(self, template: Union[str, QueryTemplate], rows: Iterable[Mapping[str, Any]],
+                    batch_size: int = 100, options: Optional[TypeDBOptions] = None, *, wrap_answers: bool = False
+                    ) -> Union[int, list[ConceptMap]]:
+        render = compile_template(template)._render
+        if batch_size < 1:
+            raise TypeDBClientExceptionExt.of(POSITIVE_VALUE_REQUIRED, batch_size)
+        if not options:
+            options = TypeDBOptions()
+        native_transaction, native_options = self._native_transaction, options.native_object
+        answers = [] if wrap_answers else None
+        wrap = partial(_ConceptMap, identity_map=self._identity_map)
+        count = 0
+        native_streams = []
+        for row in rows:
+            native_streams.append(query_insert(native_transaction, render(row), native_options))
+            if len(native_streams) == batch_size:
+                count += _drain(native_streams, answers, wrap)
+                native_streams.clear()
+        count += _drain(native_streams, answers, wrap)
+        return answers if wrap_answers else count
 
     def delete(self, query: str, options: Optional[TypeDBOptions] = None) -> None:
         if not query:
@@ -113,8 +216,8 @@ class _QueryManager(QueryManager, NativeWrapper[NativeTransaction]):
             raise TypeDBClientExceptionExt(MISSING_QUERY)
         if not options:
             options = TypeDBOptions()
-        return map(_ConceptMap, IteratorWrapper(query_update(self._native_transaction, query, options.native_object),
-                                                concept_map_iterator_next))
+        return IteratorWrapper(query_update(self._native_transaction, query, options.native_object),
+                               concept_map_iterator_next, partial(_ConceptMap, identity_map=self._identity_map))
 
     def define(self, query: str, options: TypeDBOptions = None) -> None:
         if not query:
@@ -134,6 +237,6 @@ class _QueryManager(QueryManager, NativeWrapper[NativeTransaction]):
                 ) -> Iterator[Explanation]:
         if not options:
             options = TypeDBOptions()
-        return map(_Explanation, IteratorWrapper(query_explain(self._native_transaction, explainable.id(),
-                                                               options.native_object),
-                                                 explanation_iterator_next))
+        return IteratorWrapper(query_explain(self._native_transaction, explainable.id(),
+                                             options.native_object),
+                               explanation_iterator_next, _Explanation)
@@ -0,0 +1,113 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Union
+
+from typedb.common.exception import TypeDBClientExceptionExt, MISSING_QUERY, MISSING_QUERY_PARAMETER
+from typedb.query.parameters import _typeql_literal
+
+# String literals and comments are matched so that braces inside them are never taken for parameters
+_TOKENS = re.compile(r"""
+    "(?:[^"\\]|\\.)*"?
+    | '(?:[^'\\]|\\.)*'?
+    | \#[^\n]*
+    | \{(?P<parameter>[A-Za-z_][A-Za-z0-9_]*)}
+""", re.VERBOSE | re.DOTALL)
+
+
+class QueryTemplate:
+    """
+    A TypeQL query with named ``{parameter}`` placeholders, parsed once into the text between them. Rendering binds
+    every parameter to the escaped TypeQL literal of a bool, int, float, str, date or datetime value.
+
+    **Examples**
+
+    - ``QueryTemplate('match $p isa person, has name {name};').render(name='Alice "A" Smith')``
+    """
+
+    __slots__ = ("_template", "_texts", "_parameters")
+
+    def __init__(self, template: str):
+        if not template:
+            raise TypeDBClientExceptionExt(MISSING_QUERY)
+        texts, parameters = [], []
+        start = 0
+        for token in _TOKENS.finditer(template):
+            if (parameter := token.group("parameter")) is not None:
+                texts.append(template[start:token.start()])
+                parameters.append(parameter)
+                start = token.end()
+        texts.append(template[start:])
+        self._template = template
+        self._texts = tuple(texts)
+        self._parameters = tuple(parameters)
+
+    @property
+    def template(self) -> str:
+        return self._template
+
+    @property
+    def parameters(self) -> tuple[str, ...]:
+        return self._parameters
+
+    def render(self, parameters: Optional[Mapping[str, Any]] = None, **kwargs) -> str:
+        if kwargs:
+            parameters = {**parameters, **kwargs} if parameters else kwargs
+        return self._render(parameters or {})
+
+    def _render(self, parameters: Mapping[str, Any]) -> str:
+        texts = self._texts
+        pieces = [texts[0]]
+        for index, parameter in enumerate(self._parameters, 1):
+            try:
+                value = parameters[parameter]
+            except KeyError:
+                raise TypeDBClientExceptionExt.of(MISSING_QUERY_PARAMETER, parameter) from None
+            pieces.append(_typeql_literal(value))
+            pieces.append(texts[index])
+        return "".join(pieces)
+
+    def __eq__(self, other):
+        return isinstance(other, QueryTemplate) and self._template == other._template
+
+    def __hash__(self):
+        return hash(self._template)
+
+    def __repr__(self):
+        return "QueryTemplate(%r)" % self._template
+
+
+@lru_cache(maxsize=4096)
+def _compile_cached(template: str) -> QueryTemplate:
+    return QueryTemplate(template)
+
+
+def compile_template(template: Union[str, QueryTemplate]) -> QueryTemplate:
+    """
+    Returns the parsed form of ``template``, which is cached for the most recently used templates.
+    """
+    if isinstance(template, QueryTemplate):
+        return template
+    return _compile_cached(template)
@@ -0,0 +1,62 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from __future__ import annotations
+
+from typing import Optional
+
+from typedb.api.user.user import User, UserManager
+from typedb.common.async_wrapper import AsyncWrapper
+
+
+class AsyncUser(AsyncWrapper[User]):
+
+    def username(self) -> str:
+        return self._blocking.username()
+
+    def password_expiry_seconds(self) -> Optional[int]:
+        return self._blocking.password_expiry_seconds()
+
+    async def password_update(self, password_old: str, password_new: str) -> None:
+        await self._run(self._blocking.password_update, password_old, password_new)
+
+
+class AsyncUserManager(AsyncWrapper[UserManager]):
+
+    async def contains(self, username: str) -> bool:
+        return await self._run(self._blocking.contains, username)
+
+    async def create(self, username: str, password: str) -> None:
+        await self._run(self._blocking.create, username, password)
+
+    async def delete(self, username: str) -> None:
+        await self._run(self._blocking.delete, username)
+
+    async def get(self, username: str) -> Optional[AsyncUser]:
+        if user := await self._run(self._blocking.get, username):
+            return AsyncUser(user, self._executor)
+        return None
+
+    async def all(self) -> list[AsyncUser]:
+        return [AsyncUser(user, self._executor) for user in await self._run(self._blocking.all)]
+
+    async def password_set(self, username: str, password: str) -> None:
+        await self._run(self._blocking.password_set, username, password)